@@ -0,0 +1,5 @@
+"""
+LIFT UP Dataset - Benchmarks
+============================
+Çıkarım hattının performans ölçümleri
+"""
@@ -0,0 +1,135 @@
+"""
+Regex Micro-Benchmark
+=====================
+Özet/anahtar kelime kalıplarının makale başına süresini ölçer: her çağrıda
+string kalıpla `re.search` (eski yöntem) ile `patterns` kayıt defteri (yeni
+yöntem) karşılaştırılır.
+
+Kullanım:
+    python benchmarks/bench_regex.py [--articles 500] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "data_extract_automation"))
+
+import patterns
+
+
+_FLAGS = re.DOTALL | re.IGNORECASE
+
+# Kayıt defterinden önceki kalıplar (her çağrıda string olarak re.search'e verilir)
+LEGACY = {
+    "abstract_tr": (r"Özetçe\s*[—\-–]+\s*(.*?)\s*(?=Anahtar\s*Kelimeler)", _FLAGS),
+    "abstract_tr_fallback": (r"Özetçe\s*[—\-–]+\s*(.*?)\s*(?=Abstract|Keywords)", _FLAGS),
+    "abstract_en": (r"Abstract\s*[—\-–]+\s*(.*?)\s*(?=Keywords)", _FLAGS),
+    "abstract_en_fallback": (r"Abstract\s*[—\-–]+\s*(.*?)\s*(?=Keywords|I\.\s|I\s|GİRİŞ)", _FLAGS),
+    "keywords_tr": (r"Anahtar\s*Kelimeler\s*[—:\-–;]+\s*(.*?)\s*(?=Abstract)", _FLAGS),
+    "keywords_en": (r"Keywords\s*[—:\-–;]+\s*(.*?)(?=\n\s*I\.|I\.\s|GİRİŞ|INTRODUCTION|PROBLEM|\n\s*\n\s*[A-Z][a-z]+)", _FLAGS),
+    "keywords_en_simple": (r"Keywords\s*[—:\-–;]+\s*([^\n]+)", re.IGNORECASE),
+}
+
+# Çıkarıcıların makale başına çalıştırdığı kalıplar (yedek dallar dahil)
+PER_ARTICLE = ["abstract_tr", "abstract_en", "keywords_tr", "keywords_en",
+               "keywords_en_simple", "abstract_tr_fallback", "abstract_en_fallback"]
+
+WORDS_TR = ("üretim sistem analiz tasarım optimizasyon kalıp süreç verimlilik "
+            "ölçüm kalite maliyet geliştirme yöntem uygulama montaj hattı").split()
+WORDS_EN = ("production system analysis design optimization mold process efficiency "
+            "measurement quality cost development method application assembly line").split()
+
+
+def _paragraph(rng: random.Random, words, sentences: int) -> str:
+    return " ".join(
+        " ".join(rng.choice(words) for _ in range(rng.randint(6, 14))).capitalize() + "."
+        for _ in range(sentences)
+    )
+
+
+def make_windows(count: int, seed: int = 1):
+    """
+    Çok sayfalı makale pencerelerine benzeyen sentetik metinler üretir.
+
+    Args:
+        count: Makale sayısı
+        seed: Rastgelelik tohumu
+
+    Returns:
+        Pencere metinleri listesi
+    """
+    rng = random.Random(seed)
+    windows = []
+    for _ in range(count):
+        first = (
+            f"LIFT UP Bildiri Kitabı\n{_paragraph(rng, WORDS_TR, 1)}\n{_paragraph(rng, WORDS_EN, 1)}\n"
+            f"Özetçe— {_paragraph(rng, WORDS_TR, 6)}\n"
+            f"Anahtar Kelimeler— {', '.join(rng.sample(WORDS_TR, 4))}\n"
+            f"Abstract— {_paragraph(rng, WORDS_EN, 6)}\n"
+            f"Keywords— {', '.join(rng.sample(WORDS_EN, 4))}\n"
+            f"I. GİRİŞ\n{_paragraph(rng, WORDS_TR, 6)}\n"
+        )
+        body = "\n".join(_paragraph(rng, WORDS_TR, 20) for _ in range(rng.randint(2, 7)))
+        windows.append(first + body)
+    return windows
+
+
+def bench_legacy(windows) -> int:
+    found = 0
+    for text in windows:
+        for name in PER_ARTICLE:
+            pattern, flags = LEGACY[name]
+            if re.search(pattern, text, flags):
+                found += 1
+    return found
+
+
+def bench_registry(windows) -> int:
+    found = 0
+    for text in windows:
+        for name in PER_ARTICLE:
+            if patterns.search(name, text):
+                found += 1
+    return found
+
+
+def _best_of(fn, windows, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(windows)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regex kalıplarının makale başına süresi")
+    parser.add_argument("--articles", type=int, default=500, help="Sentetik makale sayısı")
+    parser.add_argument("--repeat", type=int, default=5, help="Tekrar sayısı (en iyi süre alınır)")
+    args = parser.parse_args(argv)
+
+    windows = make_windows(args.articles)
+
+    # Sonuçlar birebir aynı olmalı
+    for text in windows:
+        for name in PER_ARTICLE:
+            pattern, flags = LEGACY[name]
+            old, new = re.search(pattern, text, flags), patterns.search(name, text)
+            assert (old and (old.span(), old.groups())) == (new and (new.span(), new.groups())), name
+
+    legacy = _best_of(bench_legacy, windows, args.repeat)
+    registry = _best_of(bench_registry, windows, args.repeat)
+
+    print(f"Makale: {len(windows)} | Kalıp/makale: {len(PER_ARTICLE)}")
+    print(f"Önce  (re.search + string kalıp): {legacy / len(windows) * 1e6:8.1f} µs/makale")
+    print(f"Sonra (patterns kayıt defteri)  : {registry / len(windows) * 1e6:8.1f} µs/makale")
+    print(f"Hızlanma: {legacy / registry:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Start-Page Detection Micro-Benchmark
+====================================
+Makale başlangıç sayfası tespitinde kullanılabilecek ön eleme yöntemlerinin
+sayfa başına süresini ve kaçırdığı başlangıç sayfası sayısını ölçer.
+
+Karşılaştırılan yöntemler:
+    - full_text      : `page.get_text()` + `PageAnalyzer.is_article_start_page` (mevcut yöntem)
+    - textpage_search: TextPage oluşturulup metin çıkarılmadan `TextPage.search` ile arama
+    - clip_<oran>    : Sayfanın yalnızca üst bölgesinden metin çıkarılıp "Özetçe" aranması
+
+Ön eleme ancak tam çıkarımdan belirgin şekilde ucuzsa ve hiç başlangıç
+sayfası kaçırmıyorsa anlamlıdır (kaçırılan sayfa, eksik makale demektir).
+
+Kullanım:
+    python benchmarks/bench_start_detection.py [--pages 500] [--pdf kitap.pdf] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "data_extract_automation"))
+
+import fitz  # PyMuPDF
+
+from benchmarks.synthetic import ensure_pdf
+from data_extract import PageAnalyzer
+
+
+CLIP_FRACTIONS = (0.4, 0.6)
+
+
+def probe_full_text(page) -> bool:
+    return PageAnalyzer.is_article_start_page(page.get_text())
+
+
+def probe_textpage_search(page) -> bool:
+    textpage = page.get_textpage(flags=fitz.TEXTFLAGS_TEXT)
+    # TextPage.search büyük/küçük harf duyarsızdır; yalnızca aday belirler
+    return bool(textpage.search("Özetçe")) and bool(textpage.search("Abstract"))
+
+
+def make_clip_probe(fraction: float):
+    def probe(page) -> bool:
+        rect = page.rect
+        clip = fitz.Rect(rect.x0, rect.y0, rect.x1, rect.y0 + rect.height * fraction)
+        return "Özetçe" in page.get_text(clip=clip)
+    return probe
+
+
+def _best_of(probe, doc, repeat: int):
+    """Yöntemi tüm sayfalarda çalıştırır; (en iyi süre, aday sayfa indeksleri) döndürür"""
+    best = float("inf")
+    candidates = set()
+    for _ in range(repeat):
+        started = time.perf_counter()
+        candidates = {idx for idx in range(len(doc)) if probe(doc[idx])}
+        best = min(best, time.perf_counter() - started)
+    return best, candidates
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Başlangıç sayfası ön eleme yöntemlerinin maliyeti")
+    parser.add_argument("--pdf", help="Ölçülecek PDF (verilmezse sentetik PDF üretilir)")
+    parser.add_argument("--pages", type=int, default=500, help="Sentetik PDF sayfa sayısı")
+    parser.add_argument("--repeat", type=int, default=3, help="Tekrar sayısı (en iyi süre alınır)")
+    args = parser.parse_args(argv)
+
+    pdf_path = args.pdf or ensure_pdf(args.pages, os.path.join(tempfile.gettempdir(), "lift_up_bench"))
+    doc = fitz.open(pdf_path)
+
+    probes = [("full_text", probe_full_text), ("textpage_search", probe_textpage_search)]
+    probes += [(f"clip_{fraction:g}", make_clip_probe(fraction)) for fraction in CLIP_FRACTIONS]
+
+    baseline_seconds, starts = _best_of(probe_full_text, doc, args.repeat)
+    print(f"PDF: {pdf_path} | Sayfa: {len(doc)} | Başlangıç sayfası: {len(starts)}")
+    print(f"{'Yöntem':<18}{'µs/sayfa':>10}{'Oran':>8}{'Aday':>8}{'Kaçırılan':>11}")
+    for name, probe in probes:
+        seconds, candidates = (baseline_seconds, starts) if probe is probe_full_text \
+            else _best_of(probe, doc, args.repeat)
+        missed = len(starts - candidates)
+        print(f"{name:<18}{seconds / len(doc) * 1e6:>10.1f}{seconds / baseline_seconds:>8.2f}"
+              f"{len(candidates):>8}{missed:>11}")
+
+    doc.close()
+
+
+if __name__ == "__main__":
+    main()
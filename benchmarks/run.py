@@ -0,0 +1,264 @@
+"""
+LIFT UP Extraction Benchmark Suite
+==================================
+Sentetik bildiri kitapları (50, 500, 5000 sayfa) üzerinde `PDFProcessor`
+(data_extract.py) ve `data_collection.process_path` çıkarım hızını ölçer.
+
+Her ölçüm ayrı bir süreçte çalışır; böylece tepe bellek kullanımı (peak RSS)
+ölçümler arasında karışmaz. Raporlanan değerler:
+    - sayfa/sn, makale/sn
+    - tepe RSS (MB)
+    - aşama başına süre (PDFProcessor'ın yerleşik ölçümleri: açma, sayfa metni,
+      başlangıç sayfası tespiti, başlık, özet/anahtar kelime, CSV yazma)
+
+Sonuçlar JSON olarak kaydedilebilir ve sonraki çalıştırmalar bu dosyaya göre
+karşılaştırılabilir; tolerans aşılırsa çıkış kodu 1 olur.
+
+Kullanım:
+    python -m benchmarks.run
+    python -m benchmarks.run --sizes 50 500 --json sonuc.json
+    python -m benchmarks.run --baseline sonuc.json --tolerance 0.15
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "data_extract_automation"))
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from benchmarks.synthetic import ensure_pdf
+
+
+DEFAULT_SIZES = [50, 500, 5000]
+DEFAULT_DATA_DIR = os.path.join(tempfile.gettempdir(), "lift_up_bench")
+TARGETS = ["oop", "procedural"]
+YEAR = "2022"
+
+
+# ====================================================================
+# ÖLÇÜM (alt süreçte çalışır)
+# ====================================================================
+
+def _peak_rss_mb() -> Optional[float]:
+    """Sürecin tepe bellek kullanımı (MB)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux'ta KB, macOS'ta byte
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def _count_rows(csv_path: str) -> int:
+    """CSV'deki makale satırı sayısı (başlık hariç)"""
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        return max(0, sum(1 for _ in csv.reader(f)) - 1)
+
+
+def _run_oop(pdf_path: str, output_csv: str):
+    from data_extract import PDFProcessor
+    PDFProcessor().process_pdf(pdf_path, YEAR, output_csv)
+
+
+def _run_procedural(pdf_path: str, output_csv: str):
+    import data_collection
+    data_collection.process_path(pdf_path, YEAR, os.path.dirname(output_csv))
+
+
+def _stage_times(pdf_path: str, output_csv: str) -> Dict[str, float]:
+    """
+    PDFProcessor'ı seri modda çalıştırıp yerleşik aşama sürelerini (bkz.
+    instrumentation.ExtractionStats) döndürür.
+
+    Returns:
+        Aşama adı -> saniye
+    """
+    from data_extract import PDFProcessor
+
+    processor = PDFProcessor()
+    processor.process_pdf(pdf_path, YEAR, output_csv)
+    return {name: round(stage["seconds"], 4)
+            for name, stage in processor.stats.to_dict()["stages"].items()}
+
+
+def run_case(target: str, pdf_path: str, pages: int) -> Dict[str, Any]:
+    """
+    Tek bir ölçümü çalıştırır (taze bir alt süreçte çağrılmalıdır).
+
+    Args:
+        target: "oop", "procedural" veya "stages"
+        pdf_path: PDF yolu
+        pages: PDF'in sayfa sayısı
+
+    Returns:
+        Ölçüm sonucu
+    """
+    with tempfile.TemporaryDirectory(prefix="lift_up_bench_") as tmp_dir:
+        output_csv = os.path.join(tmp_dir, os.path.splitext(os.path.basename(pdf_path))[0] + ".csv")
+        with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+            started = time.perf_counter()
+            if target == "stages":
+                stages = _stage_times(pdf_path, output_csv)
+            elif target == "oop":
+                _run_oop(pdf_path, output_csv)
+                stages = {}
+            elif target == "procedural":
+                _run_procedural(pdf_path, output_csv)
+                stages = {}
+            else:
+                raise ValueError(f"Bilinmeyen hedef: {target}")
+            seconds = time.perf_counter() - started
+        articles = _count_rows(output_csv)
+
+    return {
+        "target": target,
+        "pages": pages,
+        "articles": articles,
+        "seconds": round(seconds, 3),
+        "pages_per_sec": round(pages / seconds, 2) if seconds > 0 else 0.0,
+        "articles_per_sec": round(articles / seconds, 2) if seconds > 0 else 0.0,
+        "peak_rss_mb": _peak_rss_mb(),
+        "stages": stages,
+    }
+
+
+def _run_isolated(target: str, pdf_path: str, pages: int) -> Dict[str, Any]:
+    """Ölçümü yeni ("spawn") bir süreçte çalıştırır"""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(run_case, target, pdf_path, pages).result()
+
+
+# ====================================================================
+# RAPOR VE KARŞILAŞTIRMA
+# ====================================================================
+
+def print_report(results: List[Dict[str, Any]]):
+    """Sonuçları tablo olarak yazdırır"""
+    print(f"\n{'='*80}")
+    print("BENCHMARK SONUÇLARI")
+    print(f"{'='*80}")
+    print(f"{'Hedef':<12}{'Sayfa':>7}{'Makale':>8}{'Süre (sn)':>11}"
+          f"{'Sayfa/sn':>10}{'Makale/sn':>11}{'Tepe RSS (MB)':>15}")
+    for r in results:
+        rss = "-" if r["peak_rss_mb"] is None else f"{r['peak_rss_mb']:.1f}"
+        print(f"{r['target']:<12}{r['pages']:>7}{r['articles']:>8}{r['seconds']:>11.2f}"
+              f"{r['pages_per_sec']:>10.1f}{r['articles_per_sec']:>11.1f}{rss:>15}")
+
+    staged = [r for r in results if r["stages"]]
+    if staged:
+        print(f"{'-'*80}")
+        print("Aşama süreleri (PDFProcessor, sn)")
+        for r in staged:
+            parts = " | ".join(f"{name}: {seconds:.3f}" for name, seconds in r["stages"].items())
+            print(f"{r['pages']:>6} sayfa: {parts}")
+
+
+def compare_to_baseline(results: List[Dict[str, Any]], baseline: Dict[str, Any],
+                        tolerance: float) -> List[str]:
+    """
+    Sonuçları önceki bir çalıştırmayla karşılaştırır.
+
+    Args:
+        results: Güncel sonuçlar
+        baseline: Önceki çalıştırmanın JSON içeriği
+        tolerance: İzin verilen oransal kötüleşme (0.15 = %15)
+
+    Returns:
+        Tolerans dışı gerilemelerin açıklamaları
+    """
+    previous = {(r["target"], r["pages"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for r in results:
+        old = previous.get((r["target"], r["pages"]))
+        if old is None:
+            continue
+        label = f"{r['target']} / {r['pages']} sayfa"
+        if old["pages_per_sec"] and r["pages_per_sec"] < old["pages_per_sec"] * (1 - tolerance):
+            regressions.append(f"{label}: {old['pages_per_sec']} -> {r['pages_per_sec']} sayfa/sn")
+        if old.get("peak_rss_mb") and r["peak_rss_mb"] and \
+                r["peak_rss_mb"] > old["peak_rss_mb"] * (1 + tolerance):
+            regressions.append(f"{label}: tepe RSS {old['peak_rss_mb']} -> {r['peak_rss_mb']} MB")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="LIFT UP çıkarım benchmark'ı")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Sentetik PDF sayfa sayıları")
+    parser.add_argument("--targets", nargs="+", choices=TARGETS, default=TARGETS,
+                        help="Ölçülecek uygulamalar")
+    parser.add_argument("--no-stages", action="store_true", help="Aşama sürelerini ölçme")
+    parser.add_argument("--repeat", type=int, default=1, help="Tekrar sayısı (en hızlı sonuç alınır)")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="Sentetik PDF'lerin saklandığı dizin")
+    parser.add_argument("--seed", type=int, default=1, help="Sentetik PDF tohumu")
+    parser.add_argument("--json", dest="json_path", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--baseline", help="Karşılaştırılacak önceki sonuç JSON dosyası")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Karşılaştırmada izin verilen oransal kötüleşme (varsayılan: 0.15)")
+    args = parser.parse_args(argv)
+
+    results = []
+    for pages in args.sizes:
+        print(f"📄 Sentetik PDF hazırlanıyor: {pages} sayfa")
+        pdf_path = ensure_pdf(pages, args.data_dir, args.seed)
+
+        for target in args.targets:
+            best = None
+            for _ in range(max(1, args.repeat)):
+                result = _run_isolated(target, pdf_path, pages)
+                if best is None or result["seconds"] < best["seconds"]:
+                    best = result
+            print(f"⏱️  {target:<11} {pages:>5} sayfa: {best['seconds']:.2f} sn, "
+                  f"{best['pages_per_sec']:.1f} sayfa/sn")
+
+            # Aşama süreleri ayrı bir süreçte ölçülür (uçtan uca ölçümü etkilemez)
+            if target == "oop" and not args.no_stages:
+                best["stages"] = _run_isolated("stages", pdf_path, pages)["stages"]
+            results.append(best)
+
+    print_report(results)
+
+    if args.json_path:
+        import fitz
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "pymupdf": fitz.VersionBind,
+                "platform": platform.platform(),
+                "results": results,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 Sonuçlar kaydedildi: {args.json_path}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ Performans gerilemesi (tolerans %{args.tolerance * 100:.0f}):")
+            for line in regressions:
+                print(f"   {line}")
+            return 1
+        print(f"\n✅ Önceki sonuçlara göre gerileme yok (tolerans %{args.tolerance * 100:.0f})")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
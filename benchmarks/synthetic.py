@@ -0,0 +1,169 @@
+"""
+Synthetic Proceedings Generator
+===============================
+LIFT UP bildiri kitabı düzenini taklit eden sentetik, iki dilli PDF'ler üretir.
+
+Her makale şu düzendedir:
+    - Sayfa başlığı (küçük font)
+    - Büyük fontlu Türkçe ve İngilizce başlık
+    - Yazar ve e-posta satırları
+    - "Özetçe—", "Anahtar Kelimeler—", "Abstract—", "Keywords—"
+    - "I. GİRİŞ" ve gövde sayfaları
+
+Makalelerin bir kısmında İngilizce özet uzundur ve "Keywords—" bir sonraki
+sayfaya taşar (çok sayfalı pencere yolları da ölçülür).
+
+Kullanım:
+    python benchmarks/synthetic.py cikti.pdf 500
+"""
+
+import os
+import random
+import sys
+from typing import List, Optional
+
+import fitz  # PyMuPDF
+
+
+# Üretici değiştiğinde önbellekteki PDF'lerin yeniden üretilmesi için
+GENERATOR_VERSION = "1"
+
+WORDS_TR = ("üretim sistem analiz tasarım optimizasyon çelik kalıp şirket süreç verimlilik "
+            "ölçüm kalite maliyet geliştirme yöntem uygulama montaj hattı robot kaynak boya test").split()
+WORDS_EN = ("production system analysis design optimization steel mold company process efficiency "
+            "measurement quality cost development method application assembly line robot welding "
+            "paint testing").split()
+
+# Sayfa içerik alanı (A4)
+_CONTENT_RECT = fitz.Rect(50, 40, 545, 800)
+
+# Font tekilleştirmesinin yapıldığı parça boyutu (sayfa)
+_CHUNK_PAGES = 200
+
+
+def _sentence(rng: random.Random, words: List[str], n: int) -> str:
+    return " ".join(rng.choice(words) for _ in range(n)).capitalize() + "."
+
+
+def _paragraph(rng: random.Random, words: List[str], sentences: int) -> str:
+    return " ".join(_sentence(rng, words, rng.randint(6, 14)) for _ in range(sentences))
+
+
+def _first_page_html(rng: random.Random, long_abstract: bool) -> str:
+    """Makale başlangıç sayfasının HTML içeriği (başlıklar, özetler, anahtar kelimeler)"""
+    title_tr = _sentence(rng, WORDS_TR, rng.randint(5, 12))[:-1] + " Sistemi Üretimi"
+    title_en = _sentence(rng, WORDS_EN, rng.randint(5, 12))[:-1] + " Production System"
+    return (
+        '<p style="font-size:8px">LIFT UP Bildiri Kitabı</p>'
+        f'<p style="font-size:18px;text-align:center">{title_tr}</p>'
+        '<p style="font-size:6px">&nbsp;</p>'
+        f'<p style="font-size:18px;text-align:center">{title_en}</p>'
+        '<p style="font-size:10px">Öğrenci Ali Veli</p>'
+        '<p style="font-size:10px">ali.veli@example.com</p>'
+        f'<p style="font-size:9px">Özetçe— {_paragraph(rng, WORDS_TR, 5)}</p>'
+        f'<p style="font-size:9px">Anahtar Kelimeler— {", ".join(rng.sample(WORDS_TR, 4))}</p>'
+        f'<p style="font-size:9px">Abstract— {_paragraph(rng, WORDS_EN, 30 if long_abstract else 5)}</p>'
+    )
+
+
+def generate(path: str, pages: int, seed: int = 1, long_abstract_ratio: float = 0.2) -> int:
+    """
+    Sentetik bildiri kitabı PDF'i üretir.
+
+    Args:
+        path: Çıktı PDF yolu
+        pages: Toplam sayfa sayısı
+        seed: Rastgelelik tohumu (aynı tohum aynı PDF'i üretir)
+        long_abstract_ratio: Anahtar kelimeleri bir sonraki sayfaya taşan makale oranı
+
+    Returns:
+        Üretilen makale sayısı
+    """
+    rng = random.Random(seed)
+    out = fitz.open()
+    doc = fitz.open()
+    produced = 0
+    articles = 0
+
+    def flush():
+        # insert_htmlbox her sayfaya fontu yeniden gömer; parçalar ayrı ayrı
+        # tekilleştirilir (tek seferde tekilleştirme sayfa sayısıyla karesel büyür)
+        nonlocal doc
+        if len(doc):
+            chunk = fitz.open("pdf", doc.tobytes(garbage=4, deflate=True))
+            out.insert_pdf(chunk)
+            chunk.close()
+        doc.close()
+        doc = fitz.open()
+
+    while produced < pages:
+        if len(doc) >= _CHUNK_PAGES:
+            flush()
+
+        article_pages = rng.randint(3, 8)
+        long_abstract = rng.random() < long_abstract_ratio
+        html = _first_page_html(rng, long_abstract)
+
+        page = doc.new_page()
+        produced += 1
+        articles += 1
+        if long_abstract and produced < pages:
+            page.insert_htmlbox(_CONTENT_RECT, html)
+            page = doc.new_page()
+            produced += 1
+            html = f'<p style="font-size:9px">{_paragraph(rng, WORDS_EN, 4)}</p>'
+        html += (
+            f'<p style="font-size:9px">Keywords— {", ".join(rng.sample(WORDS_EN, 4))}</p>'
+            '<p style="font-size:10px">I. GİRİŞ</p>'
+            f'<p style="font-size:9px">{_paragraph(rng, WORDS_TR, 6)}</p>'
+        )
+        page.insert_htmlbox(_CONTENT_RECT, html)
+
+        for _ in range(article_pages - 1):
+            if produced >= pages:
+                break
+            page = doc.new_page()
+            page.insert_htmlbox(_CONTENT_RECT, f'<p style="font-size:9px">{_paragraph(rng, WORDS_TR, 20)}</p>')
+            produced += 1
+
+    flush()
+    doc.close()
+    out.save(path, garbage=1, deflate=True)
+    out.close()
+    return articles
+
+
+def ensure_pdf(pages: int, data_dir: str, seed: int = 1) -> str:
+    """
+    Verilen boyuttaki sentetik PDF'i önbellek dizininde üretir (varsa yeniden kullanır).
+
+    Args:
+        pages: Sayfa sayısı
+        data_dir: PDF'lerin saklanacağı dizin
+        seed: Rastgelelik tohumu
+
+    Returns:
+        PDF yolu
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, f"synthetic_v{GENERATOR_VERSION}_s{seed}_{pages}p.pdf")
+    if not os.path.exists(path):
+        tmp_path = path + ".tmp"
+        generate(tmp_path, pages, seed)
+        os.replace(tmp_path, path)
+    return path
+
+
+def main(argv: Optional[List[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2:
+        print("Kullanım: python benchmarks/synthetic.py <cikti.pdf> <sayfa> [tohum]")
+        return 1
+    seed = int(argv[2]) if len(argv) > 2 else 1
+    articles = generate(argv[0], int(argv[1]), seed)
+    print(f"✅ {argv[0]}: {argv[1]} sayfa, {articles} makale")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,14 @@
 import fitz
-import re
-import csv
 import sys
 import os
 import glob
+import time
+
+# Ortak regex kayıt defteri ve batch çalıştırıcısı data_extract_automation altında
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "data_extract_automation"))
+import patterns
+from batch import run_batch, print_summary
+from outputs import DEFAULT_FORMAT, output_path, write_articles
 
 # ====================================================================
 # CONFIGURATION - Buradan PDF yolunu ve ayarları değiştirebilirsiniz
@@ -18,6 +23,15 @@ PDF_PATH = f"Bildiri-Kitabi-{YEAR}.pdf"
 # Çıktı klasörü (None ise PDF ile aynı yerde oluşturulur)
 OUTPUT_DIR = None
 
+# Çıktı formatı: "csv", "parquet" veya "feather" (parquet/feather için pyarrow gerekir)
+OUTPUT_FORMAT = DEFAULT_FORMAT
+
+# Aynı anda işlenecek PDF sayısı (>1 ise her PDF ayrı süreçte işlenir)
+JOBS = 1
+
+# Batch modunda dosya başına maksimum süre (saniye, None ise sınırsız)
+TIMEOUT = None
+
 
 # ====================================================================
 # TEXT UTILITIES - Metin işleme yardımcı fonksiyonları
@@ -38,7 +52,7 @@ def clean_text(text: str) -> str:
     """
     if not text:
         return ""
-    text = re.sub(r"\s+", " ", text)
+    text = patterns.WHITESPACE.sub(" ", text)
     return text.strip()
 
 
@@ -98,73 +112,64 @@ def is_article_start_page(text: str) -> bool:
     return ("Özetçe" in text) and ("Abstract" in text)
 
 
-def collect_until_markers(doc, start_idx: int, stop_markers: list, hard_limit: int = 8) -> str:
+def segment_articles(page_texts: list) -> list[tuple[int, int]]:
     """
-    Belirli bir sayfadan başlayarak, durma işaretçilerine kadar olan metni toplar.
-    Özet çıkarımında kullanılır (bir özet birkaç sayfaya yayılabilir).
+    Sayfaları tek doğrusal geçişte makale aralıklarına böler.
+    Bir makale, bir sonraki makale başlangıcından önceki sayfada (veya döküman sonunda) biter.
     
     Args:
-        doc: PDF dökümanı
-        start_idx: Başlangıç sayfa indeksi
-        stop_markers: Durma işaretçileri listesi (örn: ["Keywords", "Anahtar Kelimeler"])
-        hard_limit: Maksimum kaç sayfa toplanacak (varsayılan: 8)
+        page_texts: Dökümanın tüm sayfa metinleri
         
     Returns:
-        Birleştirilmiş metin
+        (başlangıç_indeksi, bitiş_indeksi) listesi (0 tabanlı, uçlar dahil)
     """
-    parts = []
-    for i in range(start_idx, min(len(doc), start_idx + hard_limit)):
-        page_text = doc[i].get_text()
-        
-        # Yeni makale başladıysa dur
-        if i > start_idx and is_article_start_page(page_text):
-            break
-            
-        parts.append(page_text)
-        
-        # Durma işaretçilerini kontrol et
-        low = page_text.lower()
-        if any(marker.lower() in low for marker in stop_markers):
-            break
-            
-    return "\n".join(parts)
+    spans = []
+    current_start = None
+    for idx, text in enumerate(page_texts):
+        if not is_article_start_page(text):
+            continue
+        if current_start is not None:
+            spans.append((current_start, idx - 1))
+        current_start = idx
+    
+    if current_start is not None:
+        spans.append((current_start, len(page_texts) - 1))
+    return spans
 
 
 # ====================================================================
 # ABSTRACT EXTRACTION - Özet çıkarma fonksiyonları
 # ====================================================================
 
-def extract_abstract_tr(text: str) -> str:
+def extract_abstract_tr(text: patterns.Text) -> str:
     """
     Türkçe özeti "Özetçe—" ile "Anahtar Kelimeler" arasından çıkarır.
     
     Args:
-        text: İşlenecek metin
+        text: İşlenecek metin veya dizinli pencere öneki (patterns.IndexedText)
         
     Returns:
         Türkçe özet
     """
-    pattern = r"Özetçe\s*[—\-–]+\s*(.*?)\s*(?=Anahtar\s*Kelimeler)"
-    match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+    match = patterns.search("abstract_tr", text)
     return clean_text(match.group(1)) if match else ""
 
 
-def extract_abstract_en(text: str) -> str:
+def extract_abstract_en(text: patterns.Text) -> str:
     """
     İngilizce özeti "Abstract—" ile "Keywords" arasından çıkarır.
     
     Args:
-        text: İşlenecek metin
+        text: İşlenecek metin veya dizinli pencere öneki (patterns.IndexedText)
         
     Returns:
         İngilizce özet
     """
-    pattern = r"Abstract\s*[—\-–]+\s*(.*?)\s*(?=Keywords)"
-    match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+    match = patterns.search("abstract_en", text)
     return clean_text(match.group(1)) if match else ""
 
 
-def extract_keywords_tr(text: str) -> str:
+def extract_keywords_tr(text: patterns.Text) -> str:
     """
     Türkçe anahtar kelimeleri "Anahtar Kelimeler—" ile "Abstract" arasından çıkarır.
     
@@ -172,7 +177,7 @@ def extract_keywords_tr(text: str) -> str:
     kelime/kelime grupları şeklindedir.
     
     Args:
-        text: İşlenecek metin
+        text: İşlenecek metin veya dizinli pencere öneki (patterns.IndexedText)
         
     Returns:
         Türkçe anahtar kelimeler (virgülle ayrılmış)
@@ -180,12 +185,11 @@ def extract_keywords_tr(text: str) -> str:
     # "Anahtar Kelimeler" ile "Abstract" arasındaki metni yakala
     # Farklı tire karakterlerini (—, -, –, :, ;) destekle
     # Noktalı virgül (;) bazı makalelerde kullanılıyor
-    pattern = r"Anahtar\s*Kelimeler\s*[—:\-–;]+\s*(.*?)\s*(?=Abstract)"
-    match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+    match = patterns.search("keywords_tr", text)
     return clean_text(match.group(1)) if match else ""
 
 
-def extract_keywords_en(text: str) -> str:
+def extract_keywords_en(text: patterns.Text) -> str:
     """
     İngilizce anahtar kelimeleri "Keywords—" ile "Giriş" veya "Problem Tanımı" bölümü arasından çıkarır.
     
@@ -198,7 +202,7 @@ def extract_keywords_en(text: str) -> str:
     - Bazen hiçbir başlık olmayabilir, bu durumda ilk satırı al
     
     Args:
-        text: İşlenecek metin
+        text: İşlenecek metin veya dizinli pencere öneki (patterns.IndexedText)
         
     Returns:
         İngilizce anahtar kelimeler (virgülle ayrılmış)
@@ -210,8 +214,7 @@ def extract_keywords_en(text: str) -> str:
     # - \n\s*I\. : yeni satırda "I." (eski pattern)
     # - I\.\s : "I." sonrası boşluk (I. GİRİŞ, I. PROBLEM gibi aynı satırda)
     # - PROBLEM : "PROBLEM TANIMI", "PROBLEMİN TANIMI" vb. için genel pattern
-    pattern = r"Keywords\s*[—:\-–;]+\s*(.*?)(?=\n\s*I\.|I\.\s|GİRİŞ|INTRODUCTION|PROBLEM|\n\s*\n\s*[A-Z][a-z]+)"
-    match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+    match = patterns.search("keywords_en", text)
     
     if match:
         result = clean_text(match.group(1))
@@ -225,8 +228,7 @@ def extract_keywords_en(text: str) -> str:
     
     # Eğer yukarıdaki pattern başarısız olursa, daha basit bir yöntem dene
     # Keywords'den sonra ilk satırı al (çift newline'a kadar)
-    simple_pattern = r"Keywords\s*[—:\-–;]+\s*([^\n]+)"
-    simple_match = re.search(simple_pattern, text, re.IGNORECASE)
+    simple_match = patterns.search("keywords_en_simple", text)
     if simple_match:
         return clean_text(simple_match.group(1))
     
@@ -564,54 +566,62 @@ def extract_title_tr_en(page) -> tuple[str, str]:
 # PDF PROCESSING - Ana işleme fonksiyonları
 # ====================================================================
 
-def extract_abstracts_with_fallback(doc, page_idx: int) -> tuple[str, str]:
+def extract_abstracts_with_fallback(index: patterns.MarkerIndex) -> tuple[str, str]:
     """
     Özet çıkarımını birden fazla stratejiyle dener (bazı özetler birkaç sayfaya yayılabilir).
     
     Args:
-        doc: PDF dökümanı
-        page_idx: Makale başlangıç sayfası indeksi
+        index: Makale penceresinin işaretçi dizini (patterns.MarkerIndex)
         
     Returns:
         (abstract_tr, abstract_en) tuple
     """
     # İlk deneme: Normal marker'larla
-    merged_tr = collect_until_markers(doc, page_idx, ["Anahtar Kelimeler"], hard_limit=8)
-    merged_en = collect_until_markers(doc, page_idx, ["Keywords"], hard_limit=8)
+    merged_tr = index.window(["Anahtar Kelimeler"], hard_limit=8)
+    merged_en = index.window(["Keywords"], hard_limit=8)
     abs_tr = extract_abstract_tr(merged_tr)
     abs_en = extract_abstract_en(merged_en)
 
     # Türkçe özet bulunamadıysa alternatif deneme
     if not abs_tr:
-        merged_tr2 = collect_until_markers(doc, page_idx, ["Abstract", "Keywords"], hard_limit=8)
-        match = re.search(
-            r"Özetçe\s*[—\-–]+\s*(.*?)\s*(?=Abstract|Keywords)",
-            merged_tr2,
-            re.DOTALL | re.IGNORECASE
-        )
+        merged_tr2 = index.window(["Abstract", "Keywords"], hard_limit=8)
+        match = patterns.search("abstract_tr_fallback", merged_tr2)
         abs_tr = clean_text(match.group(1)) if match else ""
 
     # İngilizce özet bulunamadıysa alternatif deneme
     if not abs_en:
-        merged_en2 = collect_until_markers(doc, page_idx, ["I.", "I ", "GİRİŞ"], hard_limit=8)
-        match = re.search(
-            r"Abstract\s*[—\-–]+\s*(.*?)\s*(?=Keywords|I\.\s|I\s|GİRİŞ)",
-            merged_en2,
-            re.DOTALL | re.IGNORECASE
-        )
+        merged_en2 = index.window(["I.", "I ", "GİRİŞ"], hard_limit=8)
+        match = patterns.search("abstract_en_fallback", merged_en2)
         abs_en = clean_text(match.group(1)) if match else ""
 
     return abs_tr, abs_en
 
 
-def process_pdf(pdf_path: str, year: str, output_csv: str | None = None):
+def process_pdf(pdf_path: str, year: str, output_csv: str | None = None,
+                output_format: str = DEFAULT_FORMAT):
     """
-    Tek bir PDF dosyasından tüm makaleleri çıkarır ve CSV'ye yazar.
+    Tek bir PDF dosyasından tüm makaleleri çıkarır ve CSV'ye (veya Parquet/Feather'a) yazar.
     
     Args:
         pdf_path: PDF dosya yolu
         year: Yıl bilgisi (CSV'ye yazılacak)
-        output_csv: Çıktı CSV dosya yolu (None ise otomatik oluşturulur)
+        output_csv: Çıktı dosya yolu (None ise otomatik oluşturulur)
+        output_format: "csv", "parquet" veya "feather"
+        
+    Returns:
+        CSV'ye yazılan satırların listesi
+    """
+    rows, _ = _process_pdf(pdf_path, year, output_csv, output_format)
+    return rows
+
+
+def _process_pdf(pdf_path: str, year: str, output_csv: str | None,
+                 output_format: str) -> tuple[list, int]:
+    """
+    `process_pdf` gövdesi.
+    
+    Returns:
+        (yazılan satırlar, PDF'in sayfa sayısı) tuple
     """
     print(f"📄 PDF açılıyor: {pdf_path}")
     doc = fitz.open(pdf_path)
@@ -619,30 +629,30 @@ def process_pdf(pdf_path: str, year: str, output_csv: str | None = None):
 
     rows = []
 
-    # Her sayfayı tara
-    for page_idx in range(len(doc)):
-        page = doc[page_idx]
-        text = page.get_text()
+    # Her sayfanın metnini bir kez çıkar ve makale aralıklarını tek geçişte bul
+    page_texts = [page.get_text() for page in doc]
+    spans = segment_articles(page_texts)
 
-        # Bu sayfa yeni makale başlangıcı mı?
-        if not is_article_start_page(text):
-            continue
+    for start_idx, end_idx in spans:
+        # Özet/anahtar kelime pencereleri makale aralığıyla ve 8 sayfayla sınırlıdır
+        # Tüm pencere kararları tek bir işaretçi dizininden cevaplanır
+        index = patterns.MarkerIndex(page_texts[start_idx:min(end_idx + 1, start_idx + 8)])
 
         # Başlıkları çıkar (TR ve EN ayrı)
-        title_tr, title_en = extract_title_tr_en(page)
+        title_tr, title_en = extract_title_tr_en(doc[start_idx])
 
         # Özetleri çıkar (fallback stratejileriyle)
-        abs_tr, abs_en = extract_abstracts_with_fallback(doc, page_idx)
+        abs_tr, abs_en = extract_abstracts_with_fallback(index)
 
         # Anahtar kelimeleri çıkar (TR ve EN ayrı)
         # Anahtar kelimeler için sayfa metnini topla (birkaç sayfaya yayılabilir)
-        keywords_text = collect_until_markers(doc, page_idx, ["I.", "GİRİŞ", "INTRODUCTION"], hard_limit=3)
+        keywords_text = index.window(["I.", "GİRİŞ", "INTRODUCTION"], hard_limit=3)
         keywords_tr = extract_keywords_tr(keywords_text)
         keywords_en = extract_keywords_en(keywords_text)
 
         # Makale bilgilerini kaydet
         rows.append({
-            "PageNumber": page_idx + 1,
+            "PageNumber": start_idx + 1,
             "Year": year,
             "Title_TR": title_tr,
             "Title_EN": title_en,
@@ -653,27 +663,24 @@ def process_pdf(pdf_path: str, year: str, output_csv: str | None = None):
         })
 
         # İlerleme göster
-        print(f"✅ Sayfa {page_idx+1}: TR='{title_tr[:60]}...' | EN='{title_en[:60]}...'")
+        print(f"✅ Sayfa {start_idx+1}-{end_idx+1}: TR='{title_tr[:60]}...' | EN='{title_en[:60]}...'")
 
     doc.close()
 
-    # CSV dosya adını belirle
+    # Çıktı dosya adını belirle
     if output_csv is None:
-        base = os.path.splitext(pdf_path)[0]
-        output_csv = base + ".csv"
+        output_csv = output_path(os.path.splitext(pdf_path)[0], output_format)
 
-    # CSV'ye yaz
-    with open(output_csv, "w", newline="", encoding="utf-8-sig") as f:
-        fieldnames = ["PageNumber", "Year", "Title_TR", "Title_EN", "Abstract_TR", "Abstract_EN", "Keywords_TR", "Keywords_EN"]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+    # Çıktıyı yaz
+    write_articles(rows, output_csv, output_format)
 
-    print(f"\n✨ {len(rows)} makale bulundu. CSV yazıldı: {output_csv}")
+    print(f"\n✨ {len(rows)} makale bulundu. Çıktı yazıldı: {output_csv}")
+    return rows, len(page_texts)
 
 
-def process_path(input_path: str, year: str, out_dir: str | None = None):
+def process_path(input_path: str, year: str, out_dir: str | None = None,
+                 jobs: int = 1, timeout: float | None = None,
+                 output_format: str = DEFAULT_FORMAT):
     """
     PDF dosyası, klasör veya glob pattern'i işler.
     
@@ -681,6 +688,12 @@ def process_path(input_path: str, year: str, out_dir: str | None = None):
         input_path: PDF dosyası, klasör yolu veya glob pattern (örn: "2021-2022/*.pdf")
         year: Yıl bilgisi
         out_dir: Çıktı dizini (None ise PDF ile aynı yerde oluşturulur)
+        jobs: Aynı anda işlenecek PDF sayısı (>1 ise batch modu)
+        timeout: Batch modunda dosya başına maksimum süre (saniye)
+        output_format: "csv", "parquet" veya "feather"
+        
+    Returns:
+        Batch modunda dosya bazlı BatchResult listesi, aksi halde None
         
     Raises:
         FileNotFoundError: PDF bulunamazsa
@@ -706,18 +719,46 @@ def process_path(input_path: str, year: str, out_dir: str | None = None):
     if out_dir is not None:
         os.makedirs(out_dir, exist_ok=True)
 
+    def output_for(pdf: str) -> str | None:
+        if out_dir:
+            return output_path(os.path.join(out_dir, os.path.splitext(os.path.basename(pdf))[0]),
+                               output_format)
+        return None
+
+    # Batch modu: her PDF ayrı süreçte, bir dosyanın hatası diğerlerini etkilemez
+    if jobs > 1 and len(pdfs) > 1:
+        print(f"⚙️  {len(pdfs)} PDF en fazla {jobs} paralel süreçte işleniyor")
+        started = time.perf_counter()
+        results = run_batch(
+            _batch_job,
+            [(pdf, (pdf, year, output_for(pdf), output_format)) for pdf in pdfs],
+            max_workers=jobs,
+            timeout=timeout,
+        )
+        print_summary(results, time.perf_counter() - started)
+        return results
+
     # Her PDF'i işle
     for idx, pdf in enumerate(pdfs, 1):
         print(f"\n{'='*80}")
         print(f"[{idx}/{len(pdfs)}] İşleniyor...")
         print(f"{'='*80}")
         
-        if out_dir:
-            out_csv = os.path.join(out_dir, os.path.splitext(os.path.basename(pdf))[0] + ".csv")
-        else:
-            out_csv = None
-        
-        process_pdf(pdf, year, out_csv)
+        process_pdf(pdf, year, output_for(pdf), output_format)
+
+    return None
+
+
+def _batch_job(pdf_path: str, year: str, output_csv: str | None,
+               output_format: str = DEFAULT_FORMAT) -> dict:
+    """
+    Batch modunda tek bir PDF'i işler (alt süreçte çalışır).
+    
+    Returns:
+        {"pages": sayfa sayısı, "articles": makale sayısı}
+    """
+    rows, page_count = _process_pdf(pdf_path, year, output_csv, output_format)
+    return {"pages": page_count, "articles": len(rows)}
 
 
 # ====================================================================
@@ -730,11 +771,16 @@ if __name__ == "__main__":
     print("="*80)
     print(f"PDF Path: {PDF_PATH}")
     print(f"Year: {YEAR}")
-    print(f"Output Dir: {OUTPUT_DIR}")
+    print(f"Output Dir: {OUTPUT_DIR} | Format: {OUTPUT_FORMAT}")
+    print(f"Jobs: {JOBS} | Timeout: {TIMEOUT}")
     print("="*80 + "\n")
     
     try:
-        process_path(PDF_PATH, YEAR, OUTPUT_DIR)
+        results = process_path(PDF_PATH, YEAR, OUTPUT_DIR, jobs=JOBS, timeout=TIMEOUT,
+                               output_format=OUTPUT_FORMAT)
+        if results and not all(r.ok for r in results):
+            print("\n⚠️  Bazı dosyalar işlenemedi (ayrıntılar yukarıda)")
+            sys.exit(1)
         print("\n🎉 İşlem başarıyla tamamlandı!")
     except Exception as e:
         print(f"\n❌ HATA: {e}")
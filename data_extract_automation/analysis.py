@@ -1,24 +1,247 @@
 """
 CSV Analysis Module for LIFT UP Dataset
 ========================================
-CSV dosyalarını analiz eder ve istatistikler çıkarır
+CSV dosyalarını analiz eder ve istatistikler çıkarır (Parquet/Feather çıktıları
+da aynı şekilde, yalnızca istenen sütunlar okunarak analiz edilebilir)
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+import json
 import os
+import tempfile
+
+from cache import file_sha256
+from outputs import article_columns, iter_article_frames, read_articles
+
+
+# Analiz çıktısının yapısı değiştiğinde artırılmalı (kaydedilmiş analizleri geçersiz kılar)
+ANALYSIS_VERSION = "2"
+
+
+# Uzunluk istatistikleri hesaplanan metin sütunları
+TEXT_COLUMNS = ['Title_TR', 'Title_EN', 'Abstract_TR', 'Abstract_EN',
+                'Keywords_TR', 'Keywords_EN']
+
+# Dil tamlığı hesabında kullanılan sütunlar
+LANGUAGE_COLUMNS = {
+    'tr': ('Title_TR', 'Abstract_TR', 'Keywords_TR'),
+    'en': ('Title_EN', 'Abstract_EN', 'Keywords_EN'),
+}
+
+# Dil istatistiklerindeki doluluk anahtarları ve sütunları
+FILLED_KEYS = [('tr_titles_filled', 'Title_TR'), ('en_titles_filled', 'Title_EN'),
+               ('tr_abstracts_filled', 'Abstract_TR'), ('en_abstracts_filled', 'Abstract_EN'),
+               ('tr_keywords_filled', 'Keywords_TR'), ('en_keywords_filled', 'Keywords_EN')]
+
+# Raporda gösterilen ilk satır sayısı
+FIRST_ROWS = 5
+
+# Parça parça analizde okunan satır sayısı ve analiz_csv'nin parça parça
+# analize geçtiği dosya boyutu
+DEFAULT_CHUNK_ROWS = 10000
+STREAMING_THRESHOLD_BYTES = 64 * 1024 * 1024  # 64MB
+
+
+class ColumnProfile:
+    """
+    Raporun tüm bölümlerinin türetildiği sütun istatistikleri.
+    
+    DataFrame üzerinde tek geçişte hesaplanır: satır sayısı, sütun başına boş
+    değer sayısı, metin sütunlarının uzunluk toplamı/sayısı/min/max'ı, yıl
+    dağılımı ve ilk satırlar. Ortalama uzunluk toplam/sayı olarak saklandığı
+    için profiller toplanabilir.
+    """
+    
+    def __init__(self, columns: List[str]):
+        """
+        Args:
+            columns: CSV sütunları (dosyadaki sırayla)
+        """
+        self.columns = list(columns)
+        self.rows = 0
+        self.null_counts: Dict[str, int] = {col: 0 for col in self.columns}
+        # sütun -> {"count", "sum", "min", "max"} (yalnızca boş olmayan değerler)
+        self.lengths: Dict[str, Dict[str, int]] = {}
+        self.year_counts: Dict[str, int] = {}
+        # yıl -> ilk göründüğü satır (eşit sayılı yılların sırası için)
+        self.year_first_seen: Dict[str, int] = {}
+        self.first_rows: List[Dict] = []
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, first_n: int = FIRST_ROWS) -> "ColumnProfile":
+        """
+        DataFrame'in profilini tek geçişte çıkarır.
+        
+        Args:
+            df: Analiz edilecek DataFrame
+            first_n: Saklanacak ilk satır sayısı
+        """
+        profile = cls(df.columns.tolist())
+        profile.rows = len(df)
+        profile.null_counts = {col: int(count) for col, count in df.isnull().sum().items()}
+        
+        # Metin uzunlukları sütun başına bir satır olacak şekilde tek matriste
+        # toplanır; sayı/toplam/min/max tüm sütunlar için tek seferde indirgenir
+        text_columns = [col for col in TEXT_COLUMNS if col in df.columns]
+        if text_columns:
+            lengths = np.vstack([cls._str_lengths(df[col]) for col in text_columns])
+            missing = np.isnan(lengths)
+            counts = (~missing).sum(axis=1)
+            sums = np.where(missing, 0, lengths).sum(axis=1)
+            mins = np.fmin.reduce(lengths, axis=1)
+            maxs = np.fmax.reduce(lengths, axis=1)
+            for i, col in enumerate(text_columns):
+                if counts[i] > 0:
+                    profile.lengths[col] = {
+                        'count': int(counts[i]),
+                        'sum': int(sums[i]),
+                        'min': int(mins[i]),
+                        'max': int(maxs[i]),
+                    }
+        
+        if 'Year' in df.columns:
+            years = df['Year'].reset_index(drop=True).dropna()
+            profile.year_first_seen = {str(k): int(pos) for pos, k in years.drop_duplicates().items()}
+            # Kategori tipinde (Parquet/Feather) görülmeyen yıllar 0 sayılır; atlanır
+            counts = {str(k): int(v) for k, v in years.value_counts(sort=False).items() if v}
+            profile.year_counts = profile._sorted_years(counts)
+        
+        profile.first_rows = df.head(first_n).fillna('').to_dict('records')
+        return profile
+    
+    @staticmethod
+    def _str_lengths(column: pd.Series) -> np.ndarray:
+        """Metin uzunlukları (boş değerler NaN)"""
+        if column.isnull().all():
+            return np.full(len(column), np.nan)
+        return column.str.len().to_numpy(dtype=float, na_value=np.nan)
+    
+    def _sorted_years(self, counts: Dict[str, int]) -> Dict[str, int]:
+        """
+        Yıl sayılarını value_counts gibi çoktan aza sıralar; eşit sayılı yıllar
+        ilk göründükleri satıra göre sıralanır (kategori sırasından bağımsız)
+        """
+        return dict(sorted(counts.items(),
+                           key=lambda item: (-item[1], self.year_first_seen[item[0]])))
+    
+    def merge(self, other: "ColumnProfile", first_n: int = FIRST_ROWS):
+        """
+        Sonraki satırlara ait profili bu profile ekler (parça parça analiz için).
+        
+        Args:
+            other: Aynı sütunlara sahip, bu profildeki satırlardan sonra gelen satırların profili
+            first_n: Saklanacak ilk satır sayısı
+        """
+        for year, pos in other.year_first_seen.items():
+            self.year_first_seen.setdefault(year, self.rows + pos)
+        self.rows += other.rows
+        for col, count in other.null_counts.items():
+            self.null_counts[col] = self.null_counts.get(col, 0) + count
+        for col, lengths in other.lengths.items():
+            current = self.lengths.get(col)
+            if current is None:
+                self.lengths[col] = dict(lengths)
+                continue
+            current['count'] += lengths['count']
+            current['sum'] += lengths['sum']
+            current['min'] = min(current['min'], lengths['min'])
+            current['max'] = max(current['max'], lengths['max'])
+        if other.year_counts:
+            counts = dict(self.year_counts)
+            for year, count in other.year_counts.items():
+                counts[year] = counts.get(year, 0) + count
+            self.year_counts = self._sorted_years(counts)
+        if len(self.first_rows) < first_n:
+            self.first_rows.extend(other.first_rows[:first_n - len(self.first_rows)])
+    
+    def basic_stats(self, file_size: int) -> Dict[str, Any]:
+        """Temel istatistikler bölümü (bkz. CSVAnalyzer.get_basic_stats)"""
+        return {
+            'total_articles': self.rows,
+            'total_columns': len(self.columns),
+            'columns': list(self.columns),
+            'file_size': file_size,
+        }
+    
+    def missing_values(self) -> Dict[str, Any]:
+        """Eksik değer bölümü (bkz. CSVAnalyzer.get_missing_values)"""
+        missing_data = []
+        for col in self.columns:
+            count = self.null_counts[col]
+            if count > 0:
+                missing_data.append({
+                    'column': col,
+                    'count': count,
+                    'percentage': float(np.round(count / self.rows * 100, 2))
+                })
+        
+        return {
+            'has_missing': len(missing_data) > 0,
+            'total_missing': sum(self.null_counts.values()),
+            'details': missing_data
+        }
+    
+    def filled(self, col: str) -> int:
+        """Sütundaki boş olmayan değer sayısı"""
+        return self.rows - self.null_counts[col]
+    
+    def language_stats(self) -> Dict[str, Any]:
+        """
+        Dil bazlı istatistikler bölümü (bkz. CSVAnalyzer.get_language_stats);
+        yalnızca bazı sütunlar okunduysa eksik sütunlar atlanır
+        """
+        stats = {key: self.filled(col) for key, col in FILLED_KEYS if col in self.null_counts}
+        
+        # Yüzde hesapla
+        total = self.rows
+        for lang, columns in LANGUAGE_COLUMNS.items():
+            present = [col for col in columns if col in self.null_counts]
+            if present:
+                filled = sum(self.filled(col) for col in present)
+                stats[f'{lang}_completeness'] = round(filled / (total * len(present)) * 100, 2)
+        
+        return stats
+    
+    def text_length_stats(self) -> Dict[str, Any]:
+        """Metin uzunluğu bölümü (bkz. CSVAnalyzer.get_text_length_stats)"""
+        stats = {}
+        for col in TEXT_COLUMNS:
+            lengths = self.lengths.get(col)
+            if lengths is not None:
+                stats[col] = {
+                    'avg_length': round(np.float64(lengths['sum']) / lengths['count'], 2),
+                    'min_length': lengths['min'],
+                    'max_length': lengths['max']
+                }
+        return stats
+    
+    def report(self, file_size: int) -> Dict[str, Any]:
+        """Tam analiz raporu (bkz. CSVAnalyzer.get_full_analysis)"""
+        return {
+            'basic_stats': self.basic_stats(file_size),
+            'missing_values': self.missing_values(),
+            'first_rows': self.first_rows[:FIRST_ROWS],
+            'year_distribution': dict(self.year_counts),
+            'language_stats': self.language_stats(),
+            'text_length_stats': self.text_length_stats()
+        }
 
 
 class CSVAnalyzer:
     """CSV dosyası analiz sınıfı"""
     
-    def __init__(self, csv_path: str):
+    def __init__(self, csv_path: str, columns: Optional[List[str]] = None):
         """
         Args:
-            csv_path: Analiz edilecek CSV dosya yolu
+            csv_path: Analiz edilecek CSV (veya Parquet/Feather) dosya yolu
+            columns: Okunacak sütunlar (None ise tümü)
         """
         self.csv_path = csv_path
+        self.columns = columns
         self.df = None
+        self._profile: Optional[ColumnProfile] = None
         self._load_csv()
     
     def _load_csv(self):
@@ -26,7 +249,14 @@ class CSVAnalyzer:
         if not os.path.exists(self.csv_path):
             raise FileNotFoundError(f"CSV dosyası bulunamadı: {self.csv_path}")
         
-        self.df = pd.read_csv(self.csv_path, encoding='utf-8-sig')
+        self.df = read_articles(self.csv_path, self.columns)
+    
+    @property
+    def profile(self) -> ColumnProfile:
+        """DataFrame'in tek geçişte çıkarılan profili (ilk erişimde hesaplanır)"""
+        if self._profile is None:
+            self._profile = ColumnProfile.from_frame(self.df)
+        return self._profile
     
     def get_basic_stats(self) -> Dict[str, Any]:
         """
@@ -38,14 +268,7 @@ class CSVAnalyzer:
         if self.df is None:
             return {}
         
-        stats = {
-            'total_articles': len(self.df),
-            'total_columns': len(self.df.columns),
-            'columns': self.df.columns.tolist(),
-            'file_size': os.path.getsize(self.csv_path),
-        }
-        
-        return stats
+        return self.profile.basic_stats(os.path.getsize(self.csv_path))
     
     def get_missing_values(self) -> Dict[str, Any]:
         """
@@ -57,23 +280,7 @@ class CSVAnalyzer:
         if self.df is None:
             return {}
         
-        missing = self.df.isnull().sum()
-        missing_percent = (missing / len(self.df) * 100).round(2)
-        
-        missing_data = []
-        for col in self.df.columns:
-            if missing[col] > 0:
-                missing_data.append({
-                    'column': col,
-                    'count': int(missing[col]),
-                    'percentage': float(missing_percent[col])
-                })
-        
-        return {
-            'has_missing': len(missing_data) > 0,
-            'total_missing': int(missing.sum()),
-            'details': missing_data
-        }
+        return self.profile.missing_values()
     
     def get_first_n_rows(self, n: int = 5) -> List[Dict]:
         """
@@ -88,6 +295,9 @@ class CSVAnalyzer:
         if self.df is None:
             return []
         
+        if n <= len(self.profile.first_rows) or len(self.profile.first_rows) == self.profile.rows:
+            return self.profile.first_rows[:n]
+        
         # NaN değerlerini boş string'e çevir
         df_clean = self.df.head(n).fillna('')
         
@@ -100,11 +310,10 @@ class CSVAnalyzer:
         Returns:
             Yıl bazında makale sayıları
         """
-        if self.df is None or 'Year' not in self.df.columns:
+        if self.df is None:
             return {}
         
-        year_counts = self.df['Year'].value_counts().to_dict()
-        return {str(k): int(v) for k, v in year_counts.items()}
+        return dict(self.profile.year_counts)
     
     def get_language_stats(self) -> Dict[str, Any]:
         """
@@ -116,25 +325,7 @@ class CSVAnalyzer:
         if self.df is None:
             return {}
         
-        stats = {
-            'tr_titles_filled': int((~self.df['Title_TR'].isnull()).sum()),
-            'en_titles_filled': int((~self.df['Title_EN'].isnull()).sum()),
-            'tr_abstracts_filled': int((~self.df['Abstract_TR'].isnull()).sum()),
-            'en_abstracts_filled': int((~self.df['Abstract_EN'].isnull()).sum()),
-            'tr_keywords_filled': int((~self.df['Keywords_TR'].isnull()).sum()),
-            'en_keywords_filled': int((~self.df['Keywords_EN'].isnull()).sum()),
-        }
-        
-        # Yüzde hesapla
-        total = len(self.df)
-        stats['tr_completeness'] = round((stats['tr_titles_filled'] + 
-                                          stats['tr_abstracts_filled'] + 
-                                          stats['tr_keywords_filled']) / (total * 3) * 100, 2)
-        stats['en_completeness'] = round((stats['en_titles_filled'] + 
-                                          stats['en_abstracts_filled'] + 
-                                          stats['en_keywords_filled']) / (total * 3) * 100, 2)
-        
-        return stats
+        return self.profile.language_stats()
     
     def get_text_length_stats(self) -> Dict[str, Any]:
         """
@@ -146,27 +337,12 @@ class CSVAnalyzer:
         if self.df is None:
             return {}
         
-        stats = {}
-        
-        text_columns = ['Title_TR', 'Title_EN', 'Abstract_TR', 'Abstract_EN', 
-                       'Keywords_TR', 'Keywords_EN']
-        
-        for col in text_columns:
-            if col in self.df.columns:
-                # Boş olmayanların uzunluğunu hesapla
-                lengths = self.df[col].dropna().str.len()
-                if len(lengths) > 0:
-                    stats[col] = {
-                        'avg_length': round(lengths.mean(), 2),
-                        'min_length': int(lengths.min()),
-                        'max_length': int(lengths.max())
-                    }
-        
-        return stats
+        return self.profile.text_length_stats()
     
     def get_full_analysis(self) -> Dict[str, Any]:
         """
-        Tüm analizleri birleştirir
+        Tüm analizleri birleştirir (tüm bölümler tek geçişte çıkarılan
+        profilden türetilir)
         
         Returns:
             Tam analiz raporu
@@ -174,22 +350,155 @@ class CSVAnalyzer:
         return {
             'basic_stats': self.get_basic_stats(),
             'missing_values': self.get_missing_values(),
-            'first_rows': self.get_first_n_rows(5),
+            'first_rows': self.get_first_n_rows(FIRST_ROWS),
             'year_distribution': self.get_year_distribution(),
             'language_stats': self.get_language_stats(),
             'text_length_stats': self.get_text_length_stats()
         }
 
 
-def analyze_csv(csv_path: str) -> Dict[str, Any]:
+class StreamingCSVAnalyzer:
+    """
+    CSV dosyasını parça parça okuyarak analiz eden sınıf.
+    
+    Her parçanın profili çıkarılıp birleştirilir; rapor `CSVAnalyzer` ile
+    aynıdır, bellek kullanımı ise dosya boyutuyla değil parça boyutuyla
+    sınırlıdır (birleştirilmiş çok yıllı CSV'ler için).
+    
+    Metin sütunları her parçada metin olarak okunur; diğer sütunların tipi
+    parça başına belirlenir (ilk satırlardaki sayısal değerlerin gösterimi bu
+    nedenle tüm dosyanın okunduğu duruma göre farklılaşabilir).
+    """
+    
+    def __init__(self, csv_path: str, chunksize: int = DEFAULT_CHUNK_ROWS,
+                 columns: Optional[List[str]] = None):
+        """
+        Args:
+            csv_path: Analiz edilecek CSV (veya Parquet/Feather) dosya yolu
+            chunksize: Her seferde okunacak satır sayısı
+            columns: Okunacak sütunlar (None ise tümü)
+        """
+        if not os.path.exists(csv_path):
+            raise FileNotFoundError(f"CSV dosyası bulunamadı: {csv_path}")
+        self.csv_path = csv_path
+        self.chunksize = chunksize
+        self.columns = columns
+        self._profile: Optional[ColumnProfile] = None
+    
+    @property
+    def profile(self) -> ColumnProfile:
+        """Tüm parçaların birleştirilmiş profili (ilk erişimde hesaplanır)"""
+        if self._profile is None:
+            self._profile = self._read_profile()
+        return self._profile
+    
+    def _read_profile(self) -> ColumnProfile:
+        """Dosyayı parça parça okuyup profilleri birleştirir"""
+        profile = ColumnProfile(self.columns or article_columns(self.csv_path))
+        for chunk in iter_article_frames(self.csv_path, self.chunksize, self.columns):
+            first_n = max(0, FIRST_ROWS - len(profile.first_rows))
+            profile.merge(ColumnProfile.from_frame(chunk, first_n))
+        return profile
+    
+    def get_full_analysis(self) -> Dict[str, Any]:
+        """
+        Tüm analizleri birleştirir
+        
+        Returns:
+            Tam analiz raporu (bkz. CSVAnalyzer.get_full_analysis)
+        """
+        return self.profile.report(os.path.getsize(self.csv_path))
+
+
+def analyze_csv(csv_path: str, chunksize: Optional[int] = None) -> Dict[str, Any]:
     """
     CSV dosyasını analiz eder (helper function)
     
     Args:
         csv_path: CSV dosya yolu
+        chunksize: Verilirse dosya bu kadar satırlık parçalarla okunur; None ise
+            STREAMING_THRESHOLD_BYTES'tan büyük dosyalar parça parça okunur
         
     Returns:
         Analiz sonuçları
     """
+    if chunksize is None and os.path.exists(csv_path) \
+            and os.path.getsize(csv_path) > STREAMING_THRESHOLD_BYTES:
+        chunksize = DEFAULT_CHUNK_ROWS
+    if chunksize is not None:
+        return StreamingCSVAnalyzer(csv_path, chunksize).get_full_analysis()
     analyzer = CSVAnalyzer(csv_path)
     return analyzer.get_full_analysis()
+
+
+def analysis_cache_path(csv_path: str) -> str:
+    """CSV dosyasının yanındaki analiz önbelleği yolunu döndürür"""
+    return csv_path + ".analysis.json"
+
+
+def cached_analysis(csv_path: str) -> Dict[str, Any]:
+    """
+    CSV analizini dosyanın yanındaki önbellekten döndürür; önbellek yoksa veya
+    CSV değiştiyse analizi yeniden yapıp kaydeder.
+    
+    Önbellek CSV'nin boyutu ve mtime'ı ile doğrulanır. Bunlar değişmiş ama
+    içerik hash'i aynıysa (dosya aynı içerikle yeniden yazıldıysa) kayıt
+    yeniden kullanılır.
+    
+    Args:
+        csv_path: CSV dosya yolu
+        
+    Returns:
+        Analiz sonuçları (bkz. CSVAnalyzer.get_full_analysis)
+    """
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"CSV dosyası bulunamadı: {csv_path}")
+    
+    cache_path = analysis_cache_path(csv_path)
+    st = os.stat(csv_path)
+    saved = _load_analysis(cache_path)
+    content_hash = None
+    
+    if saved is not None and saved["size"] == st.st_size:
+        if saved["mtime_ns"] == st.st_mtime_ns:
+            return saved["analysis"]
+        content_hash = file_sha256(csv_path)
+        if saved["sha256"] == content_hash:
+            saved["mtime_ns"] = st.st_mtime_ns
+            _save_analysis(cache_path, saved)
+            return saved["analysis"]
+    
+    analysis = analyze_csv(csv_path)
+    _save_analysis(cache_path, {
+        "version": ANALYSIS_VERSION,
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "sha256": content_hash or file_sha256(csv_path),
+        "analysis": analysis,
+    })
+    return analysis
+
+
+def _load_analysis(cache_path: str) -> Optional[Dict[str, Any]]:
+    """Kaydedilmiş analizi okur (yoksa, bozuksa veya sürümü farklıysa None)"""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if saved.get("version") != ANALYSIS_VERSION:
+        return None
+    return saved
+
+
+def _save_analysis(cache_path: str, payload: Dict[str, Any]):
+    """Analizi atomik olarak kaydeder"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(cache_path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
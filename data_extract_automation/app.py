@@ -1,15 +1,21 @@
-from flask import Flask, render_template, request, send_file, jsonify
+from flask import Flask, Request, Response, render_template, request, send_file, jsonify
 from werkzeug.utils import secure_filename
+import json
 import os
 import tempfile
-import uuid
+import time
 from pathlib import Path
 import sys
 
 # data_extract ve analysis modüllerini import et
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from data_extract import PDFProcessor
-from analysis import analyze_csv
+from data_extract import PDFProcessor, default_cache, extractor_fingerprint
+from cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES
+from instrumentation import profiled, default_profile_path
+from analysis import cached_analysis
+from jobs import JobQueue, JobQueueFull, QUEUED, RUNNING, DONE, FAILED, report_progress
+from store import ResultStore, StoreJanitor
+from uploads import SpooledUpload
 
 # Flask uygulaması
 app = Flask(__name__)
@@ -18,6 +24,42 @@ app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB max file size
 app.config['UPLOAD_FOLDER'] = tempfile.gettempdir()
 app.config['SECRET_KEY'] = 'lift-up-dataset-extraction-2026'
+# "cprofile" veya "pyinstrument" ise her işlem profillenir (çıktı geçici dizine yazılır)
+app.config['PROFILE'] = os.environ.get('LIFT_UP_PROFILE') or None
+# Arka plan iş kuyruğu: aynı anda çalışan iş ve ek olarak bekleyebilecek iş sayısı
+app.config['JOB_WORKERS'] = int(os.environ.get('LIFT_UP_JOB_WORKERS', 2))
+app.config['JOB_QUEUE_LIMIT'] = int(os.environ.get('LIFT_UP_JOB_QUEUE_LIMIT', 8))
+# /events akışında durum kontrol aralığı ve değişiklik yokken gönderilen keep-alive aralığı (saniye)
+app.config['EVENTS_INTERVAL'] = 0.5
+app.config['EVENTS_KEEPALIVE'] = 15
+# Bu boyuta kadar olan yüklemeler bellekte tutulur ve diske hiç yazılmaz
+app.config['UPLOAD_SPOOL_BYTES'] = int(os.environ.get('LIFT_UP_UPLOAD_SPOOL_MB', 8)) * 1024 * 1024
+# Çıkarım sonuç önbelleği (PDF içerik hash'i + yıl ile anahtarlanır)
+app.config['RESULT_CACHE_DIR'] = os.environ.get('LIFT_UP_CACHE_DIR', DEFAULT_CACHE_DIR)
+app.config['RESULT_CACHE_MAX_BYTES'] = DEFAULT_MAX_BYTES
+# lift_up_* çıktı dizinleri deposu: toplam boyut sınırı ve son erişimden sonraki ömür
+app.config['RESULT_STORE_MAX_BYTES'] = int(os.environ.get('LIFT_UP_STORE_MAX_MB', 1024)) * 1024 * 1024
+app.config['RESULT_STORE_TTL'] = float(os.environ.get('LIFT_UP_STORE_TTL_HOURS', 24)) * 3600
+# Depo sınırlarını arka planda uygulayan temizlik taramalarının aralığı (saniye, 0 ise kapalı)
+app.config['JANITOR_INTERVAL'] = float(os.environ.get('LIFT_UP_JANITOR_INTERVAL', 300))
+
+job_queue = JobQueue(max_workers=app.config['JOB_WORKERS'],
+                     max_queued=app.config['JOB_QUEUE_LIMIT'])
+result_cache = default_cache(app.config['RESULT_CACHE_DIR'], app.config['RESULT_CACHE_MAX_BYTES'])
+result_store = ResultStore(app.config['UPLOAD_FOLDER'], app.config['RESULT_STORE_MAX_BYTES'],
+                           app.config['RESULT_STORE_TTL'], extractor_fingerprint())
+janitor = StoreJanitor(result_store, app.config['JANITOR_INTERVAL'], keep=job_queue.active_ids)
+
+
+class UploadRequest(Request):
+    """Yüklenen dosyayı form ayrıştırılırken hash'leyen istek sınıfı (bkz. SpooledUpload)"""
+    
+    def _get_file_stream(self, total_content_length, content_type, filename=None,
+                         content_length=None):
+        return SpooledUpload(app.config['UPLOAD_SPOOL_BYTES'], app.config['UPLOAD_FOLDER'])
+
+
+app.request_class = UploadRequest
 
 # İzin verilen dosya uzantıları
 ALLOWED_EXTENSIONS = {'pdf'}
@@ -28,19 +70,103 @@ def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+@app.before_request
+def start_janitor():
+    """Temizlik thread'ini ilk istekte başlatır (iş süreçlerinde başlamaması için)"""
+    if app.config['JANITOR_INTERVAL'] > 0:
+        janitor.start()
+
+
 @app.route('/')
 def index():
     """Ana sayfa"""
     return render_template('index.html')
 
 
+def run_extraction(pdf_path, year, csv_path, temp_id, profile_kind=None,
+                   content=None, content_hash=None, cache=None, store=None):
+    """
+    Arka plan sürecinde PDF'i işler (pickle edilebilmesi için modül seviyesinde)
+    
+    Args:
+        content: Bellekteki PDF içeriği (küçük yüklemeler diske yazılmaz)
+        content_hash: Yükleme sırasında hesaplanan SHA-256 hash'i
+        cache: Sonuç önbelleği
+        store: Çıktı dizinleri deposu (sonuç, aynı PDF'in sonraki yüklemeleri için kaydedilir)
+    
+    Returns:
+        /result yanıtında döndürülecek sonuç bilgisi
+    """
+    # İş kimliği geçici dizin kimliğiyle aynıdır; ilerleme /events akışına iletilir
+    processor = PDFProcessor(cache=cache, progress=lambda info: report_progress(temp_id, info))
+    profile_path = None
+    if profile_kind:
+        profile_path = default_profile_path(profile_kind, os.path.join(os.path.dirname(pdf_path), 'profile'))
+    try:
+        with profiled(profile_kind, profile_path):
+            articles = processor.process_pdf(pdf_path, year, csv_path,
+                                             content=content, content_hash=content_hash)
+    except BaseException:
+        # Yarım kalan çıktı sonraki yüklemelerde yeniden kullanılmamalı
+        if store is not None:
+            store.remove(temp_id)
+        raise
+    
+    result = extraction_result(processor, articles, csv_path, temp_id)
+    if profile_path:
+        result['profile_filename'] = os.path.basename(profile_path)
+    # Analiz iş bitince hazırlanır; /analyze istekleri CSV'yi ayrıştırmaz
+    try:
+        cached_analysis(csv_path)
+    except Exception as e:
+        print(f"⚠️  Analiz hazırlanamadı: {e}")
+    
+    if store is not None:
+        # Tekrar yüklemeler içerik hash'iyle eşleştiğinden PDF'in saklanmasına gerek yok
+        if os.path.exists(pdf_path):
+            os.remove(pdf_path)
+        store.put(temp_id, result)
+    return result
+
+
+def extraction_result(processor, articles, csv_path, temp_id):
+    """/result yanıtında döndürülecek sonuç bilgisi"""
+    return {
+        'success': True,
+        'article_count': len(articles),
+        'csv_path': csv_path,
+        'csv_filename': os.path.basename(csv_path),
+        'temp_id': temp_id,
+        'stats': processor.stats.to_dict()
+    }
+
+
+def job_response(job):
+    """/process yanıtındaki iş bilgisi ve uç noktaları"""
+    return {
+        'success': True,
+        'job_id': job.id,
+        'status': job.status,
+        'status_url': f'/status/{job.id}',
+        'events_url': f'/events/{job.id}',
+        'result_url': f'/result/{job.id}'
+    }
+
+
 @app.route('/process', methods=['POST'])
 def process_pdf():
     """
-    PDF dosyasını işler ve CSV çıktısı oluşturur
+    PDF dosyasını kaydeder ve işlenmek üzere kuyruğa ekler
+    
+    Yükleme form ayrıştırılırken hash'lenir (bkz. UploadRequest). İş kimliği
+    ve çıktı dizini içerik hash'i + yıldan türetilir: aynı PDF'in tekrar
+    yüklenmesi mevcut sonucu döndürür, eşzamanlı aynı yüklemeler tek işi
+    paylaşır. Sonucu önbellekte olan PDF'ler kuyruğa alınmadan yanıtlanır.
+    Küçük yüklemeler bellekten işlenir, büyükler çıktı dizinine bir kez taşınır.
     
     Returns:
-        JSON response with success status and file info or error message
+        202 ve iş kimliği; durum /status/<job_id> veya /events/<job_id> (SSE),
+        sonuç /result/<job_id> ile sorgulanır (sonuç hazırsa 200)
     """
     try:
         # Dosya kontrolü
@@ -58,34 +184,66 @@ def process_pdf():
         
         # Güvenli dosya adı oluştur
         filename = secure_filename(file.filename)
-        unique_id = str(uuid.uuid4())[:8]
         
-        # Geçici dizin oluştur
-        temp_dir = os.path.join(app.config['UPLOAD_FOLDER'], f'lift_up_{unique_id}')
-        os.makedirs(temp_dir, exist_ok=True)
+        # Yükleme ayrıştırılırken hash'lendi (özel istek sınıfı kullanılmadıysa burada kopyalanır)
+        upload = file.stream
+        if not isinstance(upload, SpooledUpload):
+            upload = SpooledUpload.from_stream(upload, app.config['UPLOAD_SPOOL_BYTES'],
+                                               app.config['UPLOAD_FOLDER'])
         
-        # PDF'i kaydet
+        # İş kimliği = çıktı dizini kimliği = içerik hash'i + yıl anahtarı
+        unique_id = result_store.key(upload.sha256, year)
+        
+        # Aynı PDF işleniyorsa mevcut işe katıl
+        job = job_queue.get(unique_id)
+        if job is not None and job.status in (QUEUED, RUNNING):
+            return jsonify(job_response(job)), 202
+        
+        # Aynı PDF daha önce işlendiyse mevcut CSV'yi döndür
+        stored = result_store.get(unique_id)
+        if stored is not None:
+            job = job_queue.complete(stored, job_id=unique_id)
+            return jsonify(job_response(job)), 200
+        
+        # Çıktı dizini oluştur
+        temp_dir = result_store.create(unique_id)
         pdf_path = os.path.join(temp_dir, filename)
-        file.save(pdf_path)
         
         # CSV çıktı yolu
         csv_filename = f"{Path(filename).stem}_extracted.csv"
         csv_path = os.path.join(temp_dir, csv_filename)
         
-        # PDF'i işle
-        processor = PDFProcessor()
-        articles = processor.process_pdf(pdf_path, year, csv_path)
+        # Sonuç önbellekteyse PDF'i açmadan CSV'yi yaz ve hemen yanıtla
+        processor = PDFProcessor(cache=result_cache)
+        articles = processor.process_cached(pdf_path, year, csv_path, upload.sha256)
+        if articles is not None:
+            result = extraction_result(processor, articles, csv_path, unique_id)
+            result_store.put(unique_id, result)
+            job = job_queue.complete(result, job_id=unique_id)
+            return jsonify(job_response(job)), 200
         
-        # Sonuç bilgisi
-        result = {
-            'success': True,
-            'article_count': len(articles),
-            'csv_path': csv_path,
-            'csv_filename': csv_filename,
-            'temp_id': unique_id
-        }
+        # Küçük yüklemeler bellekten işlenir; büyükler geçici dizine taşınır
+        content = upload.getvalue() if upload.in_memory else None
+        if content is None:
+            upload.persist(pdf_path)
         
-        return jsonify(result), 200
+        # İşi kuyruğa ekle (aynı kimlikli iş bu arada eklendiyse o iş döner)
+        try:
+            job = job_queue.submit(run_extraction, pdf_path, year, csv_path, unique_id,
+                                   app.config['PROFILE'], content, upload.sha256, result_cache,
+                                   result_store, job_id=unique_id)
+        except JobQueueFull:
+            result_store.remove(unique_id)
+            return jsonify({
+                'success': False,
+                'error': 'Sunucu şu anda meşgul, lütfen biraz sonra tekrar deneyin'
+            }), 503
+        except Exception:
+            # İş kuyruğa alınamadıysa çıktı dizini janitor'a kalmadan silinir
+            result_store.remove(unique_id)
+            raise
+        
+        return jsonify(job_response(job)), 202
         
     except Exception as e:
         import traceback
@@ -97,6 +255,87 @@ def process_pdf():
         }), 500
 
 
+@app.route('/status/<job_id>')
+def job_status(job_id):
+    """
+    İşin durumunu döndürür (queued, running, done, failed)
+    
+    Args:
+        job_id: İş kimliği
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'İş bulunamadı'}), 404
+    
+    return jsonify({'success': True, **job.to_dict()}), 200
+
+
+@app.route('/result/<job_id>')
+def job_result(job_id):
+    """
+    Biten işin sonucunu döndürür; iş sürüyorsa 202 döner
+    
+    Args:
+        job_id: İş kimliği
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'İş bulunamadı'}), 404
+    
+    status = job.status
+    if status == DONE:
+        return jsonify(job.result), 200
+    if status == FAILED:
+        return jsonify({
+            'success': False,
+            'error': f'İşleme hatası: {job.error}'
+        }), 500
+    
+    return jsonify({'success': True, **job.to_dict()}), 202
+
+
+@app.route('/events/<job_id>')
+def job_events(job_id):
+    """
+    İşin durumunu ve ilerlemesini Server-Sent Events olarak akıtır
+    
+    Her değişiklikte /status yanıtıyla aynı yapıda bir olay gönderilir;
+    iş bitince (done/failed) akış kapanır.
+    
+    Args:
+        job_id: İş kimliği
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'İş bulunamadı'}), 404
+    
+    interval = app.config['EVENTS_INTERVAL']
+    keepalive = app.config['EVENTS_KEEPALIVE']
+    
+    def stream():
+        last_payload = None
+        last_sent = time.monotonic()
+        while True:
+            info = job.to_dict()
+            payload = json.dumps({'success': True, **info}, ensure_ascii=False)
+            if payload != last_payload:
+                yield f'data: {payload}\n\n'
+                last_payload = payload
+                last_sent = time.monotonic()
+            elif time.monotonic() - last_sent >= keepalive:
+                # Proxy'lerin boşta kalan bağlantıyı kapatmaması için
+                yield ': keep-alive\n\n'
+                last_sent = time.monotonic()
+            if info['status'] in (DONE, FAILED):
+                return
+            time.sleep(interval)
+    
+    return Response(stream(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+
 @app.route('/download/<temp_id>/<filename>')
 def download_csv(temp_id, filename):
     """
@@ -109,12 +348,13 @@ def download_csv(temp_id, filename):
     try:
         # Güvenli dosya yolu oluştur
         safe_filename = secure_filename(filename)
-        temp_dir = os.path.join(app.config['UPLOAD_FOLDER'], f'lift_up_{temp_id}')
+        temp_dir = result_store.path(temp_id)
         csv_path = os.path.join(temp_dir, safe_filename)
         
         # Dosya var mı kontrol et
         if not os.path.exists(csv_path):
             return jsonify({'error': 'Dosya bulunamadı'}), 404
+        result_store.touch(temp_id)
         
         # Dosyayı gönder
         return send_file(
@@ -143,15 +383,16 @@ def analyze(temp_id, filename):
     try:
         # Güvenli dosya yolu oluştur
         safe_filename = secure_filename(filename)
-        temp_dir = os.path.join(app.config['UPLOAD_FOLDER'], f'lift_up_{temp_id}')
+        temp_dir = result_store.path(temp_id)
         csv_path = os.path.join(temp_dir, safe_filename)
         
         # Dosya var mı kontrol et
         if not os.path.exists(csv_path):
             return jsonify({'error': 'Dosya bulunamadı'}), 404
         
-        # Analiz yap
-        analysis_result = analyze_csv(csv_path)
+        # Analiz yap (CSV değişmediyse yanındaki kayıttan okunur)
+        analysis_result = cached_analysis(csv_path)
+        result_store.touch(temp_id)
         
         return jsonify({
             'success': True,
@@ -170,17 +411,15 @@ def analyze(temp_id, filename):
 @app.route('/cleanup/<temp_id>', methods=['POST'])
 def cleanup(temp_id):
     """
-    Geçici dosyaları temizler
+    Geçici dosyaları temizler (aynı PDF için çalışan iş varsa dizin korunur)
     
     Args:
         temp_id: Geçici dizin ID'si
     """
     try:
-        temp_dir = os.path.join(app.config['UPLOAD_FOLDER'], f'lift_up_{temp_id}')
-        
-        if os.path.exists(temp_dir):
-            import shutil
-            shutil.rmtree(temp_dir)
+        job = job_queue.get(temp_id)
+        if job is None or job.status not in (QUEUED, RUNNING):
+            result_store.remove(temp_id)
             
         return jsonify({'success': True, 'message': 'Dosyalar temizlendi'}), 200
         
@@ -188,6 +427,21 @@ def cleanup(temp_id):
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/metrics')
+def metrics():
+    """
+    Çıktı deposu ve iş kuyruğu metrikleri
+    
+    Returns:
+        Depoda tutulan byte/dizin sayısı, silinen dizinler ve iş kuyruğu durumu
+    """
+    return jsonify({
+        'success': True,
+        'store': janitor.metrics(),
+        'jobs': job_queue.stats()
+    }), 200
+
+
 @app.errorhandler(413)
 def request_entity_too_large(error):
     """Dosya boyutu çok büyük hatası"""
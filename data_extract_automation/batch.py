@@ -0,0 +1,165 @@
+"""
+Batch Processing Module for LIFT UP Dataset
+===========================================
+Birden fazla PDF dosyasını sınırlı bir süreç havuzunda paralel işler
+"""
+
+import multiprocessing
+import queue
+import time
+import traceback
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class BatchResult:
+    """Tek bir PDF işinin sonucu"""
+    pdf_path: str
+    pages: int = 0
+    articles: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+    stats: Optional[Dict[str, Any]] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _run_job(job_fn: Callable[..., Dict[str, int]], index: int, args: Tuple,
+             results: "multiprocessing.Queue"):
+    """Alt süreçte tek bir işi çalıştırır ve sonucu kuyruğa yazar"""
+    started = time.perf_counter()
+    try:
+        summary = job_fn(*args)
+        results.put((index, summary, None, time.perf_counter() - started))
+    except BaseException as e:
+        traceback.print_exc()
+        results.put((index, None, f"{type(e).__name__}: {e}", time.perf_counter() - started))
+
+
+def run_batch(job_fn: Callable[..., Dict[str, int]], jobs: List[Tuple[str, Tuple]],
+              max_workers: int, timeout: Optional[float] = None,
+              poll_interval: float = 0.2) -> List[BatchResult]:
+    """
+    İşleri, aynı anda en fazla `max_workers` süreç çalışacak şekilde işler.
+
+    Her iş kendi sürecinde çalışır; bir dosyanın çökmesi veya zaman aşımına
+    uğraması diğer dosyaların sonuçlarını etkilemez.
+
+    Args:
+        job_fn: Modül seviyesinde iş fonksiyonu; {"pages": int, "articles": int} döndürmeli
+            (isteğe bağlı "stats" anahtarı BatchResult.stats alanına aktarılır)
+        jobs: (pdf_path, job_fn argümanları) listesi
+        max_workers: Aynı anda çalışacak maksimum süreç sayısı
+        timeout: Dosya başına maksimum süre (saniye, None ise sınırsız)
+        poll_interval: Süreç durumu kontrol aralığı (saniye)
+
+    Returns:
+        İş sırasıyla BatchResult listesi
+    """
+    results: List[BatchResult] = [BatchResult(pdf_path=pdf) for pdf, _ in jobs]
+    done = [False] * len(jobs)
+    result_queue = multiprocessing.Queue()
+    pending = list(range(len(jobs)))
+    running: Dict[int, Tuple[multiprocessing.Process, float]] = {}
+
+    def record(message):
+        index, summary, error, seconds = message
+        result = results[index]
+        result.seconds = seconds
+        if error is not None:
+            result.error = error
+        else:
+            result.pages = int(summary.get("pages", 0))
+            result.articles = int(summary.get("articles", 0))
+            result.stats = summary.get("stats")
+        done[index] = True
+
+    def drain(block_for: float = 0.0):
+        try:
+            message = result_queue.get(timeout=block_for) if block_for else result_queue.get_nowait()
+            while True:
+                record(message)
+                message = result_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    while pending or running:
+        # Boş slot varsa yeni süreç başlat
+        while pending and len(running) < max_workers:
+            index = pending.pop(0)
+            process = multiprocessing.Process(
+                target=_run_job, args=(job_fn, index, jobs[index][1], result_queue), daemon=True
+            )
+            process.start()
+            running[index] = (process, time.perf_counter())
+
+        drain(poll_interval)
+
+        now = time.perf_counter()
+        for index, (process, started) in list(running.items()):
+            if done[index]:
+                process.join()
+                del running[index]
+            elif not process.is_alive():
+                # Kuyruğa yazılmış ama henüz okunmamış sonuç olabilir
+                drain(poll_interval)
+                if not done[index]:
+                    results[index].error = f"Süreç beklenmedik şekilde sonlandı (exit code {process.exitcode})"
+                    results[index].seconds = now - started
+                    done[index] = True
+                process.join()
+                del running[index]
+            elif timeout is not None and now - started > timeout:
+                process.terminate()
+                process.join()
+                results[index].error = f"Zaman aşımı ({timeout:g} sn)"
+                results[index].seconds = now - started
+                done[index] = True
+                del running[index]
+
+    result_queue.close()
+    return results
+
+
+def summarize(results: List[BatchResult], wall_seconds: float) -> Dict[str, Any]:
+    """
+    Batch sonuçlarını toplu özet haline getirir.
+
+    Args:
+        results: BatchResult listesi
+        wall_seconds: Toplam geçen süre
+
+    Returns:
+        Özet bilgileri
+    """
+    pages = sum(r.pages for r in results)
+    return {
+        'files': len(results),
+        'succeeded': sum(1 for r in results if r.ok),
+        'failed': sum(1 for r in results if not r.ok),
+        'pages': pages,
+        'articles': sum(r.articles for r in results),
+        'seconds': round(wall_seconds, 2),
+        'pages_per_sec': round(pages / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+    }
+
+
+def print_summary(results: List[BatchResult], wall_seconds: float):
+    """Batch sonuçlarını ve toplu özeti yazdırır"""
+    print(f"\n{'='*80}")
+    print("BATCH ÖZETİ")
+    print(f"{'='*80}")
+    for r in results:
+        if r.ok:
+            print(f"✅ {r.pdf_path}: {r.pages} sayfa, {r.articles} makale, {r.seconds:.1f} sn")
+        else:
+            print(f"❌ {r.pdf_path}: {r.error} ({r.seconds:.1f} sn)")
+
+    summary = summarize(results, wall_seconds)
+    print(f"{'-'*80}")
+    print(f"Dosya: {summary['files']} (başarılı: {summary['succeeded']}, hatalı: {summary['failed']})")
+    print(f"Sayfa: {summary['pages']} | Makale: {summary['articles']} | "
+          f"Süre: {summary['seconds']} sn | Hız: {summary['pages_per_sec']} sayfa/sn")
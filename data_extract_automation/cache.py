@@ -0,0 +1,152 @@
+"""
+Result Cache Module for LIFT UP Dataset
+=======================================
+Çıkarım sonuçlarını PDF içerik hash'i ve çıkarıcı parmak izi ile diskte saklar
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+
+# Varsayılan önbellek dizini ve boyut sınırı
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "lift_up")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256MB
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Dosyanın SHA-256 içerik hash'ini parça parça okuyarak hesaplar.
+
+    Args:
+        path: Dosya yolu
+        chunk_size: Okuma parçası boyutu (byte)
+
+    Returns:
+        Hex formatında hash
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    İçerik hash'i ile anahtarlanan, boyutu sınırlı disk önbelleği.
+
+    Her kayıt ayrı bir JSON dosyasıdır; son erişim zamanı dosyanın mtime'ı ile
+    tutulur ve toplam boyut `max_bytes`'ı aşınca en eski erişilen kayıtlar
+    silinir (LRU).
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR,
+                 max_bytes: int = DEFAULT_MAX_BYTES, fingerprint: str = ""):
+        """
+        Args:
+            cache_dir: Önbellek dizini
+            max_bytes: Önbelleğin toplam maksimum boyutu (byte)
+            fingerprint: Çıkarıcı sürüm/konfigürasyon parmak izi
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.fingerprint = fingerprint
+
+    def key(self, content_hash: str, *parts: str) -> str:
+        """İçerik hash'i, parmak izi ve ek parçalardan kayıt anahtarı üretir"""
+        raw = "|".join((content_hash, self.fingerprint) + parts)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Kaydı okur ve son erişim zamanını günceller.
+
+        Args:
+            key: Kayıt anahtarı
+
+        Returns:
+            Kayıt içeriği veya bulunamazsa None
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            os.utime(path, None)
+            return payload
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def put(self, key: str, payload: Dict[str, Any]):
+        """
+        Kaydı atomik olarak yazar ve gerekirse eski kayıtları siler.
+
+        Args:
+            key: Kayıt anahtarı
+            payload: JSON'a çevrilebilir kayıt içeriği
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._evict()
+
+    def _entries(self):
+        """(mtime, boyut, yol) listesini döndürür"""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def _evict(self):
+        """Toplam boyut sınırı aşıldıysa en eski erişilen kayıtları siler"""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def size_bytes(self) -> int:
+        """Önbelleğin toplam boyutu"""
+        return sum(size for _, size, _ in self._entries())
+
+    def clear(self) -> int:
+        """
+        Tüm kayıtları siler.
+
+        Returns:
+            Silinen kayıt sayısı
+        """
+        removed = 0
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
@@ -1,10 +1,25 @@
 import fitz
-import re
 import csv
 import os
 import glob
-from typing import Optional, Tuple, List, Dict
-from dataclasses import dataclass
+import math
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional, Tuple, List, Dict, Iterator
+from dataclasses import dataclass, asdict
+
+import patterns
+from batch import BatchResult, run_batch, print_summary
+from cache import ResultCache, file_sha256, DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES
+from manifest import ExtractionManifest
+from outputs import DEFAULT_FORMAT, OUTPUT_FORMATS, check_format, output_path, write_articles
+from instrumentation import (ExtractionStats, NULL_STATS, PROFILERS, default_profile_path,
+                             profiled, save_report)
+
+
+# Çıkarım mantığı değiştiğinde artırılmalı (önbellek kayıtlarını geçersiz kılar)
+EXTRACTOR_VERSION = "1"
 
 
 # ====================================================================
@@ -22,6 +37,7 @@ class Article:
     abstract_en: str
     keywords_tr: str
     keywords_en: str
+    end_page: Optional[int] = None
     
     def to_dict(self) -> Dict[str, any]:
         """Makale verisini dictionary'ye çevirir (CSV için)"""
@@ -37,6 +53,22 @@ class Article:
         }
 
 
+@dataclass
+class ArticleSpan:
+    """Bir makalenin döküman içindeki sayfa aralığı (0 tabanlı, uçlar dahil)"""
+    start_idx: int
+    end_idx: int
+    
+    @property
+    def page_count(self) -> int:
+        """Aralıktaki sayfa sayısı"""
+        return self.end_idx - self.start_idx + 1
+    
+    def window(self, limit: int) -> range:
+        """Başlangıçtan itibaren en fazla `limit` sayfalık indeks aralığı"""
+        return range(self.start_idx, min(self.end_idx + 1, self.start_idx + limit))
+
+
 # ====================================================================
 # TEXT UTILITIES
 # ====================================================================
@@ -59,7 +91,7 @@ class TextUtils:
         """
         if not text:
             return ""
-        text = re.sub(r"\s+", " ", text)
+        text = patterns.WHITESPACE.sub(" ", text)
         return text.strip()
     
     @classmethod
@@ -73,7 +105,7 @@ class TextUtils:
         Returns:
             True/False
         """
-        return any(c in cls.TR_CHARS for c in text)
+        return not cls.TR_CHARS.isdisjoint(text)
     
     @classmethod
     def looks_english_line(cls, text: str) -> bool:
@@ -100,6 +132,122 @@ class TextUtils:
         return any(hint in low for hint in english_hints)
 
 
+# ====================================================================
+# PAGE TEXT STORE
+# ====================================================================
+
+class PageTextStore:
+    """
+    Döküman kapsamlı sayfa metni deposu.
+    
+    Her sayfanın metni ilk istendiğinde çıkarılır ve saklanır; aynı sayfa
+    tekrar istendiğinde `get_text()` yeniden çağrılmaz.
+    
+    Metin bir TextPage üzerinden çıkarılır. Son çıkarılan sayfanın TextPage'i
+    geçici olarak tutulur; makale başlangıcı olan sayfalarınki `keep_textpage`
+    ile saklanıp başlık çıkarımında yeniden kullanılır (sayfa ikinci kez
+    ayrıştırılmaz).
+    """
+    
+    def __init__(self, doc, stats: ExtractionStats = NULL_STATS):
+        """
+        Args:
+            doc: PDF dökümanı (fitz.Document)
+            stats: Metin çıkarım süresinin yazılacağı istatistik nesnesi
+        """
+        self.doc = doc
+        self.extraction_stats = stats
+        self._texts: Dict[int, str] = {}
+        # Son çıkarılan sayfa: (indeks, page, TextPage)
+        self._last_textpage: Optional[Tuple[int, Any, Any]] = None
+        # Başlangıç sayfaları: indeks -> (page, TextPage)
+        self._textpages: Dict[int, Tuple[Any, Any]] = {}
+        self.text_calls = 0
+        self.extractions = 0
+    
+    def __len__(self) -> int:
+        return len(self.doc)
+    
+    def page(self, idx: int):
+        """PyMuPDF page objesini döndürür (TextPage'i saklanmışsa onunla aynı obje)"""
+        kept = self._textpages.get(idx)
+        return kept[0] if kept is not None else self.doc[idx]
+    
+    def text(self, idx: int) -> str:
+        """
+        Sayfa metnini döndürür (gerekirse çıkarır).
+        
+        Args:
+            idx: Sayfa indeksi
+            
+        Returns:
+            Sayfa metni
+        """
+        self.text_calls += 1
+        text = self._texts.get(idx)
+        if text is None:
+            with self.extraction_stats.stage("page_text"):
+                page = self.doc[idx]
+                textpage = page.get_textpage(flags=fitz.TEXTFLAGS_TEXT)
+                text = page.get_text("text", textpage=textpage)
+                # Önceki TextPage burada serbest kalır
+                self._last_textpage = (idx, page, textpage)
+            self._texts[idx] = text
+            self.extractions += 1
+        return text
+    
+    def release(self, before_idx: int):
+        """
+        Verilen indeksten önceki sayfaların metinlerini bellekten atar.
+        
+        Akış modunda işlenmiş makalelerin sayfaları tutulmaz; böylece bellek
+        kullanımı kitap boyutuyla büyümez.
+        """
+        for idx in [i for i in self._texts if i < before_idx]:
+            del self._texts[idx]
+        for idx in [i for i in self._textpages if i < before_idx]:
+            del self._textpages[idx]
+    
+    def keep_textpage(self, idx: int):
+        """
+        Sayfanın TextPage'ini başlık çıkarımı için saklar.
+        
+        Yalnızca son çıkarılan sayfa için etkilidir; TextPage artık yoksa
+        (ör. metin daha önce çıkarılmışsa) bir şey yapmaz.
+        """
+        last = self._last_textpage
+        if last is not None and last[0] == idx:
+            self._textpages[idx] = (last[1], last[2])
+    
+    def take_textpage(self, idx: int):
+        """
+        Saklanan TextPage'i depodan çıkararak döndürür.
+        
+        Returns:
+            TextPage veya saklanmamışsa None
+        """
+        kept = self._textpages.pop(idx, None)
+        return kept[1] if kept is not None else None
+    
+    @property
+    def unique_pages(self) -> int:
+        """Metni gerçekten çıkarılan sayfa sayısı"""
+        return self.extractions
+    
+    def stats(self) -> Dict[str, int]:
+        """Metin isteği ve gerçek çıkarım sayaçlarını döndürür"""
+        return {
+            "text_calls": self.text_calls,
+            "unique_pages": self.unique_pages,
+            "saved_extractions": self.text_calls - self.unique_pages,
+        }
+    
+    @classmethod
+    def wrap(cls, doc) -> "PageTextStore":
+        """Verilen nesne zaten bir depo ise aynen, değilse sarmalanmış olarak döndürür"""
+        return doc if isinstance(doc, cls) else cls(doc)
+
+
 # ====================================================================
 # PAGE ANALYZER
 # ====================================================================
@@ -119,40 +267,86 @@ class PageAnalyzer:
             True ise yeni makale başlangıcı
         """
         return ("Özetçe" in text) and ("Abstract" in text)
+
+
+# ====================================================================
+# ARTICLE SEGMENTER
+# ====================================================================
+
+class ArticleSegmenter:
+    """Dökümanı tek doğrusal geçişte makale aralıklarına bölen sınıf"""
     
-    @staticmethod
-    def collect_until_markers(doc, start_idx: int, stop_markers: List[str], 
-                            hard_limit: int = 8) -> str:
+    def __init__(self, stats: ExtractionStats = NULL_STATS):
+        self.page_analyzer = PageAnalyzer()
+        self.stats = stats
+    
+    def _is_start(self, pages: PageTextStore, idx: int) -> bool:
+        """Başlangıç sayfası kontrolü (süre ve taranan sayfa sayacıyla)"""
+        self.stats.count("pages_scanned")
+        with self.stats.stage("start_detection"):
+            return self.page_analyzer.is_article_start_page(pages.text(idx))
+    
+    def iter_spans(self, pages: PageTextStore, start: int = 0,
+                   stop: Optional[int] = None, lookahead: int = 0) -> Iterator[ArticleSpan]:
         """
-        Belirli bir sayfadan başlayarak, durma işaretçilerine kadar olan metni toplar.
+        Sayfaları bir kez tarar ve makale aralıklarını sırayla üretir.
+        
+        Bir makale, bir sonraki makale başlangıcından önceki sayfada
+        (veya taranan bölümün son sayfasında) biter. `lookahead` verilirse son
+        makale, başlangıcından itibaren en fazla `lookahead` sayfa olacak şekilde
+        taranan bölümün dışına uzatılır (paralel işlemede parça sınırını aşan
+        makaleler için).
         
         Args:
-            doc: PDF dökümanı
-            start_idx: Başlangıç sayfa indeksi
-            stop_markers: Durma işaretçileri listesi
-            hard_limit: Maksimum kaç sayfa toplanacak
+            pages: Sayfa metni deposu
+            start: Taramanın başlayacağı sayfa indeksi
+            stop: Taramanın biteceği sayfa indeksi (hariç, None ise döküman sonu)
+            lookahead: Son makale için bölüm dışına bakılacak maksimum pencere
             
-        Returns:
-            Birleştirilmiş metin
+        Yields:
+            ArticleSpan nesneleri (sayfa sırasıyla)
         """
-        parts = []
-        analyzer = PageAnalyzer()
+        if stop is None:
+            stop = len(pages)
         
-        for i in range(start_idx, min(len(doc), start_idx + hard_limit)):
-            page_text = doc[i].get_text()
-            
-            # Yeni makale başladıysa dur
-            if i > start_idx and analyzer.is_article_start_page(page_text):
-                break
-                
-            parts.append(page_text)
+        current_start = None
+        for idx in range(start, stop):
+            if not self._is_start(pages, idx):
+                continue
+            if current_start is not None:
+                yield ArticleSpan(current_start, idx - 1)
+            current_start = idx
+            pages.keep_textpage(idx)
+        
+        if current_start is not None:
+            end_idx = stop - 1
+            for idx in range(stop, min(len(pages), current_start + lookahead)):
+                if self._is_start(pages, idx):
+                    break
+                end_idx = idx
+            yield ArticleSpan(current_start, end_idx)
+    
+    def segment(self, pages: PageTextStore) -> List[ArticleSpan]:
+        """Tüm dökümanın makale aralıklarını liste olarak döndürür"""
+        return list(self.iter_spans(pages))
+    
+    def span_at(self, pages: PageTextStore, start_idx: int, limit: int) -> ArticleSpan:
+        """
+        Başlangıç sayfası bilinen tek bir makalenin aralığını (en fazla `limit` sayfa) bulur.
+        
+        Args:
+            pages: Sayfa metni deposu
+            start_idx: Makale başlangıç sayfası indeksi
+            limit: Aralığın bakılacak maksimum sayfa sayısı
             
-            # Durma işaretçilerini kontrol et
-            low = page_text.lower()
-            if any(marker.lower() in low for marker in stop_markers):
-                break
-                
-        return "\n".join(parts)
+        Returns:
+            ArticleSpan (uzunluğu `limit` ile sınırlı)
+        """
+        end = min(len(pages), start_idx + limit)
+        for idx in range(start_idx + 1, end):
+            if self._is_start(pages, idx):
+                return ArticleSpan(start_idx, idx - 1)
+        return ArticleSpan(start_idx, end - 1)
 
 
 # ====================================================================
@@ -162,31 +356,31 @@ class PageAnalyzer:
 class AbstractExtractor:
     """Özet ve anahtar kelime çıkarma sınıfı"""
     
-    def __init__(self):
+    # Bir özet/anahtar kelime penceresinin yayılabileceği maksimum sayfa sayısı
+    MAX_WINDOW_PAGES = 8
+    
+    def __init__(self, stats: ExtractionStats = NULL_STATS):
         self.text_utils = TextUtils()
+        self.stats = stats
     
-    def extract_abstract_tr(self, text: str) -> str:
+    def extract_abstract_tr(self, text: patterns.Text) -> str:
         """Türkçe özeti çıkarır"""
-        pattern = r"Özetçe\s*[—\-–]+\s*(.*?)\s*(?=Anahtar\s*Kelimeler)"
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+        match = patterns.search("abstract_tr", text)
         return self.text_utils.clean_text(match.group(1)) if match else ""
     
-    def extract_abstract_en(self, text: str) -> str:
+    def extract_abstract_en(self, text: patterns.Text) -> str:
         """İngilizce özeti çıkarır"""
-        pattern = r"Abstract\s*[—\-–]+\s*(.*?)\s*(?=Keywords)"
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+        match = patterns.search("abstract_en", text)
         return self.text_utils.clean_text(match.group(1)) if match else ""
     
-    def extract_keywords_tr(self, text: str) -> str:
+    def extract_keywords_tr(self, text: patterns.Text) -> str:
         """Türkçe anahtar kelimeleri çıkarır"""
-        pattern = r"Anahtar\s*Kelimeler\s*[—:\-–;]+\s*(.*?)\s*(?=Abstract)"
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+        match = patterns.search("keywords_tr", text)
         return self.text_utils.clean_text(match.group(1)) if match else ""
     
-    def extract_keywords_en(self, text: str) -> str:
+    def extract_keywords_en(self, text: patterns.Text) -> str:
         """İngilizce anahtar kelimeleri çıkarır"""
-        pattern = r"Keywords\s*[—:\-–;]+\s*(.*?)(?=\n\s*I\.|I\.\s|GİRİŞ|INTRODUCTION|PROBLEM|\n\s*\n\s*[A-Z][a-z]+)"
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+        match = patterns.search("keywords_en", text)
         
         if match:
             result = self.text_utils.clean_text(match.group(1))
@@ -198,9 +392,9 @@ class AbstractExtractor:
             return result
         
         # Basit pattern dene
-        simple_pattern = r"Keywords\s*[—:\-–;]+\s*([^\n]+)"
-        simple_match = re.search(simple_pattern, text, re.IGNORECASE)
+        simple_match = patterns.search("keywords_en_simple", text)
         if simple_match:
+            self.stats.count("fallback.keywords_en_simple")
             return self.text_utils.clean_text(simple_match.group(1))
         
         return ""
@@ -209,49 +403,68 @@ class AbstractExtractor:
         """
         Özet ve anahtar kelimeleri fallback stratejileriyle çıkarır.
         
+        Args:
+            doc: PDF dökümanı veya PageTextStore
+            page_idx: Makale başlangıç sayfası indeksi
+        
         Returns:
             (abstract_tr, abstract_en, keywords_tr, keywords_en) tuple
         """
-        page_analyzer = PageAnalyzer()
+        pages = PageTextStore.wrap(doc)
+        span = ArticleSegmenter(self.stats).span_at(pages, page_idx, self.MAX_WINDOW_PAGES)
+        return self.extract_from_span(pages, span)
+    
+    def extract_from_span(self, pages: PageTextStore,
+                          span: ArticleSpan) -> Tuple[str, str, str, str]:
+        """
+        Bir makale aralığının sayfa metinlerinden özet ve anahtar kelimeleri çıkarır.
+        
+        Args:
+            pages: Sayfa metni deposu
+            span: Makale aralığı
+        
+        Returns:
+            (abstract_tr, abstract_en, keywords_tr, keywords_en) tuple
+        """
+        texts = [pages.text(i) for i in span.window(self.MAX_WINDOW_PAGES)]
+        return self.extract_from_texts(texts)
+    
+    def extract_from_texts(self, texts: List[str]) -> Tuple[str, str, str, str]:
+        """
+        Makale başlangıcından itibaren verilen sayfa metinleri üzerinde
+        fallback stratejilerini uygular.
+        
+        Args:
+            texts: Makale aralığına ait sayfa metinleri (başlangıç sayfası ilk sırada)
+        
+        Returns:
+            (abstract_tr, abstract_en, keywords_tr, keywords_en) tuple
+        """
+        # Tüm pencere kararları tek bir işaretçi dizininden cevaplanır
+        index = patterns.MarkerIndex(texts[:self.MAX_WINDOW_PAGES])
         
         # Özetleri çıkar
-        merged_tr = page_analyzer.collect_until_markers(
-            doc, page_idx, ["Anahtar Kelimeler"], hard_limit=8
-        )
-        merged_en = page_analyzer.collect_until_markers(
-            doc, page_idx, ["Keywords"], hard_limit=8
-        )
+        merged_tr = index.window(["Anahtar Kelimeler"], hard_limit=8)
+        merged_en = index.window(["Keywords"], hard_limit=8)
         abs_tr = self.extract_abstract_tr(merged_tr)
         abs_en = self.extract_abstract_en(merged_en)
         
         # Türkçe özet fallback
         if not abs_tr:
-            merged_tr2 = page_analyzer.collect_until_markers(
-                doc, page_idx, ["Abstract", "Keywords"], hard_limit=8
-            )
-            match = re.search(
-                r"Özetçe\s*[—\-–]+\s*(.*?)\s*(?=Abstract|Keywords)",
-                merged_tr2,
-                re.DOTALL | re.IGNORECASE
-            )
+            self.stats.count("fallback.abstract_tr")
+            merged_tr2 = index.window(["Abstract", "Keywords"], hard_limit=8)
+            match = patterns.search("abstract_tr_fallback", merged_tr2)
             abs_tr = self.text_utils.clean_text(match.group(1)) if match else ""
         
         # İngilizce özet fallback
         if not abs_en:
-            merged_en2 = page_analyzer.collect_until_markers(
-                doc, page_idx, ["I.", "I ", "GİRİŞ"], hard_limit=8
-            )
-            match = re.search(
-                r"Abstract\s*[—\-–]+\s*(.*?)\s*(?=Keywords|I\.\s|I\s|GİRİŞ)",
-                merged_en2,
-                re.DOTALL | re.IGNORECASE
-            )
+            self.stats.count("fallback.abstract_en")
+            merged_en2 = index.window(["I.", "I ", "GİRİŞ"], hard_limit=8)
+            match = patterns.search("abstract_en_fallback", merged_en2)
             abs_en = self.text_utils.clean_text(match.group(1)) if match else ""
         
         # Anahtar kelimeleri çıkar
-        keywords_text = page_analyzer.collect_until_markers(
-            doc, page_idx, ["I.", "GİRİŞ", "INTRODUCTION"], hard_limit=3
-        )
+        keywords_text = index.window(["I.", "GİRİŞ", "INTRODUCTION"], hard_limit=3)
         keywords_tr = self.extract_keywords_tr(keywords_text)
         keywords_en = self.extract_keywords_en(keywords_text)
         
@@ -262,17 +475,106 @@ class AbstractExtractor:
 # TITLE EXTRACTOR
 # ====================================================================
 
+class SpanTable:
+    """
+    Sayfadaki metin span'lerinin sütun bazlı, kompakt gösterimi.
+    
+    Her span için dict oluşturmak yerine koordinatlar ve font boyutu `array`
+    sütunlarında, metinler tek bir listede tutulur; span'ler indeksle
+    adreslenir.
+    """
+    
+    __slots__ = ("xs", "ys", "sizes", "texts")
+    
+    def __init__(self):
+        self.xs = array("d")
+        self.ys = array("d")
+        self.sizes = array("d")
+        self.texts: List[str] = []
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+    
+    @classmethod
+    def from_page_dict(cls, info: Dict) -> "SpanTable":
+        """
+        `page.get_text("dict")` çıktısındaki metin span'lerini tabloya alır.
+        
+        Boş ve tek karakterlik span'ler alınmaz.
+        """
+        table = cls()
+        add_x, add_y = table.xs.append, table.ys.append
+        add_size, add_text = table.sizes.append, table.texts.append
+        for block in info.get("blocks", []):
+            for line in block.get("lines", []):
+                for sp in line.get("spans", []):
+                    txt = (sp.get("text") or "").strip()
+                    if len(txt) < 2:
+                        continue
+                    bbox = sp.get("bbox", (0, 0, 0, 0))
+                    add_x(bbox[0])
+                    add_y(bbox[1])
+                    add_size(sp.get("size", 0.0))
+                    add_text(txt)
+        return table
+    
+    def abstract_y(self) -> Optional[float]:
+        """Özetçe/Abstract içeren en üstteki span'in Y pozisyonu (yoksa None)"""
+        found = [y for y, txt in zip(self.ys, self.texts) if "Özetçe" in txt or "Abstract" in txt]
+        return min(found) if found else None
+    
+    def title_band(self, y_max: float, size_tolerance: float = 4.0) -> List[int]:
+        """
+        `y_max` üzerindeki span'lerden en büyük fonta yakın olanların indeksleri.
+        
+        Returns:
+            (y, x) sırasına göre span indeksleri (uygun span yoksa boş liste)
+        """
+        region = [(y, size) for y, size in zip(self.ys, self.sizes) if y <= y_max]
+        if not region:
+            return []
+        max_size = max(size for _, size in region)
+        if max_size <= 0:
+            return []
+        threshold = max_size - size_tolerance
+        band = [i for i, (y, size) in enumerate(zip(self.ys, self.sizes))
+                if y <= y_max and size >= threshold]
+        keys = list(zip(self.ys, self.xs))
+        band.sort(key=keys.__getitem__)
+        return band
+
+
+class TitleLine:
+    """Başlık bölgesindeki temizlenmiş tek bir metin satırı"""
+    
+    __slots__ = ("y", "text", "_english")
+    
+    def __init__(self, y: float, text: str):
+        self.y = y
+        self.text = text
+        self._english: Optional[bool] = None
+    
+    @property
+    def english(self) -> bool:
+        """Satır İngilizce başlık satırına benziyor mu (ilk erişimde hesaplanır)"""
+        if self._english is None:
+            self._english = TextUtils.looks_english_line(self.text)
+        return self._english
+
+
 class TitleExtractor:
     """Başlık çıkarma sınıfı"""
     
-    def __init__(self):
+    def __init__(self, stats: ExtractionStats = NULL_STATS):
         self.text_utils = TextUtils()
+        self.stats = stats
     
-    def _filter_noise_spans(self, spans: List[Dict], page_height: float) -> List[Dict]:
-        """Başlık aday span'lerinden gürültüyü filtreler"""
+    def _filter_noise_spans(self, table: SpanTable, band: List[int], page_height: float) -> List[int]:
+        """Başlık aday span'lerinden (indeksler) gürültüyü filtreler"""
+        texts = table.texts
         filtered = []
-        for s in spans:
-            text = s["text"]
+        for i in band:
+            text = texts[i]
             
             # Çok kısa veya boş metinleri atla
             if len(text) < 2:
@@ -286,52 +588,54 @@ class TitleExtractor:
             if "@" in text:
                 continue
                 
-            filtered.append(s)
+            filtered.append(i)
         
         return filtered
     
-    def _group_spans_into_lines(self, spans: List[Dict], y_tolerance: float = 3.0) -> List[Dict]:
-        """Span'leri Y pozisyonuna göre satırlara gruplar"""
+    def _group_spans_into_lines(self, table: SpanTable, band: List[int],
+                                y_tolerance: float = 3.0) -> List[TitleLine]:
+        """
+        (y, x) sırasındaki span indekslerini Y pozisyonuna göre satırlara gruplar.
+        
+        Bir span, grubun ilk span'inin Y'sine `y_tolerance` kadar yakınsa aynı satırdadır.
+        """
+        xs, ys, texts = table.xs, table.ys, table.texts
         lines = []
-        current_line = []
-        current_y = None
-        
-        def flush_line():
-            """Mevcut satırı lines listesine ekle"""
-            if not current_line:
-                return
-            current_line.sort(key=lambda d: d["x"])
-            line_text = self.text_utils.clean_text(" ".join(d["text"] for d in current_line))
+        
+        def flush_line(group: List[int]):
+            """Grubu X sırasıyla birleştirip lines listesine ekle"""
+            group.sort(key=xs.__getitem__)
+            line_text = self.text_utils.clean_text(" ".join(texts[i] for i in group))
             if line_text:
-                avg_y = sum(d["y"] for d in current_line) / len(current_line)
-                lines.append({"y": avg_y, "text": line_text})
+                avg_y = sum(ys[i] for i in group) / len(group)
+                lines.append(TitleLine(avg_y, line_text))
         
-        for span in spans:
-            if current_y is None:
-                current_y = span["y"]
-                current_line = [span]
-                continue
-            
+        if not band:
+            return lines
+        
+        group = [band[0]]
+        current_y = ys[band[0]]
+        for i in band[1:]:
             # Aynı satırda mı?
-            if abs(span["y"] - current_y) <= y_tolerance:
-                current_line.append(span)
+            if abs(ys[i] - current_y) <= y_tolerance:
+                group.append(i)
             else:
                 # Yeni satır başladı
-                flush_line()
-                current_y = span["y"]
-                current_line = [span]
+                flush_line(group)
+                current_y = ys[i]
+                group = [i]
         
         # Son satırı ekle
-        flush_line()
+        flush_line(group)
         
         return lines
     
-    def _filter_non_title_lines(self, lines: List[Dict]) -> List[Dict]:
+    def _filter_non_title_lines(self, lines: List[TitleLine]) -> List[TitleLine]:
         """Başlık olmayan satırları filtreler"""
         filtered = []
         
         for line in lines:
-            text = line["text"]
+            text = line.text
             
             # Özet bölümüne geldiysek dur
             if "Özetçe" in text or "Abstract" in text:
@@ -361,14 +665,24 @@ class TitleExtractor:
         
         return filtered
     
-    def _split_tr_en_by_gap(self, texts: List[str], ys: List[float], 
+    @staticmethod
+    def _join(lines: List[TitleLine]) -> str:
+        """
+        Satır metinlerini birleştirir.
+        
+        Satırlar zaten temizlendiği (tek boşluklu, kenar boşluksuz ve boş
+        olmayan) için birleşimin yeniden `clean_text`'ten geçmesi gerekmez.
+        """
+        return " ".join(line.text for line in lines)
+    
+    def _split_tr_en_by_gap(self, lines: List[TitleLine],
                            gap_threshold: float = 8.0) -> Tuple[str, str]:
         """Satırlar arasındaki gap'e bakarak TR ve EN başlıkları ayırır"""
-        if len(ys) < 2:
+        if len(lines) < 2:
             return "", ""
         
         # Ardışık satırlar arasındaki gap'leri hesapla
-        gaps = [ys[i + 1] - ys[i] for i in range(len(ys) - 1)]
+        gaps = [lines[i + 1].y - lines[i].y for i in range(len(lines) - 1)]
         max_gap = max(gaps)
         max_gap_idx = gaps.index(max_gap)
         
@@ -378,125 +692,102 @@ class TitleExtractor:
         
         # Gap'e göre böl
         split_idx = max_gap_idx + 1
-        top_texts = texts[:split_idx]
-        bottom_texts = texts[split_idx:]
+        top = lines[:split_idx]
+        bottom = lines[split_idx:]
         
         # Hangi grup daha çok İngilizce ipucu içeriyor?
-        top_en_score = sum(1 for t in top_texts if self.text_utils.looks_english_line(t))
-        bottom_en_score = sum(1 for t in bottom_texts if self.text_utils.looks_english_line(t))
+        top_en_score = sum(1 for line in top if line.english)
+        bottom_en_score = sum(1 for line in bottom if line.english)
         
         if bottom_en_score >= top_en_score:
-            return self.text_utils.clean_text(" ".join(top_texts)), self.text_utils.clean_text(" ".join(bottom_texts))
+            return self._join(top), self._join(bottom)
         else:
-            return self.text_utils.clean_text(" ".join(bottom_texts)), self.text_utils.clean_text(" ".join(top_texts))
+            return self._join(bottom), self._join(top)
     
-    def _split_tr_en_by_english_hint(self, texts: List[str]) -> Tuple[str, str]:
+    def _split_tr_en_by_english_hint(self, lines: List[TitleLine]) -> Tuple[str, str]:
         """İngilizce ipuçlarına bakarak TR ve EN başlıkları ayırır"""
         first_en_idx = None
-        for i, text in enumerate(texts):
-            if self.text_utils.looks_english_line(text):
+        for i, line in enumerate(lines):
+            if line.english:
                 first_en_idx = i
                 break
         
         if first_en_idx is not None and first_en_idx > 0:
-            title_tr = self.text_utils.clean_text(" ".join(texts[:first_en_idx]))
-            title_en = self.text_utils.clean_text(" ".join(texts[first_en_idx:]))
-            return title_tr, title_en
+            return self._join(lines[:first_en_idx]), self._join(lines[first_en_idx:])
         
         return "", ""
     
-    def _split_tr_en_by_char(self, texts: List[str]) -> Tuple[str, str]:
+    def _split_tr_en_by_char(self, lines: List[TitleLine]) -> Tuple[str, str]:
         """Türkçe karakter varlığına bakarak TR ve EN başlıkları ayırır"""
         tr_lines = []
         en_lines = []
         found_en = False
         
-        for text in texts:
+        for line in lines:
+            has_tr = self.text_utils.contains_tr_char(line.text)
+            
             # Türkçe karakter var ve henüz EN başlamadıysa -> TR
-            if self.text_utils.contains_tr_char(text) and not found_en:
-                tr_lines.append(text)
+            if has_tr and not found_en:
+                tr_lines.append(line)
                 continue
             
             # TR bittikten sonra Türkçe karakter yok -> EN başladı
-            if not self.text_utils.contains_tr_char(text) and tr_lines:
+            if not has_tr and tr_lines:
                 found_en = True
-                en_lines.append(text)
+                en_lines.append(line)
                 continue
             
             # Belirsiz durumlar
             if not tr_lines and not found_en:
-                tr_lines.append(text)
+                tr_lines.append(line)
             else:
-                en_lines.append(text)
+                en_lines.append(line)
         
-        return self.text_utils.clean_text(" ".join(tr_lines)), self.text_utils.clean_text(" ".join(en_lines))
+        return self._join(tr_lines), self._join(en_lines)
     
-    def extract(self, page) -> Tuple[str, str]:
+    def extract(self, page, textpage=None) -> Tuple[str, str]:
         """
         Sayfadan makale başlığını Türkçe ve İngilizce olarak ayrı çıkarır.
         
         Args:
             page: PyMuPDF page objesi
+            textpage: Sayfanın daha önce oluşturulmuş TextPage'i (verilirse
+                sayfa yeniden ayrıştırılmaz)
             
         Returns:
             (title_tr, title_en) tuple
         """
-        info = page.get_text("dict")
+        # Görsel blokları başlık için kullanılmaz; TEXTFLAGS_TEXT ile görsel
+        # verisi hiç çıkarılmaz
+        with self.stats.stage("title_text_dict"):
+            if textpage is not None:
+                info = page.get_text("dict", textpage=textpage)
+            else:
+                info = page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)
         page_h = float(page.rect.height)
         
-        # 1. Tüm span'leri topla
-        spans = []
-        for block in info.get("blocks", []):
-            for line in block.get("lines", []):
-                for sp in line.get("spans", []):
-                    txt = (sp.get("text") or "").strip()
-                    if not txt or len(txt) < 2:
-                        continue
-                    x0, y0, x1, y1 = sp.get("bbox", [0, 0, 0, 0])
-                    spans.append({
-                        "text": txt,
-                        "x": float(x0),
-                        "y": float(y0),
-                        "size": float(sp.get("size", 0.0)),
-                    })
-        
-        if not spans:
+        # 1. Tüm span'leri kompakt tabloya topla
+        table = SpanTable.from_page_dict(info)
+        if not len(table):
             return "", ""
         
         # 2. Özetçe/Abstract'ın Y pozisyonunu bul
-        y_abstract = None
-        for s in spans:
-            if "Özetçe" in s["text"] or "Abstract" in s["text"]:
-                if y_abstract is None or s["y"] < y_abstract:
-                    y_abstract = s["y"]
+        y_abstract = table.abstract_y()
         if y_abstract is None:
             y_abstract = page_h * 0.60
         
-        # 3. Başlık bölgesini belirle
-        y_max = y_abstract - 2
-        region = [s for s in spans if s["y"] <= y_max]
-        if not region:
-            return "", ""
-        
-        # 4. En büyük fontu bul ve tolerans bandı seç
-        max_size = max(s["size"] for s in region)
-        if max_size <= 0:
-            return "", ""
-        
-        band = [s for s in region if s["size"] >= max_size - 4.0]
+        # 3-5. Başlık bölgesindeki en büyük font bandını Y/X sırasıyla seç
+        band = table.title_band(y_abstract - 2, size_tolerance=4.0)
         if not band:
             return "", ""
         
-        # 5. Span'leri Y pozisyonuna göre sırala
-        band.sort(key=lambda d: (d["y"], d["x"]))
-        
         # 6. Gürültüyü filtrele
-        band = self._filter_noise_spans(band, page_h)
+        band = self._filter_noise_spans(table, band, page_h)
         if not band:
             return "", ""
         
         # 7. Span'leri satırlara grupla
-        lines = self._group_spans_into_lines(band, y_tolerance=3.0)
+        lines = self._group_spans_into_lines(table, band, y_tolerance=3.0)
         if not lines:
             return "", ""
         
@@ -506,24 +797,124 @@ class TitleExtractor:
             return "", ""
         
         # 9. Y pozisyonuna göre sırala
-        lines.sort(key=lambda d: d["y"])
-        texts = [line["text"] for line in lines]
-        ys = [line["y"] for line in lines]
+        lines.sort(key=lambda line: line.y)
         
         # 10. Üç aşamalı ayırma stratejisi
         
         # Strateji 1: Gap ile ayır
-        title_tr, title_en = self._split_tr_en_by_gap(texts, ys, gap_threshold=8.0)
+        title_tr, title_en = self._split_tr_en_by_gap(lines, gap_threshold=8.0)
         if title_tr and title_en:
+            self.stats.count("title.split_gap")
             return title_tr, title_en
         
         # Strateji 2: İngilizce ipuçlarına göre ayır
-        title_tr, title_en = self._split_tr_en_by_english_hint(texts)
+        title_tr, title_en = self._split_tr_en_by_english_hint(lines)
         if title_tr and title_en:
+            self.stats.count("title.split_hint")
             return title_tr, title_en
         
         # Strateji 3: Türkçe karakter varlığına göre ayır
-        return self._split_tr_en_by_char(texts)
+        self.stats.count("title.split_char")
+        return self._split_tr_en_by_char(lines)
+
+
+# ====================================================================
+# OUTPUT WRITER
+# ====================================================================
+
+class ArticleCSVWriter:
+    """
+    Makaleleri üretildikleri anda CSV'ye ekleyen ve her satırdan sonra
+    diske yazan (flush) akış yazıcısı.
+    """
+    
+    FIELDNAMES = ["PageNumber", "Year", "Title_TR", "Title_EN",
+                  "Abstract_TR", "Abstract_EN", "Keywords_TR", "Keywords_EN"]
+    
+    # csv modülünün varsayılan satır sonu; alan içerikleri temizlendiği için
+    # satır sınırlarını güvenle belirler
+    LINE_TERMINATOR = "\r\n"
+    
+    def __init__(self, output_path: str, resume: bool = False):
+        """
+        Args:
+            output_path: Çıktı CSV dosya yolu
+            resume: True ise mevcut (yarım kalmış) CSV'ye kaldığı yerden devam edilir
+        """
+        self.output_path = output_path
+        self.resume = resume
+        self.existing: List[Article] = []
+        self._file = None
+        self._writer = None
+    
+    def __enter__(self) -> "ArticleCSVWriter":
+        self.open()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def open(self):
+        """Dosyayı açar; resume modunda mevcut tam satırları okur"""
+        if self.resume and os.path.exists(self.output_path):
+            self.existing = self._load_complete_rows()
+            self._file = open(self.output_path, "a", newline="", encoding="utf-8")
+            self._writer = csv.DictWriter(self._file, fieldnames=self.FIELDNAMES)
+        else:
+            self._file = open(self.output_path, "w", newline="", encoding="utf-8-sig")
+            self._writer = csv.DictWriter(self._file, fieldnames=self.FIELDNAMES)
+            self._writer.writeheader()
+            self._file.flush()
+    
+    def write(self, article: Article):
+        """Tek bir makaleyi yazar ve diske aktarır"""
+        self._writer.writerow(article.to_dict())
+        self._file.flush()
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    @property
+    def last_page(self) -> int:
+        """Mevcut CSV'deki son makalenin başlangıç sayfası (yoksa 0)"""
+        return max((a.page_number for a in self.existing), default=0)
+    
+    def _load_complete_rows(self) -> List[Article]:
+        """
+        Yarım kalmış CSV'nin tam yazılmış satırlarını okur ve dosyayı son tam
+        satırın sonuna kadar kısaltır.
+        """
+        with open(self.output_path, "r", newline="", encoding="utf-8-sig") as f:
+            content = f.read()
+        
+        # Satır sonu ile bitmeyen son (yarım) satırı at
+        end = content.rfind(self.LINE_TERMINATOR)
+        content = content[:end + len(self.LINE_TERMINATOR)] if end >= 0 else ""
+        
+        articles = []
+        for row in csv.DictReader(content.splitlines(keepends=True)):
+            if any(row.get(name) is None for name in self.FIELDNAMES):
+                continue
+            articles.append(Article(
+                page_number=int(row["PageNumber"]),
+                year=row["Year"],
+                title_tr=row["Title_TR"],
+                title_en=row["Title_EN"],
+                abstract_tr=row["Abstract_TR"],
+                abstract_en=row["Abstract_EN"],
+                keywords_tr=row["Keywords_TR"],
+                keywords_en=row["Keywords_EN"],
+            ))
+        
+        with open(self.output_path, "w", newline="", encoding="utf-8-sig") as f:
+            if content:
+                f.write(content)
+            else:
+                csv.DictWriter(f, fieldnames=self.FIELDNAMES).writeheader()
+        
+        return articles
 
 
 # ====================================================================
@@ -533,86 +924,454 @@ class TitleExtractor:
 class PDFProcessor:
     """PDF işleme ve makale çıkarma ana sınıfı"""
     
-    def __init__(self):
+    # İlerleme geri çağrısının en sık çağrılma aralığı (saniye)
+    PROGRESS_INTERVAL = 0.25
+    
+    def __init__(self, cache: Optional[ResultCache] = None,
+                 progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 output_format: str = DEFAULT_FORMAT):
+        """
+        Args:
+            cache: Sonuç önbelleği (None ise önbellek kullanılmaz)
+            progress: İlerleme geri çağrısı; {"stage", "pages_scanned", "page_count",
+                "articles", "elapsed", "pages_per_sec"} sözlüğüyle çağrılır
+            output_format: Çıktı formatı ("csv", "parquet" veya "feather", bkz. outputs)
+        """
+        self.cache = cache
+        self.output_format = check_format(output_format)
+        self.progress = progress
+        self._started = 0.0
+        self._progress_last = 0.0
+        # Son process_pdf çağrısının aşama süreleri ve sayaçları
+        self.stats = ExtractionStats()
         self.page_analyzer = PageAnalyzer()
-        self.title_extractor = TitleExtractor()
-        self.abstract_extractor = AbstractExtractor()
+        self.segmenter = ArticleSegmenter(self.stats)
+        self.title_extractor = TitleExtractor(self.stats)
+        self.abstract_extractor = AbstractExtractor(self.stats)
+        self.last_page_stats: Dict[str, int] = {}
+        self.last_page_count = 0
+        # İşlenen her PDF'in istatistik raporu (bkz. ExtractionStats.to_dict)
+        self.reports: List[Dict[str, Any]] = []
     
-    def process_pdf(self, pdf_path: str, year: str, output_csv: Optional[str] = None) -> List[Article]:
+    def process_pdf(self, pdf_path: str, year: str, output_csv: Optional[str] = None,
+                    workers: int = 1, incremental: bool = False,
+                    resume: bool = False, content: Optional[bytes] = None,
+                    content_hash: Optional[str] = None) -> List[Article]:
         """
         Tek bir PDF dosyasından tüm makaleleri çıkarır.
         
         Args:
-            pdf_path: PDF dosya yolu
+            pdf_path: PDF dosya yolu (`content` verilirse yalnızca görüntülenen ad)
             year: Yıl bilgisi
-            output_csv: Çıktı CSV dosya yolu (None ise otomatik oluşturulur)
+            output_csv: Çıktı dosya yolu (None ise PDF adından ve formattan oluşturulur)
+            workers: Paralel çalışacak süreç sayısı (1 ise seri işlenir)
+            incremental: True ise CSV yanındaki manifest'e göre yalnızca değişen
+                sayfalara dokunan makaleler yeniden çıkarılır
+            resume: True ise yarım kalmış CSV'deki makaleler atlanır ve kalan
+                makaleler dosyaya eklenir (yalnızca CSV çıktısında seri akış modunda)
+            content: Bellekteki PDF içeriği (verilirse dosya okunmaz)
+            content_hash: İçeriğin önceden hesaplanmış SHA-256 hash'i (önbellek
+                anahtarı için dosyanın yeniden okunmasını önler)
             
         Returns:
             Çıkarılan Article nesnelerinin listesi
         """
+        if output_csv is None:
+            output_csv = output_path(os.path.splitext(pdf_path)[0], self.output_format)
+        if resume and self.output_format != "csv":
+            raise ValueError("resume yalnızca CSV çıktısında desteklenir")
+        
+        self.stats.reset()
+        self.stats.meta.update({
+            "pdf": pdf_path,
+            "year": year,
+            "mode": "incremental" if incremental else
+                    "parallel" if workers > 1 and not resume else "serial",
+            "workers": workers,
+        })
+        self.last_page_count = 0
+        self._started = time.perf_counter()
+        self._progress_last = 0.0
+        self._report("opening", 0, force=True)
+        try:
+            articles = self._process_pdf(pdf_path, year, output_csv, workers, incremental, resume,
+                                         content, content_hash)
+        finally:
+            self.stats.wall_seconds = time.perf_counter() - self._started
+        self.stats.meta["pages"] = self.last_page_count
+        self.stats.meta["articles"] = len(articles)
+        self._report("done", len(articles), force=True)
+        self.reports.append(self.stats.to_dict())
+        print(f"⏱️  {self.stats.summary_line()}")
+        return articles
+    
+    def _process_pdf(self, pdf_path: str, year: str, output_csv: str, workers: int,
+                     incremental: bool, resume: bool, content: Optional[bytes],
+                     content_hash: Optional[str]) -> List[Article]:
+        """`process_pdf` gövdesi (önbellek, artımlı, paralel ve seri akış yolları)"""
+        # Önbellekte varsa PDF'i hiç açmadan döndür
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.key(content_hash or file_sha256(pdf_path), year)
+            articles = self._load_cached(cache_key, pdf_path, output_csv)
+            if articles is not None:
+                return articles
+        
         print(f"📄 PDF açılıyor: {pdf_path}")
-        doc = fitz.open(pdf_path)
-        print(f"📊 Toplam sayfa sayısı: {len(doc)}")
+        with self.stats.stage("open"):
+            doc = open_pdf(pdf_path, content)
+        page_count = len(doc)
+        self.last_page_count = page_count
+        print(f"📊 Toplam sayfa sayısı: {page_count}")
+        self._report("extracting", 0, force=True)
         
-        articles = []
+        manifest = None
+        if incremental:
+            articles, manifest = self._process_incremental(doc, year, output_csv)
+            doc.close()
+        elif workers > 1 and not resume:
+            doc.close()
+            articles = self._process_parallel(pdf_path, year, page_count, workers, content)
+        elif self.output_format != "csv":
+            # Sütunlu dosyalara satır eklenemez; makaleler toplanıp tek seferde yazılır
+            articles = []
+            try:
+                for article in self._iter_doc_articles(doc, year):
+                    articles.append(article)
+                    self._report("extracting", len(articles))
+            finally:
+                doc.close()
+        else:
+            # Seri akış modu: her makale üretildiği anda CSV'ye eklenir
+            with ArticleCSVWriter(output_csv, resume=resume) as writer:
+                articles = list(writer.existing)
+                if writer.existing:
+                    print(f"⏩ {len(writer.existing)} makale mevcut CSV'den alındı, "
+                          f"sayfa {writer.last_page + 1} sonrasından devam ediliyor")
+                
+                try:
+                    for article in self._iter_doc_articles(doc, year, after_page=writer.last_page):
+                        with self.stats.stage("csv_write"):
+                            writer.write(article)
+                        articles.append(article)
+                        self._print_article(article)
+                        self._report("extracting", len(articles))
+                finally:
+                    doc.close()
+            
+            self._print_page_stats()
+            print(f"\n✨ {len(articles)} makale bulundu. CSV yazıldı: {output_csv}")
+            self._store_in_cache(cache_key, page_count, articles)
+            return articles
+        
+        # İlerleme göster
+        for article in articles:
+            self._print_article(article)
+        self._print_page_stats()
+        
+        # Çıktıyı yaz
+        self._report("writing", len(articles), force=True)
+        self._write_output(articles, output_csv)
+        print(f"\n✨ {len(articles)} makale bulundu. Çıktı yazıldı: {output_csv}")
+        
+        if manifest is not None:
+            manifest.save(ExtractionManifest.path_for(output_csv))
+        
+        self._store_in_cache(cache_key, page_count, articles)
+        return articles
+    
+    def process_cached(self, pdf_path: str, year: str, output_csv: str,
+                       content_hash: str) -> Optional[List[Article]]:
+        """
+        Sonuç önbellekteyse PDF'i açmadan CSV'yi yazar.
+        
+        Yükleme sırasında içerik hash'ini hesaplayan çağıranlar (web arayüzü)
+        önbellekteki sonuçları çıkarım kuyruğuna almadan döndürebilir.
         
-        # Her sayfayı tara
-        for page_idx in range(len(doc)):
-            page = doc[page_idx]
-            text = page.get_text()
+        Args:
+            pdf_path: PDF dosya yolu (yalnızca görüntülenen ad)
+            year: Yıl bilgisi
+            output_csv: Çıktı CSV dosya yolu
+            content_hash: PDF içeriğinin SHA-256 hash'i
             
-            # Bu sayfa yeni makale başlangıcı mı?
-            if not self.page_analyzer.is_article_start_page(text):
-                continue
+        Returns:
+            Article listesi veya önbellekte yoksa (ya da önbellek kapalıysa) None
+        """
+        if self.cache is None:
+            return None
+        self.stats.reset()
+        started = time.perf_counter()
+        articles = self._load_cached(self.cache.key(content_hash, year), pdf_path, output_csv)
+        if articles is None:
+            return None
+        self.stats.wall_seconds = time.perf_counter() - started
+        self.stats.meta.update({"pdf": pdf_path, "year": year, "pages": self.last_page_count,
+                                "articles": len(articles)})
+        self.reports.append(self.stats.to_dict())
+        return articles
+    
+    def _load_cached(self, cache_key: str, pdf_path: str,
+                     output_csv: str) -> Optional[List[Article]]:
+        """Önbellek kaydı varsa makaleleri yükleyip CSV'yi yazar; yoksa None döndürür"""
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            return None
+        self.stats.count("cache_hits")
+        self.stats.meta["mode"] = "cache"
+        articles = [Article(**record) for record in cached["articles"]]
+        self.last_page_count = cached["page_count"]
+        self.last_page_stats = {}
+        self._write_output(articles, output_csv)
+        print(f"♻️  Önbellekten yüklendi: {pdf_path}")
+        print(f"✨ {len(articles)} makale bulundu. Çıktı yazıldı: {output_csv}")
+        return articles
+    
+    def iter_articles(self, pdf_path: str, year: str, after_page: int = 0) -> Iterator[Article]:
+        """
+        PDF'teki makaleleri çıkarıldıkları sırayla üretir (generator).
+        
+        İşlenen makalelerin sayfa metinleri bellekten atıldığı için bellek
+        kullanımı kitap boyutundan bağımsızdır.
+        
+        Args:
+            pdf_path: PDF dosya yolu
+            year: Yıl bilgisi
+            after_page: Bu sayfa numarasına (1 tabanlı) kadar başlayan makaleler atlanır
+            
+        Yields:
+            Article nesneleri (sayfa sırasıyla)
+        """
+        doc = fitz.open(pdf_path)
+        self.last_page_count = len(doc)
+        try:
+            yield from self._iter_doc_articles(doc, year, after_page)
+        finally:
+            doc.close()
+    
+    def _iter_doc_articles(self, doc, year: str, after_page: int = 0) -> Iterator[Article]:
+        """Açık bir dökümandaki makaleleri üretir (bkz. `iter_articles`)"""
+        pages = PageTextStore(doc, self.stats)
+        
+        # after_page numaralı sayfa 0 tabanlı indekste after_page-1'dir; taramaya bir
+        # sonraki sayfadan başlanır (arada kalan sayfalar önceki makaleye aittir)
+        for span in self.segmenter.iter_spans(pages, start=after_page):
+            yield self._extract_article(pages, span, year)
+            pages.release(span.end_idx + 1)
+            self.last_page_stats = pages.stats()
+        
+        self.last_page_stats = pages.stats()
+    
+    def _report(self, stage: str, articles: int, force: bool = False):
+        """
+        İlerleme geri çağrısına durumu bildirir (`force` değilse en fazla
+        PROGRESS_INTERVAL saniyede bir).
+        
+        Args:
+            stage: "opening", "hashing", "extracting", "writing" veya "done"
+            articles: O ana kadar bulunan makale sayısı
+            force: Aralık beklenmeden bildir
+        """
+        if self.progress is None:
+            return
+        now = time.perf_counter()
+        if not force and now - self._progress_last < self.PROGRESS_INTERVAL:
+            return
+        self._progress_last = now
+        elapsed = now - self._started
+        # Paralel modda parça sınırlarındaki sayfalar iki kez taranabilir
+        pages = min(self.stats.counters.get("pages_scanned", 0), self.last_page_count)
+        self.progress({
+            "stage": stage,
+            "pages_scanned": pages,
+            "page_count": self.last_page_count,
+            "articles": articles,
+            "elapsed": round(elapsed, 3),
+            "pages_per_sec": round(pages / elapsed, 2) if elapsed > 0 else 0.0,
+        })
+    
+    def _print_article(self, article: Article):
+        """Makale ilerleme satırını yazdırır"""
+        print(f"✅ Sayfa {article.page_number}-{article.end_page}: "
+              f"TR='{article.title_tr[:60]}...' | EN='{article.title_en[:60]}...'")
+    
+    def _print_page_stats(self):
+        """Sayfa metni sayaçlarını yazdırır"""
+        stats = self.last_page_stats
+        print(f"📑 Sayfa metni: {stats.get('text_calls', 0)} istek, "
+              f"{stats.get('unique_pages', 0)} benzersiz sayfa çıkarıldı")
+    
+    def _store_in_cache(self, cache_key: Optional[str], page_count: int, articles: List[Article]):
+        """Sonuçları (önbellek etkinse) önbelleğe yazar"""
+        if cache_key is None:
+            return
+        self.cache.put(cache_key, {
+            "page_count": page_count,
+            "articles": [asdict(article) for article in articles],
+        })
+    
+    def _process_incremental(self, doc, year: str,
+                             output_csv: str) -> Tuple[List[Article], ExtractionManifest]:
+        """
+        Manifest'teki sayfa hash'leriyle karşılaştırarak yalnızca değişen sayfalara
+        dokunan makale aralıklarını yeniden çıkarır.
+        
+        Sayfaları değişmeyen aralıkların makaleleri manifest'ten alınır (sayfa
+        ekleme/silme ile kaymış olsalar bile).
+        
+        Args:
+            doc: Açık PDF dökümanı
+            year: Yıl bilgisi
+            output_csv: Çıktı CSV dosya yolu (manifest bunun yanında tutulur)
             
-            # Başlıkları çıkar
-            title_tr, title_en = self.title_extractor.extract(page)
+        Returns:
+            (sayfa sırasına göre Article listesi, güncel manifest) tuple
+        """
+        manifest_path = ExtractionManifest.path_for(output_csv)
+        fingerprint = extractor_fingerprint()
+        previous = ExtractionManifest.load(manifest_path)
+        if previous is not None and (previous.fingerprint != fingerprint or previous.year != year):
+            print("⚠️  Manifest farklı sürüm/yıl ile oluşturulmuş, tüm makaleler yeniden çıkarılacak")
+            previous = None
+        
+        pages = PageTextStore(doc, self.stats)
+        self._report("hashing", 0, force=True)
+        page_hashes = [ExtractionManifest.page_hash(pages.text(i)) for i in range(len(pages))]
+        if previous is not None:
+            changed = previous.changed_pages(page_hashes)
+            print(f"🔁 Değişen sayfa sayısı: {len(changed)} / {len(page_hashes)}")
+        
+        current = ExtractionManifest(fingerprint, year, page_hashes)
+        articles = []
+        reused = 0
+        
+        for span in self.segmenter.iter_spans(pages):
+            key = ExtractionManifest.span_key(page_hashes, span.start_idx, span.end_idx)
+            record = previous.spans.get(key) if previous is not None else None
             
-            # Özetleri ve anahtar kelimeleri çıkar
-            abs_tr, abs_en, keywords_tr, keywords_en = self.abstract_extractor.extract_with_fallback(
-                doc, page_idx
-            )
+            if record is not None:
+                article = Article(**record)
+                article.page_number = span.start_idx + 1
+                article.end_page = span.end_idx + 1
+                reused += 1
+                self.stats.count("articles_reused")
+            else:
+                article = self._extract_article(pages, span, year)
             
-            # Makale nesnesi oluştur
-            article = Article(
-                page_number=page_idx + 1,
-                year=year,
-                title_tr=title_tr,
-                title_en=title_en,
-                abstract_tr=abs_tr,
-                abstract_en=abs_en,
-                keywords_tr=keywords_tr,
-                keywords_en=keywords_en
-            )
+            current.spans[key] = asdict(article)
             articles.append(article)
+            self._report("extracting", len(articles))
+        
+        self.last_page_stats = pages.stats()
+        print(f"🔁 {reused} makale manifest'ten alındı, {len(articles) - reused} makale yeniden çıkarıldı")
+        
+        return articles, current
+    
+    def _process_parallel(self, pdf_path: str, year: str, page_count: int,
+                          workers: int, content: Optional[bytes] = None) -> List[Article]:
+        """
+        Dökümanı sayfa parçalarına bölüp süreç havuzunda işler.
+        
+        Her süreç kendi fitz handle'ını açar, kendi parçasında başlayan makaleleri
+        çıkarır; parça sınırını aşan makaleler için sonraki sayfalara bakar.
+        Sonuçlar sayfa sırasıyla birleştirilir, bitiş sayfaları bir sonraki
+        makalenin başlangıcına göre düzeltilir.
+        
+        Args:
+            pdf_path: PDF dosya yolu
+            year: Yıl bilgisi
+            page_count: Dökümandaki sayfa sayısı
+            workers: Süreç sayısı
+            content: Bellekteki PDF içeriği (verilirse her sürece gönderilir)
             
-            # İlerleme göster
-            print(f"✅ Sayfa {page_idx+1}: TR='{title_tr[:60]}...' | EN='{title_en[:60]}...'")
+        Returns:
+            Sayfa sırasına göre Article listesi
+        """
+        shards = self._page_shards(page_count, workers)
+        print(f"⚙️  {len(shards)} sayfa parçası {workers} süreçte işleniyor")
         
-        doc.close()
+        articles: List[Article] = []
+        totals: Dict[str, int] = {}
         
-        # CSV'ye yaz
-        if output_csv is None:
-            base = os.path.splitext(pdf_path)[0]
-            output_csv = base + ".csv"
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            jobs = [(pdf_path, year, start, stop, content) for start, stop in shards]
+            for shard_articles, shard_stats, shard_report in executor.map(_process_shard, jobs):
+                articles.extend(shard_articles)
+                for key, value in shard_stats.items():
+                    totals[key] = totals.get(key, 0) + value
+                # Aşama süreleri süreçler boyunca toplanır (duvar saati süresini aşabilir)
+                self.stats.merge(shard_report)
+                self._report("extracting", len(articles))
         
-        self._write_to_csv(articles, output_csv)
-        print(f"\n✨ {len(articles)} makale bulundu. CSV yazıldı: {output_csv}")
+        # Parça sınırında kesilen bitiş sayfalarını düzelt
+        for current, following in zip(articles, articles[1:]):
+            current.end_page = following.page_number - 1
+        if articles:
+            articles[-1].end_page = page_count
         
+        self.last_page_stats = totals
         return articles
     
-    def _write_to_csv(self, articles: List[Article], output_path: str):
-        """Makaleleri CSV dosyasına yazar"""
-        fieldnames = ["PageNumber", "Year", "Title_TR", "Title_EN", 
-                     "Abstract_TR", "Abstract_EN", "Keywords_TR", "Keywords_EN"]
+    @staticmethod
+    def _page_shards(page_count: int, workers: int,
+                     shards_per_worker: int = 4, min_shard_size: int = 16) -> List[Tuple[int, int]]:
+        """
+        Sayfa aralığını ardışık (start, stop) parçalarına böler.
         
-        with open(output_path, "w", newline="", encoding="utf-8-sig") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for article in articles:
-                writer.writerow(article.to_dict())
+        Yük dengesi için süreç başına birden fazla parça oluşturulur.
+        """
+        shard_size = max(min_shard_size, math.ceil(page_count / (workers * shards_per_worker)))
+        return [(start, min(page_count, start + shard_size))
+                for start in range(0, page_count, shard_size)]
     
-    def process_path(self, input_path: str, year: str, out_dir: Optional[str] = None):
+    def _extract_article(self, pages: PageTextStore, span: ArticleSpan, year: str) -> Article:
+        """
+        Tek bir makale aralığından Article nesnesi oluşturur.
+        
+        Args:
+            pages: Sayfa metni deposu
+            span: Makale aralığı
+            year: Yıl bilgisi
+            
+        Returns:
+            Article nesnesi
+        """
+        # Başlıkları çıkar (segmentasyonda saklanan TextPage yeniden kullanılır)
+        with self.stats.stage("title"):
+            page = pages.page(span.start_idx)
+            title_tr, title_en = self.title_extractor.extract(
+                page, pages.take_textpage(span.start_idx)
+            )
+        if not title_tr and not title_en:
+            self.stats.count("title.empty")
+        
+        # Özetleri ve anahtar kelimeleri çıkar
+        with self.stats.stage("abstract_keywords"):
+            abs_tr, abs_en, keywords_tr, keywords_en = self.abstract_extractor.extract_from_span(
+                pages, span
+            )
+        self.stats.count("articles_extracted")
+        
+        return Article(
+            page_number=span.start_idx + 1,
+            year=year,
+            title_tr=title_tr,
+            title_en=title_en,
+            abstract_tr=abs_tr,
+            abstract_en=abs_en,
+            keywords_tr=keywords_tr,
+            keywords_en=keywords_en,
+            end_page=span.end_idx + 1,
+        )
+    
+    def _write_output(self, articles: List[Article], output_path: str):
+        """Makaleleri işlemcinin çıktı formatında yazar (yarım dosya kalmaması için geçici dosya üzerinden)"""
+        with self.stats.stage("csv_write"):
+            write_articles([article.to_dict() for article in articles], output_path,
+                           self.output_format)
+    
+    def process_path(self, input_path: str, year: str, out_dir: Optional[str] = None,
+                     workers: int = 1, jobs: int = 1, timeout: Optional[float] = None,
+                     incremental: bool = False, resume: bool = False) -> Optional[List[BatchResult]]:
         """
         PDF dosyası, klasör veya glob pattern'i işler.
         
@@ -620,6 +1379,14 @@ class PDFProcessor:
             input_path: PDF dosyası, klasör yolu veya glob pattern
             year: Yıl bilgisi
             out_dir: Çıktı dizini (None ise PDF ile aynı yerde oluşturulur)
+            workers: Her PDF için paralel çalışacak süreç sayısı
+            jobs: Aynı anda işlenecek PDF sayısı (>1 ise batch modu)
+            timeout: Batch modunda dosya başına maksimum süre (saniye)
+            incremental: True ise manifest'e göre yalnızca değişen makaleler çıkarılır
+            resume: True ise yarım kalmış CSV'lere kaldığı yerden devam edilir
+            
+        Returns:
+            Batch modunda dosya bazlı BatchResult listesi, aksi halde None
         """
         pdfs = []
         
@@ -642,42 +1409,187 @@ class PDFProcessor:
         if out_dir is not None:
             os.makedirs(out_dir, exist_ok=True)
         
+        def output_for(pdf: str) -> Optional[str]:
+            if out_dir:
+                return output_path(os.path.join(out_dir, os.path.splitext(os.path.basename(pdf))[0]),
+                                   self.output_format)
+            return None
+        
+        # Batch modu: her PDF ayrı süreçte (süreç içinde sayfa paralelliği kullanılmaz)
+        if jobs > 1 and len(pdfs) > 1:
+            print(f"⚙️  {len(pdfs)} PDF en fazla {jobs} paralel süreçte işleniyor")
+            started = time.perf_counter()
+            results = run_batch(
+                _batch_job,
+                [(pdf, (pdf, year, output_for(pdf), self.cache, incremental, resume,
+                        self.output_format))
+                 for pdf in pdfs],
+                max_workers=jobs,
+                timeout=timeout,
+            )
+            print_summary(results, time.perf_counter() - started)
+            self.reports.extend(r.stats for r in results if r.stats is not None)
+            return results
+        
         # Her PDF'i işle
         for idx, pdf in enumerate(pdfs, 1):
             print(f"\n{'='*80}")
             print(f"[{idx}/{len(pdfs)}] İşleniyor...")
             print(f"{'='*80}")
             
-            if out_dir:
-                out_csv = os.path.join(out_dir, os.path.splitext(os.path.basename(pdf))[0] + ".csv")
-            else:
-                out_csv = None
-            
-            self.process_pdf(pdf, year, out_csv)
+            self.process_pdf(pdf, year, output_for(pdf), workers=workers,
+                             incremental=incremental, resume=resume)
+        
+        return None
+
+
+def open_pdf(pdf_path: str, content: Optional[bytes] = None) -> fitz.Document:
+    """
+    PDF'i dosyadan veya (verilmişse) bellekteki içerikten açar.
+    
+    Args:
+        pdf_path: PDF dosya yolu
+        content: Bellekteki PDF içeriği
+    """
+    if content is not None:
+        return fitz.open(stream=content, filetype="pdf")
+    return fitz.open(pdf_path)
+
+
+def extractor_fingerprint() -> str:
+    """Çıkarıcı sürümü ve sonucu etkileyen konfigürasyondan parmak izi üretir"""
+    return f"v{EXTRACTOR_VERSION}|window={AbstractExtractor.MAX_WINDOW_PAGES}"
+
+
+def default_cache(cache_dir: str = DEFAULT_CACHE_DIR,
+                  max_bytes: int = DEFAULT_MAX_BYTES) -> ResultCache:
+    """
+    Çıkarıcı parmak iziyle anahtarlanan sonuç önbelleği oluşturur.
+    
+    Args:
+        cache_dir: Önbellek dizini
+        max_bytes: Önbelleğin toplam maksimum boyutu (byte)
+    """
+    return ResultCache(cache_dir, max_bytes, extractor_fingerprint())
+
+
+def _batch_job(pdf_path: str, year: str, output_csv: Optional[str],
+               cache: Optional[ResultCache] = None, incremental: bool = False,
+               resume: bool = False, output_format: str = DEFAULT_FORMAT) -> Dict[str, Any]:
+    """
+    Batch modunda tek bir PDF'i işler (alt süreçte çalışır).
+    
+    Returns:
+        {"pages": sayfa sayısı, "articles": makale sayısı, "stats": aşama raporu}
+    """
+    processor = PDFProcessor(cache=cache, output_format=output_format)
+    articles = processor.process_pdf(pdf_path, year, output_csv,
+                                     incremental=incremental, resume=resume)
+    return {"pages": processor.last_page_count, "articles": len(articles),
+            "stats": processor.stats.to_dict()}
+
+
+def _process_shard(job: Tuple[str, str, int, int, Optional[bytes]]
+                   ) -> Tuple[List[Article], Dict[str, int], Dict[str, Any]]:
+    """
+    Süreç havuzunda tek bir sayfa parçasını işler (pickle edilebilmesi için modül seviyesinde).
+    
+    Args:
+        job: (pdf_path, year, start, stop, content) tuple
+        
+    Returns:
+        (parçada başlayan makaleler, sayfa metni sayaçları, aşama raporu) tuple
+    """
+    pdf_path, year, start, stop, content = job
+    processor = PDFProcessor()
+    doc = open_pdf(pdf_path, content)
+    try:
+        pages = PageTextStore(doc, processor.stats)
+        spans = processor.segmenter.iter_spans(
+            pages, start, stop, lookahead=AbstractExtractor.MAX_WINDOW_PAGES
+        )
+        articles = [processor._extract_article(pages, span, year) for span in spans]
+        return articles, pages.stats(), processor.stats.to_dict()
+    finally:
+        doc.close()
 
 
 # ====================================================================
 # MAIN EXECUTION
 # ====================================================================
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Ana çalıştırma fonksiyonu"""
-    # Konfigürasyon
+    import argparse
+    
+    # Varsayılan konfigürasyon
     YEAR = "2021-2022"
     PDF_PATH = f"Bildiri-Kitabi-{YEAR}.pdf"
-    OUTPUT_DIR = None
+    
+    parser = argparse.ArgumentParser(description="LIFT UP Dataset Extraction Tool")
+    parser.add_argument("pdf_path", nargs="?", default=PDF_PATH,
+                        help="PDF dosyası, klasör veya glob pattern")
+    parser.add_argument("--year", default=YEAR, help="CSV'ye yazılacak yıl bilgisi")
+    parser.add_argument("--out-dir", default=None,
+                        help="Çıktı dizini (verilmezse PDF ile aynı yer)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help=">1 ise her PDF sayfa parçalarına bölünüp paralel işlenir")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help=">1 ise birden fazla PDF aynı anda ayrı süreçlerde işlenir")
+    parser.add_argument("--timeout", type=float, default=None,
+                        help="Batch modunda dosya başına maksimum süre (saniye)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Manifest'e göre yalnızca değişen sayfalara dokunan makaleleri yeniden çıkar")
+    parser.add_argument("--resume", action="store_true",
+                        help="Yarım kalmış CSV'deki makaleleri atla ve kaldığı yerden devam et")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default=DEFAULT_FORMAT,
+                        help="Çıktı formatı (parquet/feather için pyarrow gerekir)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Sonuç önbelleğini kullanma")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="Çalıştırmadan önce sonuç önbelleğini temizle")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Önbellek dizini")
+    parser.add_argument("--cache-max-mb", type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help="Önbelleğin maksimum boyutu (MB)")
+    parser.add_argument("--stats-json", default=None,
+                        help="Aşama süreleri ve sayaçların yazılacağı JSON dosyası")
+    parser.add_argument("--profile", choices=PROFILERS, default=None,
+                        help="Çalıştırmayı profil aracıyla izle (alt süreçler profillenmez)")
+    parser.add_argument("--profile-out", default=None,
+                        help="Profil çıktısı (varsayılan: lift_up_profile.prof / .html)")
+    args = parser.parse_args(argv)
     
     print("="*80)
     print("LIFT UP Dataset Extraction Tool (OOP Implementation)")
     print("="*80)
-    print(f"PDF Path: {PDF_PATH}")
-    print(f"Year: {YEAR}")
-    print(f"Output Dir: {OUTPUT_DIR}")
+    print(f"PDF Path: {args.pdf_path}")
+    print(f"Year: {args.year}")
+    print(f"Output Dir: {args.out_dir} | Format: {args.format}")
+    print(f"Workers: {args.workers} | Jobs: {args.jobs} | Timeout: {args.timeout}")
+    print(f"Cache: {'kapalı' if args.no_cache else args.cache_dir}")
     print("="*80 + "\n")
     
     try:
-        processor = PDFProcessor()
-        processor.process_path(PDF_PATH, YEAR, OUTPUT_DIR)
+        cache = default_cache(args.cache_dir, args.cache_max_mb * 1024 * 1024)
+        if args.clear_cache:
+            print(f"🧹 Önbellek temizlendi: {cache.clear()} kayıt silindi")
+        
+        processor = PDFProcessor(cache=None if args.no_cache else cache,
+                                 output_format=args.format)
+        profile_out = args.profile_out
+        if args.profile and profile_out is None:
+            profile_out = default_profile_path(args.profile, "lift_up_profile")
+        with profiled(args.profile, profile_out):
+            results = processor.process_path(args.pdf_path, args.year, args.out_dir,
+                                             workers=args.workers, jobs=args.jobs,
+                                             timeout=args.timeout, incremental=args.incremental,
+                                             resume=args.resume)
+        if args.stats_json:
+            save_report(processor.reports, args.stats_json)
+            print(f"📈 İstatistikler kaydedildi: {args.stats_json}")
+        if results and not all(r.ok for r in results):
+            print("\n⚠️  Bazı dosyalar işlenemedi (ayrıntılar yukarıda)")
+            return 1
         print("\n🎉 İşlem başarıyla tamamlandı!")
     except Exception as e:
         print(f"\n❌ HATA: {e}")
@@ -0,0 +1,202 @@
+"""
+Instrumentation Module for LIFT UP Dataset
+==========================================
+Çıkarım aşamalarının sürelerini ve sayaçlarını toplar; isteğe bağlı olarak
+cProfile veya pyinstrument ile profil çıkarır
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, List, Optional
+
+
+# Desteklenen profil araçları
+PROFILERS = ("cprofile", "pyinstrument")
+
+
+class ExtractionStats:
+    """
+    Aşama süreleri ve sayaçlar.
+
+    Aşamalar iç içe olabilir; her aşamaya yalnızca kendi süresi yazılır (iç
+    aşamaların süresi dış aşamadan düşülür). Böylece aşama süreleri toplanınca
+    ölçülen toplam süre elde edilir.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Tüm süre ve sayaçları sıfırlar"""
+        self.timings: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.counters: Dict[str, int] = {}
+        self.meta: Dict[str, Any] = {}
+        self.wall_seconds = 0.0
+        # Açık aşamalar (en içteki sonda)
+        self._stack: List[_Stage] = []
+
+    def stage(self, name: str) -> "_Stage":
+        """
+        Bir aşamanın süresini ölçen context manager döndürür.
+
+        Args:
+            name: Aşama adı
+        """
+        return _Stage(self, name)
+
+    def _close_stage(self, name: str, elapsed: float, child_seconds: float):
+        """Kapanan aşamanın kendi süresini yazar, süreyi üst aşamadan düşülmek üzere iletir"""
+        self.timings[name] = self.timings.get(name, 0.0) + elapsed - child_seconds
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if self._stack:
+            self._stack[-1].child_seconds += elapsed
+
+    def count(self, name: str, n: int = 1):
+        """Sayacı artırır"""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def merge(self, report: Dict[str, Any]):
+        """
+        Başka bir süreçte üretilmiş raporu (bkz. `to_dict`) toplama ekler.
+
+        Args:
+            report: ExtractionStats.to_dict() çıktısı
+        """
+        for name, stage in report.get("stages", {}).items():
+            self.timings[name] = self.timings.get(name, 0.0) + stage["seconds"]
+            self.calls[name] = self.calls.get(name, 0) + stage["calls"]
+        for name, value in report.get("counters", {}).items():
+            self.count(name, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON'a çevrilebilir rapor.
+
+        Returns:
+            {"meta", "wall_seconds", "stages": {ad: {"seconds", "calls"}}, "counters"}
+        """
+        return {
+            "meta": dict(self.meta),
+            "wall_seconds": round(self.wall_seconds, 6),
+            "stages": {
+                name: {"seconds": round(seconds, 6), "calls": self.calls.get(name, 0)}
+                for name, seconds in sorted(self.timings.items(), key=lambda item: -item[1])
+            },
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def summary_line(self) -> str:
+        """Aşama sürelerinin tek satırlık özeti"""
+        parts = [f"{name}: {seconds:.2f} sn"
+                 for name, seconds in sorted(self.timings.items(), key=lambda item: -item[1])]
+        return " | ".join(parts)
+
+
+class _Stage:
+    """`ExtractionStats.stage` context manager'ı (sıcak yolda generator maliyetinden kaçınmak için sınıf)"""
+
+    __slots__ = ("stats", "name", "started", "child_seconds")
+
+    def __init__(self, stats: ExtractionStats, name: str):
+        self.stats = stats
+        self.name = name
+        self.child_seconds = 0.0
+
+    def __enter__(self):
+        self.stats._stack.append(self)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.started
+        self.stats._stack.pop()
+        self.stats._close_stage(self.name, elapsed, self.child_seconds)
+        return False
+
+
+_NULL_STAGE = nullcontext()
+
+
+class _NullStats(ExtractionStats):
+    """Ölçüm yapmayan istatistik nesnesi (bağımsız kullanılan bileşenler için)"""
+
+    def stage(self, name: str):
+        return _NULL_STAGE
+
+    def count(self, name: str, n: int = 1):
+        pass
+
+
+NULL_STATS = _NullStats()
+
+
+def save_report(reports: List[Dict[str, Any]], path: str):
+    """
+    Rapor listesini JSON dosyasına yazar.
+
+    Args:
+        reports: ExtractionStats.to_dict() çıktıları (PDF başına bir tane)
+        path: Çıktı JSON dosya yolu
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"files": reports}, f, ensure_ascii=False, indent=2)
+
+
+def default_profile_path(kind: str, base: str) -> str:
+    """Profil aracına göre varsayılan çıktı yolu (cProfile: .prof, pyinstrument: .html)"""
+    return base + (".prof" if kind == "cprofile" else ".html")
+
+
+@contextmanager
+def profiled(kind: Optional[str], output_path: Optional[str] = None) -> Iterator[None]:
+    """
+    Bloğu verilen profil aracıyla çalıştırır ve sonucu dosyaya yazar.
+
+    Args:
+        kind: "cprofile", "pyinstrument" veya None (profil çıkarılmaz)
+        output_path: Çıktı dosyası (None ise çalışma dizininde "lift_up_profile")
+
+    Raises:
+        ValueError: Bilinmeyen profil aracı
+        RuntimeError: pyinstrument kurulu değilse
+    """
+    if not kind:
+        yield
+        return
+    if kind not in PROFILERS:
+        raise ValueError(f"Bilinmeyen profil aracı: {kind} (desteklenenler: {', '.join(PROFILERS)})")
+
+    if output_path is None:
+        output_path = default_profile_path(kind, "lift_up_profile")
+
+    if kind == "cprofile":
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(output_path)
+            print(f"🔬 cProfile çıktısı kaydedildi: {output_path}")
+        return
+
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        raise RuntimeError("pyinstrument kurulu değil: pip install pyinstrument")
+
+    profiler = Profiler()
+    profiler.start()
+    try:
+        yield
+    finally:
+        profiler.stop()
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(profiler.output_html())
+        print(f"🔬 pyinstrument çıktısı kaydedildi: {output_path}")
@@ -0,0 +1,272 @@
+"""
+Background Job Queue for LIFT UP Web Interface
+==============================================
+Uzun süren çıkarım işlerini istek dışında, sınırlı bir süreç havuzunda
+çalıştırır. Harici bir kuyruk sistemi (broker) gerektirmez.
+
+PyMuPDF aynı süreçte birden fazla thread'den kullanılamadığı için işler
+thread yerine süreç havuzunda çalışır. İşler ilerleme bilgisini
+`report_progress` ile süreçler arası bir kuyruğa yazar; ana süreçteki
+dinleyici thread bu bilgiyi ilgili işe aktarır.
+"""
+
+import multiprocessing
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+# İş durumları
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class JobQueueFull(Exception):
+    """Bekleyen iş sayısı sınıra ulaştığında fırlatılır"""
+
+
+# İş süreçlerinde ilerleme bilgisinin yazıldığı kuyruk (bkz. `_init_worker`)
+_progress_queue = None
+
+
+def _init_worker(queue):
+    """Süreç havuzundaki her iş sürecinde bir kez çalışır"""
+    global _progress_queue
+    _progress_queue = queue
+
+
+def report_progress(job_id: str, info: Dict[str, Any]):
+    """
+    İş sürecinden ilerleme bilgisi gönderir (kuyruk dışında çağrılırsa etkisizdir).
+
+    Args:
+        job_id: İş kimliği
+        info: JSON'a çevrilebilir ilerleme bilgisi
+    """
+    if _progress_queue is not None:
+        _progress_queue.put((job_id, info))
+
+
+@dataclass
+class Job:
+    """Kuyruktaki tek bir iş"""
+    id: str
+    created: float = field(default_factory=time.time)
+    finished: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    progress: Dict[str, Any] = field(default_factory=dict)
+    future: Optional[Future] = field(default=None, repr=False)
+
+    @property
+    def status(self) -> str:
+        if self.finished is not None:
+            return FAILED if self.error is not None else DONE
+        if self.future is not None and self.future.running():
+            return RUNNING
+        return QUEUED
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Durum bilgisi (JSON'a çevrilebilir)"""
+        info = {
+            "job_id": self.id,
+            "status": self.status,
+            "created": self.created,
+            "finished": self.finished,
+            "progress": self.progress,
+        }
+        if self.error is not None:
+            info["error"] = self.error
+        return info
+
+
+class JobQueue:
+    """
+    Sınırlı eşzamanlılık ve kuyruk uzunluğuyla çalışan iş kuyruğu.
+
+    Aynı anda en fazla `max_workers` iş çalışır; çalışan ve bekleyen işlerin
+    toplamı `max_workers + max_queued` değerini aşarsa yeni iş reddedilir.
+    Biten işlerin son `keep_finished` tanesi durum sorguları için saklanır.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queued: int = 8, keep_finished: int = 256):
+        """
+        Args:
+            max_workers: Aynı anda çalışacak maksimum iş (süreç) sayısı
+            max_queued: Çalışanlara ek olarak bekleyebilecek maksimum iş sayısı
+            keep_finished: Durumu saklanacak maksimum bitmiş iş sayısı
+        """
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.keep_finished = keep_finished
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._progress: Optional[multiprocessing.Queue] = None
+        self._listener: Optional[threading.Thread] = None
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable[..., Dict[str, Any]], *args,
+               job_id: Optional[str] = None) -> Job:
+        """
+        İşi kuyruğa ekler.
+
+        Aynı kimlikle bekleyen veya çalışan bir iş varsa yeni iş eklenmez,
+        mevcut iş döndürülür (aynı girdiye ait eşzamanlı istekler tek işi paylaşır).
+
+        Args:
+            fn: Modül seviyesinde (pickle edilebilir) iş fonksiyonu; JSON'a
+                çevrilebilir bir dict döndürmeli
+            *args: İş fonksiyonunun argümanları
+            job_id: İş kimliği (None ise üretilir)
+
+        Returns:
+            Job nesnesi
+
+        Raises:
+            JobQueueFull: Kuyruk doluysa
+        """
+        with self._lock:
+            existing = self._jobs.get(job_id) if job_id else None
+            if existing is not None and existing.finished is None:
+                return existing
+            if self._active >= self.max_workers + self.max_queued:
+                raise JobQueueFull(f"Kuyruk dolu ({self._active} iş bekliyor/çalışıyor)")
+            # İş yalnızca havuza gerçekten eklendikten sonra kaydedilir
+            future = self._submit_to_pool(fn, args)
+            job = Job(id=job_id or uuid.uuid4().hex[:8], future=future)
+            self._jobs[job.id] = job
+            self._active += 1
+        job.future.add_done_callback(lambda future: self._finish(job, future))
+        return job
+
+    def complete(self, result: Dict[str, Any], job_id: Optional[str] = None) -> Job:
+        """
+        Kuyruğa alınmadan üretilmiş sonucu bitmiş iş olarak kaydeder
+        (ör. önbellekten hemen dönen sonuçlar; durum ve sonuç uç noktaları
+        aynı şekilde çalışır).
+
+        Args:
+            result: İşin sonucu (JSON'a çevrilebilir dict)
+            job_id: İş kimliği (None ise üretilir)
+
+        Returns:
+            Job nesnesi
+        """
+        job = Job(id=job_id or uuid.uuid4().hex[:8], finished=time.time(), result=result)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._evict_finished()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """İşi kimliğiyle döndürür (bilinmiyorsa None)"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def active_ids(self) -> List[str]:
+        """Bekleyen veya çalışan işlerin kimlikleri"""
+        with self._lock:
+            return [job_id for job_id, job in self._jobs.items() if job.finished is None]
+
+    def stats(self) -> Dict[str, int]:
+        """Çalışan/bekleyen ve saklanan iş sayıları"""
+        with self._lock:
+            return {
+                "active": self._active,
+                "tracked": len(self._jobs),
+                "max_workers": self.max_workers,
+                "max_queued": self.max_queued,
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Süreç havuzunu kapatır"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            progress, self._progress = self._progress, None
+            listener, self._listener = self._listener, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+        if progress is not None:
+            progress.put(None)
+            listener.join()
+            progress.close()
+
+    def _submit_to_pool(self, fn: Callable[..., Dict[str, Any]], args: tuple) -> Future:
+        """
+        İşi süreç havuzuna gönderir (kilit altında çağrılır).
+
+        Bir iş süreci beklenmedik şekilde ölürse (ör. MuPDF çökmesi, OOM)
+        havuz kalıcı olarak bozulur; bu durumda havuz yeniden kurulur ve
+        gönderim bir kez tekrarlanır.
+        """
+        if self._executor is None:
+            self._start_pool()
+        try:
+            return self._executor.submit(fn, *args)
+        except BrokenProcessPool:
+            print("⚠️  İş süreci havuzu bozuldu, yeniden başlatılıyor")
+            self._stop_pool()
+            self._start_pool()
+            return self._executor.submit(fn, *args)
+
+    def _stop_pool(self):
+        """
+        Bozulan süreç havuzunu beklemeden kapatır (kilit altında çağrılır).
+
+        Havuzdaki işlerin future'ları BrokenProcessPool ile sonuçlanır ve
+        `_finish` ile başarısız olarak kaydedilir. Dinleyici thread kilidi
+        aldığı için burada beklenmez; durdurma mesajıyla kendiliğinden biter.
+        """
+        executor, self._executor = self._executor, None
+        progress, self._progress = self._progress, None
+        self._listener = None
+        executor.shutdown(wait=False, cancel_futures=True)
+        progress.put(None)
+
+    def _start_pool(self):
+        """Süreç havuzunu ve ilerleme dinleyicisini başlatır (kilit altında çağrılır)"""
+        self._progress = multiprocessing.Queue()
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                             initializer=_init_worker,
+                                             initargs=(self._progress,))
+        self._listener = threading.Thread(target=self._listen, args=(self._progress,),
+                                          name="job-progress", daemon=True)
+        self._listener.start()
+
+    def _listen(self, queue):
+        """İş süreçlerinden gelen ilerleme bilgilerini ilgili işlere aktarır"""
+        while True:
+            message = queue.get()
+            if message is None:
+                return
+            job_id, info = message
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is not None:
+                    job.progress = info
+
+    def _finish(self, job: Job, future: Future):
+        """İş bittiğinde sonucu veya hatayı kaydeder"""
+        try:
+            job.result = future.result()
+        except BaseException as e:
+            job.error = f"{type(e).__name__}: {e}"
+        with self._lock:
+            job.finished = time.time()
+            job.future = None
+            self._active -= 1
+            self._evict_finished()
+
+    def _evict_finished(self):
+        """Saklanan bitmiş iş sayısı sınırı aşarsa en eskilerini atar (kilit altında çağrılır)"""
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished is not None]
+        for job_id in finished[:max(0, len(finished) - self.keep_finished)]:
+            del self._jobs[job_id]
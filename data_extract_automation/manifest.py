@@ -0,0 +1,99 @@
+"""
+Extraction Manifest Module for LIFT UP Dataset
+==============================================
+Artımlı yeniden çıkarım için sayfa metni hash'lerini ve makale aralıklarından
+türetilen sonuçları saklar
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+
+
+class ExtractionManifest:
+    """
+    Bir PDF için sayfa hash'leri ve aralık bazlı makale sonuçları.
+
+    Makale kayıtları aralığın sayfa hash'lerinden üretilen anahtarla tutulur;
+    böylece sayfa ekleme/silme sonrası kayan ama içeriği değişmeyen makaleler de
+    yeniden kullanılabilir.
+    """
+
+    def __init__(self, fingerprint: str, year: str,
+                 page_hashes: Optional[List[str]] = None,
+                 spans: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Args:
+            fingerprint: Çıkarıcı sürüm/konfigürasyon parmak izi
+            year: Yıl bilgisi
+            page_hashes: Sayfa metni hash'leri (sayfa sırasıyla)
+            spans: Aralık anahtarı -> makale kaydı
+        """
+        self.fingerprint = fingerprint
+        self.year = year
+        self.page_hashes = page_hashes or []
+        self.spans = spans or {}
+
+    @staticmethod
+    def path_for(output_path: str) -> str:
+        """Çıktı dosyasının yanındaki manifest yolunu döndürür"""
+        return output_path + ".manifest.json"
+
+    @staticmethod
+    def page_hash(text: str) -> str:
+        """Sayfa metninin hash'i"""
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def span_key(page_hashes: List[str], start_idx: int, end_idx: int) -> str:
+        """Aralıktaki sayfaların hash'lerinden aralık anahtarı üretir"""
+        joined = "|".join(page_hashes[start_idx:end_idx + 1])
+        return hashlib.sha1(joined.encode("utf-8")).hexdigest()
+
+    def changed_pages(self, page_hashes: List[str]) -> List[int]:
+        """
+        Önceki çalıştırmada içeriği bulunmayan (değişmiş veya yeni eklenmiş) sayfa indeksleri.
+
+        Yalnızca yeri kayan sayfalar değişmiş sayılmaz.
+
+        Args:
+            page_hashes: Güncel sayfa hash'leri
+        """
+        known = set(self.page_hashes)
+        return [idx for idx, h in enumerate(page_hashes) if h not in known]
+
+    @classmethod
+    def load(cls, path: str) -> Optional["ExtractionManifest"]:
+        """
+        Manifest dosyasını okur.
+
+        Returns:
+            ExtractionManifest veya dosya yoksa/bozuksa None
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return cls(data.get("fingerprint", ""), data.get("year", ""),
+                   data.get("page_hashes", []), data.get("spans", {}))
+
+    def save(self, path: str):
+        """Manifest dosyasını atomik olarak yazar"""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({
+                    "fingerprint": self.fingerprint,
+                    "year": self.year,
+                    "page_hashes": self.page_hashes,
+                    "spans": self.spans,
+                }, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
@@ -0,0 +1,278 @@
+"""
+Dataset Merging Module for LIFT UP Dataset
+==========================================
+Yıl bazlı veri setlerini (notebook'ların `20*-20*.xlsx` dosyaları veya
+çıkarıcının CSV/Parquet/Feather çıktıları) tek veri setinde birleştirir
+(notebooks/Data_Merging.ipynb'deki read_excel döngüsünün yerine). Birleşik
+veri seti Excel dahil istenen formatlarda yazılır.
+
+Her girdi süreç havuzunda paralel okunur, ortak şemaya çevrilir ve içerik
+hash'iyle anahtarlanan bir Arrow dosyası olarak önbelleğe yazılır; değişmeyen
+girdiler bir daha ayrıştırılmaz. Birleşik çıktının yanındaki manifest
+girdilerin hash'lerini tutar: hiçbir girdi değişmediyse birleştirme atlanır.
+Birleşik veri seti tek bir Arrow tablosundan tek geçişte yazılır. Excel
+girdileri en yavaş ayrıştırılan girdiler olduğundan önbellekten en çok
+onlar yararlanır.
+"""
+
+import glob
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+from cache import DEFAULT_CACHE_DIR, file_sha256
+from outputs import (EXCEL_EXT, OUTPUT_FORMATS, format_for_path, frame_table, input_format,
+                     is_excel, read_articles, require_pyarrow, write_frame, write_table)
+
+
+# Önbellek veya manifest yapısı değiştiğinde artırılmalı
+MERGE_VERSION = "1"
+
+# Varsayılan girdi deseni, birleşik çıktı ve ayrıştırılmış girdi önbelleği
+DEFAULT_PATTERN = "20*-20*.*"
+DEFAULT_OUTPUT = "all_articles.parquet"
+DEFAULT_MERGE_CACHE_DIR = os.path.join(DEFAULT_CACHE_DIR, "merge")
+
+# Okunabilen girdi uzantıları ve aynı yılın birden fazla formatta dosyası
+# varsa tercih sırası
+INPUT_EXTS = tuple(OUTPUT_FORMATS.values()) + (EXCEL_EXT,)
+FORMAT_PREFERENCE = ("parquet", "feather", "csv", "xlsx")
+
+
+def find_inputs(pattern: str = DEFAULT_PATTERN, exclude: Sequence[str] = ()) -> List[str]:
+    """
+    Desene uyan yıl bazlı çıktı dosyalarını bulur.
+
+    Aynı adlı dosyanın birden fazla formatı varsa yalnızca biri alınır
+    (FORMAT_PREFERENCE sırasıyla).
+
+    Args:
+        pattern: Glob deseni (klasör verilirse içindeki tüm çıktılar)
+        exclude: Hariç tutulacak dosyalar (ör. birleşik çıktının kendisi)
+
+    Returns:
+        Sıralı dosya yolları
+    """
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, "*")
+    excluded = {os.path.abspath(path) for path in exclude}
+    by_stem: Dict[str, str] = {}
+    for path in sorted(glob.glob(pattern)):
+        ext = os.path.splitext(path)[1].lower()
+        if ext not in INPUT_EXTS or os.path.abspath(path) in excluded:
+            continue
+        stem = os.path.splitext(path)[0]
+        current = by_stem.get(stem)
+        if current is None or (FORMAT_PREFERENCE.index(input_format(path))
+                               < FORMAT_PREFERENCE.index(input_format(current))):
+            by_stem[stem] = path
+    return sorted(by_stem.values())
+
+
+def manifest_path(output: str) -> str:
+    """Birleşik çıktının yanındaki manifest yolunu döndürür"""
+    return output + ".merge.json"
+
+
+def _input_records(inputs: List[str], previous: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Girdilerin boyut, mtime ve içerik hash'lerini toplar; boyutu ve mtime'ı
+    manifest'tekiyle aynı olan dosyalar yeniden hash'lenmez.
+    """
+    known = {record["path"]: record for record in (previous or {}).get("inputs", [])}
+    records = []
+    for path in inputs:
+        st = os.stat(path)
+        record = known.get(os.path.abspath(path))
+        if record is not None and record["size"] == st.st_size \
+                and record["mtime_ns"] == st.st_mtime_ns:
+            content_hash = record["sha256"]
+        else:
+            content_hash = file_sha256(path)
+        records.append({
+            "path": os.path.abspath(path),
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "sha256": content_hash,
+        })
+    return records
+
+
+def _cache_path(cache_dir: str, record: Dict[str, Any]) -> str:
+    """Ayrıştırılmış girdinin önbellek yolu (içerik hash'i ve formatla anahtarlanır)"""
+    fmt = input_format(record["path"])
+    return os.path.join(cache_dir, f"{record['sha256'][:32]}_{fmt}_v{MERGE_VERSION}.arrow")
+
+
+def _parse_input(path: str, cache_path: str) -> int:
+    """
+    Girdiyi okuyup ortak şemaya çevirir ve önbelleğe yazar (süreç havuzunda
+    çalışabilmesi için modül seviyesinde).
+
+    Returns:
+        Satır sayısı
+    """
+    table = frame_table(read_articles(path))
+    # Önbellek sıkıştırılmadan yazılır; birleştirmede bellek eşlemeyle okunur
+    write_table(table, cache_path, "feather", compression="uncompressed")
+    return table.num_rows
+
+
+def merge_outputs(inputs: List[str], outputs: Sequence[str] = (DEFAULT_OUTPUT,),
+                  cache_dir: str = DEFAULT_MERGE_CACHE_DIR, workers: int = 1,
+                  force: bool = False) -> Dict[str, Any]:
+    """
+    Yıl bazlı çıktıları birleştirir; girdiler değişmediyse mevcut çıktıları korur.
+
+    Args:
+        inputs: Girdi dosyaları (birleşik veri setindeki sırayla)
+        outputs: Birleşik çıktı yolları (format uzantıdan belirlenir, .xlsx
+            dahil; manifest ilkinin yanında tutulur)
+        cache_dir: Ayrıştırılmış girdi önbelleği dizini
+        workers: Önbellekte olmayan girdileri paralel okuyacak süreç sayısı
+        force: True ise girdiler değişmemiş olsa da yeniden birleştirilir
+
+    Returns:
+        {"inputs", "parsed", "reused", "rows", "years", "skipped", "seconds"} özeti
+
+    Raises:
+        FileNotFoundError: Girdi yoksa
+    """
+    if not inputs:
+        raise FileNotFoundError("❌ Birleştirilecek dosya bulunamadı")
+    if not outputs:
+        raise ValueError("En az bir çıktı yolu gerekli")
+    pa = require_pyarrow()
+    import pyarrow.feather as feather
+
+    started = time.perf_counter()
+    outputs = [os.path.abspath(path) for path in outputs]
+    saved_path = manifest_path(outputs[0])
+    previous = _load_manifest(saved_path)
+    records = _input_records(inputs, previous)
+    signature = [record["sha256"] for record in records]
+
+    # Girdiler ve istenen çıktılar aynıysa birleştirme atlanır
+    if not force and previous is not None and previous["signature"] == signature \
+            and previous["outputs"] == outputs and all(os.path.exists(p) for p in outputs):
+        print(f"✅ Girdiler değişmedi, birleştirme atlandı: {outputs[0]}")
+        return dict(previous["summary"], parsed=0, reused=len(records), skipped=True,
+                    seconds=round(time.perf_counter() - started, 2))
+
+    os.makedirs(cache_dir, exist_ok=True)
+    cache_paths = [_cache_path(cache_dir, record) for record in records]
+    # Aynı içerikli girdiler tek önbellek kaydını paylaşır; her kayıt bir kez ayrıştırılır
+    pending = {path: record["path"] for record, path in zip(records, cache_paths)
+               if not os.path.exists(path)}
+    missing = [(source, path) for path, source in pending.items()]
+    if missing:
+        print(f"📖 {len(missing)} / {len(set(cache_paths))} dosya ayrıştırılıyor")
+    if workers > 1 and len(missing) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(missing))) as executor:
+            list(executor.map(_parse_input, *zip(*missing)))
+    else:
+        for path, cache_path in missing:
+            _parse_input(path, cache_path)
+
+    # Tüm girdiler bellek eşlemeli Arrow tablolarından tek tabloda birleşir
+    tables = [feather.read_table(path, memory_map=True) for path in cache_paths]
+    merged = pa.concat_tables(tables).unify_dictionaries()
+    for path in outputs:
+        if is_excel(path):
+            write_frame(merged.to_pandas(), path)
+        else:
+            write_table(merged, path, format_for_path(path))
+
+    years = merged.column("Year").cast(pa.string()).value_counts().to_pylist()
+    summary = {
+        "inputs": len(records),
+        "parsed": len(missing),
+        "reused": len(set(cache_paths)) - len(missing),
+        "rows": merged.num_rows,
+        "years": dict(sorted((item["values"], item["counts"]) for item in years)),
+    }
+    _save_manifest(saved_path, {
+        "version": MERGE_VERSION,
+        "inputs": records,
+        "signature": signature,
+        "outputs": outputs,
+        "summary": summary,
+    })
+    for year, count in summary["years"].items():
+        print(f"📊 {year}: {count} kayıt")
+    print(f"✨ {summary['rows']} kayıt birleştirildi: {', '.join(outputs)}")
+    return dict(summary, skipped=False, seconds=round(time.perf_counter() - started, 2))
+
+
+def _load_manifest(path: str) -> Optional[Dict[str, Any]]:
+    """Birleştirme manifest'ini okur (yoksa, bozuksa veya sürümü farklıysa None)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if saved.get("version") != MERGE_VERSION:
+        return None
+    return saved
+
+
+def _save_manifest(path: str, payload: Dict[str, Any]):
+    """Manifest'i atomik olarak kaydeder"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# ====================================================================
+# MAIN EXECUTION
+# ====================================================================
+
+def main(argv: Optional[List[str]] = None):
+    """Ana çalıştırma fonksiyonu"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="LIFT UP Dataset Merging Tool")
+    parser.add_argument("inputs", nargs="*",
+                        help="Birleştirilecek dosyalar (verilmezse --pattern ile aranır)")
+    parser.add_argument("--pattern", default=DEFAULT_PATTERN,
+                        help="Yıl bazlı çıktıların glob deseni veya klasörü")
+    parser.add_argument("--out", action="append", default=None,
+                        help=f"Birleşik çıktı (.parquet/.feather/.csv/.xlsx, tekrarlanabilir; "
+                             f"varsayılan: {DEFAULT_OUTPUT})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Girdileri paralel okuyacak süreç sayısı")
+    parser.add_argument("--cache-dir", default=DEFAULT_MERGE_CACHE_DIR,
+                        help="Ayrıştırılmış girdi önbelleği dizini")
+    parser.add_argument("--force", action="store_true",
+                        help="Girdiler değişmemiş olsa da yeniden birleştir")
+    args = parser.parse_args(argv)
+
+    outputs = args.out or [DEFAULT_OUTPUT]
+    try:
+        inputs = args.inputs or find_inputs(args.pattern, exclude=outputs)
+        print(f"🔍 {len(inputs)} dosya bulundu")
+        summary = merge_outputs(inputs, outputs, cache_dir=args.cache_dir,
+                                workers=args.workers, force=args.force)
+        print(f"⏱️  {summary['seconds']} sn (ayrıştırılan: {summary['parsed']}, "
+              f"önbellekten: {summary['reused']})")
+    except Exception as e:
+        print(f"\n❌ HATA: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
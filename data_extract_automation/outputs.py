@@ -0,0 +1,331 @@
+"""
+Article Output Module for LIFT UP Dataset
+=========================================
+Çıkarılan makaleleri CSV, Parquet veya Feather (Arrow IPC) olarak yazar ve
+okur. CSV varsayılandır ve çıktısı değişmez; sütunlu formatlar sabit bir
+şema (`PageNumber` int32, `Year` kategori, metin sütunları) ve sıkıştırma
+ile yazılır, okunurken yalnızca istenen sütunlar diskten çözülür.
+
+Notebook'ların yıl bazlı Excel veri setleri (`.xlsx`) de okunabilir ve
+DataFrame olarak yazılabilir; çıkarıcı Excel çıktısı üretmez.
+
+Sütunlu formatlar için pyarrow gereklidir (`pip install pyarrow`); CSV
+yazımı pyarrow olmadan da çalışır. Excel için openpyxl gereklidir.
+"""
+
+import csv
+import os
+from typing import Any, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+
+# Çıktı sütunları (dosyadaki sırayla) ve metin sütunları
+ARTICLE_COLUMNS = ["PageNumber", "Year", "Title_TR", "Title_EN",
+                   "Abstract_TR", "Abstract_EN", "Keywords_TR", "Keywords_EN"]
+TEXT_COLUMNS = ARTICLE_COLUMNS[2:]
+
+# Desteklenen formatlar ve dosya uzantıları
+OUTPUT_FORMATS = {"csv": ".csv", "parquet": ".parquet", "feather": ".feather"}
+DEFAULT_FORMAT = "csv"
+
+# Excel dosyaları (yalnızca okunur veya DataFrame olarak yazılır)
+EXCEL_FORMAT = "xlsx"
+EXCEL_EXT = ".xlsx"
+
+# Sütunlu formatların sıkıştırması
+DEFAULT_COMPRESSION = "zstd"
+
+
+def require_pyarrow():
+    """pyarrow'u yükler; kurulu değilse anlaşılır bir hata verir"""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise RuntimeError("Parquet/Feather çıktısı için pyarrow gerekli: pip install pyarrow") from e
+    return pyarrow
+
+
+def require_openpyxl():
+    """openpyxl'i yükler; kurulu değilse anlaşılır bir hata verir"""
+    try:
+        import openpyxl
+    except ImportError as e:
+        raise RuntimeError("Excel (.xlsx) dosyaları için openpyxl gerekli: pip install openpyxl") from e
+    return openpyxl
+
+
+def check_format(fmt: str) -> str:
+    """
+    Çıktı formatını doğrular.
+
+    Raises:
+        ValueError: Format desteklenmiyorsa
+    """
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Desteklenmeyen çıktı formatı: {fmt} "
+                         f"(seçenekler: {', '.join(OUTPUT_FORMATS)})")
+    return fmt
+
+
+def format_for_path(path: str) -> str:
+    """Dosya uzantısından formatı belirler (bilinmeyen uzantılar CSV sayılır)"""
+    ext = os.path.splitext(path)[1].lower()
+    for fmt, fmt_ext in OUTPUT_FORMATS.items():
+        if ext == fmt_ext:
+            return fmt
+    return DEFAULT_FORMAT
+
+
+def is_excel(path: str) -> bool:
+    """Dosyanın Excel (.xlsx) olup olmadığı"""
+    return os.path.splitext(path)[1].lower() == EXCEL_EXT
+
+
+def input_format(path: str) -> str:
+    """Okunacak dosyanın formatı (format_for_path + Excel)"""
+    return EXCEL_FORMAT if is_excel(path) else format_for_path(path)
+
+
+def output_path(base: str, fmt: str) -> str:
+    """Uzantısız yola formatın uzantısını ekler"""
+    return base + OUTPUT_FORMATS[check_format(fmt)]
+
+
+# ====================================================================
+# WRITING
+# ====================================================================
+
+def article_schema():
+    """Sütunlu çıktıların Arrow şeması"""
+    pa = require_pyarrow()
+    return pa.schema(
+        [pa.field("PageNumber", pa.int32(), nullable=False),
+         pa.field("Year", pa.dictionary(pa.int32(), pa.string()))]
+        + [pa.field(col, pa.string()) for col in TEXT_COLUMNS]
+    )
+
+
+def articles_table(rows: List[Dict[str, Any]]):
+    """
+    Makale satırlarından Arrow tablosu oluşturur.
+
+    Boş metinler null olarak yazılır; böylece sütunlu dosyalar CSV'yi okuyan
+    pandas ile aynı eksik değerleri gösterir.
+
+    Args:
+        rows: ARTICLE_COLUMNS anahtarlı satır sözlükleri
+    """
+    pa = require_pyarrow()
+    arrays = [
+        pa.array([row["PageNumber"] for row in rows], pa.int32()),
+        pa.array([row["Year"] for row in rows], pa.string()).dictionary_encode(),
+    ]
+    arrays += [pa.array([row[col] or None for row in rows], pa.string()) for col in TEXT_COLUMNS]
+    return pa.Table.from_arrays(arrays, schema=article_schema())
+
+
+def frame_table(df: pd.DataFrame):
+    """
+    Makale DataFrame'ini (ör. `read_articles` sonucu) sütunlu çıktı şemasına çevirir.
+
+    Raises:
+        ValueError: Makale sütunlarından biri eksikse
+    """
+    pa = require_pyarrow()
+    missing = [col for col in ARTICLE_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"Eksik sütunlar: {', '.join(missing)}")
+    table = pa.Table.from_pandas(df[ARTICLE_COLUMNS], preserve_index=False)
+    arrays = [
+        table["PageNumber"].cast(pa.int32()),
+        table["Year"].cast(pa.string()).dictionary_encode(),
+    ]
+    arrays += [table[col].cast(pa.string()) for col in TEXT_COLUMNS]
+    return pa.Table.from_arrays(arrays, schema=article_schema())
+
+
+def write_articles(rows: List[Dict[str, Any]], path: str, fmt: str = DEFAULT_FORMAT,
+                   compression: str = DEFAULT_COMPRESSION):
+    """
+    Makale satırlarını verilen formatta yazar (yarım dosya kalmaması için
+    geçici dosya üzerinden).
+
+    Args:
+        rows: ARTICLE_COLUMNS anahtarlı satır sözlükleri
+        path: Çıktı dosya yolu
+        fmt: "csv", "parquet" veya "feather"
+        compression: Sütunlu formatların sıkıştırması (CSV'de kullanılmaz)
+    """
+    if check_format(fmt) == "csv":
+        _write_atomic(path, lambda tmp_path: _write_csv(rows, tmp_path))
+    else:
+        write_table(articles_table(rows), path, fmt, compression)
+
+
+def write_table(table, path: str, fmt: str = "parquet",
+                compression: str = DEFAULT_COMPRESSION):
+    """
+    Arrow tablosunu verilen formatta tek geçişte yazar (geçici dosya üzerinden).
+
+    Args:
+        table: `article_schema` şemalı Arrow tablosu
+        path: Çıktı dosya yolu
+        fmt: "csv", "parquet" veya "feather"
+        compression: Sütunlu formatların sıkıştırması (CSV'de kullanılmaz)
+    """
+    check_format(fmt)
+    require_pyarrow()
+    if fmt == "csv":
+        writer = lambda tmp_path: _write_csv(table.to_pylist(), tmp_path)
+    elif fmt == "parquet":
+        import pyarrow.parquet as pq
+        writer = lambda tmp_path: pq.write_table(table, tmp_path, compression=compression)
+    else:
+        import pyarrow.feather as feather
+        writer = lambda tmp_path: feather.write_feather(table, tmp_path, compression=compression)
+    _write_atomic(path, writer)
+
+
+def write_frame(df: pd.DataFrame, path: str, compression: str = DEFAULT_COMPRESSION):
+    """
+    Makale şemasına uymayan DataFrame'leri (ör. ön işlenmiş veri seti) veya
+    Excel çıktılarını uzantıdaki formatta yazar (geçici dosya üzerinden).
+
+    Args:
+        df: Yazılacak DataFrame (indeks yazılmaz)
+        path: Çıktı dosya yolu
+        compression: Sütunlu formatların sıkıştırması (CSV'de kullanılmaz)
+    """
+    fmt = input_format(path)
+    if fmt == EXCEL_FORMAT:
+        require_openpyxl()
+        writer = lambda tmp_path: _write_excel(df, tmp_path)
+    elif fmt == "csv":
+        writer = lambda tmp_path: df.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+    else:
+        require_pyarrow()
+        if fmt == "parquet":
+            writer = lambda tmp_path: df.to_parquet(tmp_path, index=False, compression=compression)
+        else:
+            writer = lambda tmp_path: df.reset_index(drop=True).to_feather(
+                tmp_path, compression=compression)
+    _write_atomic(path, writer)
+
+
+def _write_csv(rows: List[Dict[str, Any]], path: str):
+    """Satırları çıkarıcının CSV biçiminde (utf-8-sig) yazar"""
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.DictWriter(f, fieldnames=ARTICLE_COLUMNS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+
+
+def _write_excel(df: pd.DataFrame, path: str):
+    """DataFrame'i Excel olarak yazar (geçici dosyanın uzantısı .tmp olduğu
+    için dosya nesnesine ve açık motorla yazılır)"""
+    with open(path, "wb") as f:
+        df.to_excel(f, index=False, engine="openpyxl")
+
+
+def _write_atomic(path: str, writer):
+    """`writer(geçici_yol)` ile yazar ve dosyayı hedefe taşır"""
+    tmp_path = path + ".tmp"
+    try:
+        writer(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# ====================================================================
+# READING
+# ====================================================================
+
+def read_articles(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Çıktı dosyasını DataFrame olarak okur.
+
+    Args:
+        path: CSV, Parquet, Feather veya Excel dosya yolu (format uzantıdan belirlenir)
+        columns: Okunacak sütunlar (None ise tümü); sütunlu formatlarda
+            diğer sütunlar diskten hiç çözülmez
+
+    Returns:
+        DataFrame (sütunlu formatlarda `Year` kategori tipindedir)
+    """
+    fmt = input_format(path)
+    if fmt == EXCEL_FORMAT:
+        require_openpyxl()
+        df = pd.read_excel(path, usecols=columns)
+        return df[columns] if columns is not None else df
+    if fmt == "parquet":
+        require_pyarrow()
+        return pd.read_parquet(path, columns=columns)
+    if fmt == "feather":
+        require_pyarrow()
+        return pd.read_feather(path, columns=columns)
+    df = pd.read_csv(path, encoding="utf-8-sig", usecols=columns)
+    return df[columns] if columns is not None else df
+
+
+def article_columns(path: str) -> List[str]:
+    """Dosyanın sütun adlarını veriyi okumadan döndürür"""
+    fmt = input_format(path)
+    if fmt == EXCEL_FORMAT:
+        require_openpyxl()
+        return pd.read_excel(path, nrows=0).columns.tolist()
+    if fmt == "csv":
+        return pd.read_csv(path, encoding="utf-8-sig", nrows=0).columns.tolist()
+    pa = require_pyarrow()
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        return pq.read_schema(path).names
+    with pa.memory_map(path) as source:
+        return pa.ipc.open_file(source).schema.names
+
+
+def iter_article_frames(path: str, chunksize: int,
+                        columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Çıktı dosyasını en fazla `chunksize` satırlık DataFrame parçaları olarak okur.
+
+    CSV'de metin sütunları her parçada metin olarak okunur; Parquet satır
+    grupları parça parça çözülür. Excel parça parça okunamadığı için tamamı
+    okunup bölünür.
+
+    Args:
+        path: CSV, Parquet, Feather veya Excel dosya yolu
+        chunksize: Parça başına satır sayısı
+        columns: Okunacak sütunlar (None ise tümü)
+    """
+    fmt = input_format(path)
+    if fmt == EXCEL_FORMAT:
+        df = read_articles(path, columns)
+        for offset in range(0, len(df), chunksize):
+            yield df.iloc[offset:offset + chunksize]
+        return
+    if fmt == "csv":
+        header = article_columns(path)
+        dtype = {col: str for col in TEXT_COLUMNS if col in header}
+        with pd.read_csv(path, encoding="utf-8-sig", dtype=dtype, usecols=columns,
+                         chunksize=chunksize) as reader:
+            for chunk in reader:
+                yield chunk[columns] if columns is not None else chunk
+        return
+
+    require_pyarrow()
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        with pq.ParquetFile(path) as parquet_file:
+            for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+                yield batch.to_pandas()
+        return
+
+    import pyarrow.feather as feather
+    table = feather.read_table(path, columns=columns, memory_map=True)
+    for offset in range(0, table.num_rows, chunksize):
+        yield table.slice(offset, chunksize).to_pandas()
@@ -0,0 +1,309 @@
+"""
+Regex Pattern Registry for LIFT UP Dataset
+==========================================
+Özet ve anahtar kelime çıkarımında kullanılan, önceden derlenmiş regex kalıpları.
+data_extract.py ve data_collection.py aynı kayıt defterini kullanır.
+"""
+
+import re
+from bisect import bisect_left
+from typing import Dict, List, Match, Optional, Pattern, Tuple, Union
+
+
+_FLAGS = re.DOTALL | re.IGNORECASE
+
+# Metin temizleme
+WHITESPACE = re.compile(r"\s+")
+
+# Bölüm işaretçileri (konumları MarkerIndex'te pencere başına bir kez taranır)
+MARKER_OZETCE = re.compile(r"Özetçe", re.IGNORECASE)
+MARKER_ABSTRACT = re.compile(r"Abstract", re.IGNORECASE)
+MARKER_ANAHTAR = re.compile(r"Anahtar\s*Kelimeler", re.IGNORECASE)
+MARKER_KEYWORDS = re.compile(r"Keywords", re.IGNORECASE)
+SECTION_MARKERS = (MARKER_OZETCE, MARKER_ABSTRACT, MARKER_ANAHTAR, MARKER_KEYWORDS)
+
+# İşaretçiden sonraki ayraçlar
+_DASH = r"\s*[—\-–]+\s*"
+_KEYWORD_DASH = r"\s*[—:\-–;]+\s*"
+
+
+class SectionMatch:
+    """
+    İşaretçi ofsetlerinden üretilen, `re.Match` ile uyumlu hafif eşleşme sonucu.
+
+    Yalnızca çıkarıcıların kullandığı arayüzü (group, groups, span, start, end) sağlar.
+    """
+
+    __slots__ = ("string", "_spans")
+
+    def __init__(self, string: str, match_start: int, match_end: int,
+                 group_start: int, group_end: int):
+        self.string = string
+        self._spans = ((match_start, match_end), (group_start, group_end))
+
+    def span(self, group: int = 0) -> Tuple[int, int]:
+        return self._spans[group]
+
+    def start(self, group: int = 0) -> int:
+        return self._spans[group][0]
+
+    def end(self, group: int = 0) -> int:
+        return self._spans[group][1]
+
+    def group(self, group: int = 0) -> str:
+        start, end = self._spans[group]
+        return self.string[start:end]
+
+    def groups(self) -> Tuple[str]:
+        return (self.group(1),)
+
+
+SearchResult = Union[Match, SectionMatch]
+
+
+class BoundedPattern:
+    """
+    Başlangıç ve bitiş işaretçilerinin ofsetleriyle sınırlandırılmış bölüm araması.
+
+    `pattern.search` ile aynı sonucu verir. `(.*?)` + lookahead kalıbı metni
+    karakter karakter denediği için grup sınırları doğrudan hesaplanır: önek
+    (işaretçi + ayraç) bulunur, ardından önekten sonraki ilk bitiş işaretçisi
+    aranır ve grup bu iki ofset arasındaki metin olur. Bitiş işaretçisi yoksa
+    (regex geri izlemesi farklı sonuç verebileceği için) asıl kalıba düşülür.
+    """
+
+    def __init__(self, pattern: Pattern, marker: Pattern, prefix: Pattern,
+                 terminator: Optional[Pattern] = None, rstrip: bool = False):
+        """
+        Args:
+            pattern: Asıl kalıp (referans ve yedek arama)
+            marker: Kalıbın başındaki bölüm işaretçisi
+            prefix: Kalıbın grup öncesi kısmı (işaretçi + ayraç)
+            terminator: Kalıbın lookahead'indeki bitiş işaretçisi (None ise asıl kalıp kullanılır)
+            rstrip: Kalıpta lookahead'den önce `\\s*` varsa True (grup sonundaki boşluk dışarıda kalır)
+        """
+        self.pattern = pattern
+        self.marker = marker
+        self.prefix = prefix
+        self.terminator = terminator
+        self.rstrip = rstrip
+
+    def search(self, text: "Text") -> Optional[SearchResult]:
+        """
+        Metinde kalıbı arar.
+
+        Args:
+            text: İşlenecek metin veya dizinli pencere öneki (IndexedText)
+
+        Returns:
+            re.Match / SectionMatch veya None
+        """
+        if isinstance(text, IndexedText):
+            index, endpos = text.index, text.endpos
+            source = index.text
+            head = self._indexed_prefix(index, endpos)
+        else:
+            index, endpos = None, len(text)
+            source = text
+            head = self.prefix.search(text)
+        if head is None:
+            return None
+
+        if self.terminator is None:
+            return self.pattern.search(source, head.start(), endpos)
+
+        group_start = head.end()
+        if index is None:
+            tail = self.terminator.search(source, group_start)
+        else:
+            tail = index.find(self.terminator, group_start, endpos)
+        if tail is None:
+            return self.pattern.search(source, head.start(), endpos)
+
+        group_end = tail.start()
+        if self.rstrip:
+            group_end = group_start + len(source[group_start:group_end].rstrip())
+        return SectionMatch(source, head.start(), tail.start(), group_start, group_end)
+
+    def _indexed_prefix(self, index: "MarkerIndex", endpos: int) -> Optional[Match]:
+        """Önekin ilk eşleşmesini yalnızca dizindeki işaretçi konumlarında dener"""
+        pos = 0
+        while True:
+            marker = index.find(self.marker, pos, endpos)
+            if marker is None:
+                return None
+            head = self.prefix.match(index.text, marker.start(), endpos)
+            if head is not None:
+                return head
+            pos = marker.start() + 1
+
+
+def _bounded(marker: Pattern, separator: str, terminator: Union[str, Pattern],
+             rstrip: bool = True) -> BoundedPattern:
+    """İşaretçi + ayraç + `(.*?)` + bitiş lookahead'inden oluşan kalıbı kaydeder"""
+    if isinstance(terminator, str):
+        terminator = re.compile(terminator, _FLAGS)
+    trailing = r"\s*" if rstrip else ""
+    return BoundedPattern(
+        re.compile(f"{marker.pattern}{separator}(.*?){trailing}(?={terminator.pattern})", _FLAGS),
+        marker,
+        re.compile(marker.pattern + separator, _FLAGS),
+        terminator,
+        rstrip,
+    )
+
+
+# Kalıp kayıt defteri
+REGISTRY: Dict[str, BoundedPattern] = {
+    "abstract_tr": _bounded(MARKER_OZETCE, _DASH, MARKER_ANAHTAR),
+    "abstract_tr_fallback": _bounded(MARKER_OZETCE, _DASH, r"Abstract|Keywords"),
+    "abstract_en": _bounded(MARKER_ABSTRACT, _DASH, MARKER_KEYWORDS),
+    "abstract_en_fallback": _bounded(MARKER_ABSTRACT, _DASH, r"Keywords|I\.\s|I\s|GİRİŞ"),
+    "keywords_tr": _bounded(MARKER_ANAHTAR, _KEYWORD_DASH, MARKER_ABSTRACT),
+    "keywords_en": _bounded(
+        MARKER_KEYWORDS, _KEYWORD_DASH,
+        r"\n\s*I\.|I\.\s|GİRİŞ|INTRODUCTION|PROBLEM|\n\s*\n\s*[A-Z][a-z]+",
+        rstrip=False,
+    ),
+    # Satır sonuna kadar: sınır hesaplanmaz, asıl kalıp işaretçiden itibaren aranır
+    "keywords_en_simple": BoundedPattern(
+        re.compile(r"Keywords\s*[—:\-–;]+\s*([^\n]+)", re.IGNORECASE),
+        MARKER_KEYWORDS,
+        re.compile(r"Keywords\s*[—:\-–;]+\s*", re.IGNORECASE),
+    ),
+}
+
+
+_MISSING = object()
+
+
+class MarkerIndex:
+    """
+    Bir makale penceresi için işaretçi → konum dizini.
+
+    Pencerenin sayfa metinleri bir kez birleştirilir. Bölüm işaretçilerinin
+    (Özetçe, Abstract, Anahtar Kelimeler, Keywords) konumları birleşik metinde
+    gerektiği kadar ileriye doğru bir kez taranır; kalıpların önekleri bu
+    konumlarda denenir ve bitiş işaretçileri aynı listeden okunur. Durma
+    işaretçisi kararları için her sayfa bir kez küçük harfe çevrilir ve
+    işaretçi varlığı saklanır. Farklı durma işaretçileriyle birleştirilen
+    metinler birleşik metnin önekleri olduğundan, her özet/anahtar kelime
+    kararı (`endpos` ile) aynı dizinden cevaplanır.
+    """
+
+    def __init__(self, texts: List[str]):
+        """
+        Args:
+            texts: Makale başlangıcından itibaren sayfa metinleri
+        """
+        self.texts = texts
+        self.text = "\n".join(texts)
+        self.page_ends: List[int] = []
+        end = -1
+        for page_text in texts:
+            end += len(page_text) + 1
+            self.page_ends.append(end)
+        self._lowered: Dict[int, str] = {}
+        self._page_markers: Dict[Tuple[int, str], bool] = {}
+        # İşaretçi -> [konumlar, eşleşmeler, taramanın devam edeceği ofset (bittiyse None)]
+        self._occurrences: Dict[Pattern, list] = {}
+        self._hits: Dict[Tuple[Pattern, int], Optional[Match]] = {}
+
+    def page_has(self, idx: int, marker: str) -> bool:
+        """Sayfanın (büyük/küçük harf duyarsız) işaretçiyi içerip içermediği"""
+        key = (idx, marker)
+        found = self._page_markers.get(key)
+        if found is None:
+            low = self._lowered.get(idx)
+            if low is None:
+                low = self._lowered[idx] = self.texts[idx].lower()
+            found = self._page_markers[key] = marker.lower() in low
+        return found
+
+    def stop_offset(self, stop_markers: List[str], hard_limit: int = 8) -> int:
+        """
+        Durma işaretçisini içeren ilk sayfanın (dahil) birleşik metindeki bitiş ofseti.
+
+        Args:
+            stop_markers: Durma işaretçileri listesi
+            hard_limit: Maksimum kaç sayfa toplanacak
+
+        Returns:
+            Ofset (işaretçi yoksa `hard_limit`. sayfanın sonu)
+        """
+        count = min(len(self.texts), hard_limit)
+        for idx in range(count):
+            if any(self.page_has(idx, marker) for marker in stop_markers):
+                return self.page_ends[idx]
+        return self.page_ends[count - 1] if count else 0
+
+    def window(self, stop_markers: List[str], hard_limit: int = 8) -> "IndexedText":
+        """Durma işaretçilerine kadar birleştirilmiş metnin dizinli karşılığı"""
+        return IndexedText(self, self.stop_offset(stop_markers, hard_limit))
+
+    def find(self, pattern: Pattern, pos: int, endpos: int) -> Optional[Match]:
+        """
+        `pattern.search(self.text, pos, endpos)` ile aynı sonucu verir.
+
+        Birleşik metindeki ilk eşleşme dizinden okunur: `endpos`'tan önce
+        bitiyorsa kısaltılmış metnin sonucu da odur, hiç yoksa kısaltılmış
+        metinde de yoktur. Bu yalnızca çapa/lookaround içermeyen işaretçi
+        kalıpları için geçerlidir.
+        """
+        if pattern in SECTION_MARKERS:
+            hit = self._next_occurrence(pattern, pos)
+        else:
+            key = (pattern, pos)
+            hit = self._hits.get(key, _MISSING)
+            if hit is _MISSING:
+                hit = self._hits[key] = pattern.search(self.text, pos)
+        if hit is None or hit.end() <= endpos:
+            return hit
+        return pattern.search(self.text, pos, endpos)
+
+    def _next_occurrence(self, marker: Pattern, pos: int) -> Optional[Match]:
+        """Bölüm işaretçisinin `pos` ve sonrasındaki ilk konumu (tarama gerektiği kadar ilerletilir)"""
+        entry = self._occurrences.get(marker)
+        if entry is None:
+            entry = self._occurrences[marker] = [[], [], 0]
+        starts, matches = entry[0], entry[1]
+        while entry[2] is not None and (not starts or starts[-1] < pos):
+            match = marker.search(self.text, entry[2])
+            if match is None:
+                entry[2] = None
+            else:
+                starts.append(match.start())
+                matches.append(match)
+                entry[2] = match.start() + 1
+        i = bisect_left(starts, pos)
+        return matches[i] if i < len(matches) else None
+
+
+class IndexedText:
+    """Dizinli pencerenin `endpos`'a kadar olan öneki (birleştirilmiş metnin yerine geçer)"""
+
+    __slots__ = ("index", "endpos")
+
+    def __init__(self, index: MarkerIndex, endpos: int):
+        self.index = index
+        self.endpos = endpos
+
+    def __str__(self) -> str:
+        return self.index.text[:self.endpos]
+
+
+Text = Union[str, IndexedText]
+
+
+def search(name: str, text: Text) -> Optional[SearchResult]:
+    """
+    Kayıt defterindeki kalıbı metinde arar.
+
+    Args:
+        name: Kalıp adı (REGISTRY anahtarı)
+        text: İşlenecek metin veya dizinli pencere öneki
+
+    Returns:
+        re.Match / SectionMatch veya None
+    """
+    return REGISTRY[name].search(text)
@@ -0,0 +1,189 @@
+"""
+Text Preprocessing Module for LIFT UP Dataset
+=============================================
+notebooks/Data_Preprocessing.ipynb'deki metin ön işlemesini yeniden
+kullanılabilir hale getirir: Türkçe başlık, özet ve anahtar kelimeler
+temizlenir ve `combined_text` sütununda birleştirilir.
+
+Transformer tabanlı modellerin bağlamsal yapısı nedeniyle yalnızca hafif
+temizlik yapılır: küçük harfe çevirme, boşlukların birleştirilmesi ve
+anlamsal katkısı olmayan özel karakterlerin kaldırılması. Sonuç notebook'taki
+`clean_text` ile birebir aynıdır; boş (NaN) değerler boş metin olur.
+
+Büyük girdiler satır parçalarına bölünüp süreç havuzunda temizlenir; çıktı
+varsayılan olarak Parquet'tir.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from outputs import read_articles, write_frame
+
+
+# Temizlenecek sütunlar ve temizlenmiş sütun adları
+CLEAN_COLUMNS = {
+    "Title_TR": "title_tr_clean",
+    "Abstract_TR": "abstract_tr_clean",
+    "Keywords_TR": "keywords_tr_clean",
+}
+
+# Girdiden okunan sütunlar (şimdilik yalnızca Türkçe özellikler kullanılıyor)
+INPUT_COLUMNS = ["Year"] + list(CLEAN_COLUMNS)
+
+# Kaldırılan anlamsız özel karakterler
+REMOVED_CHARS = "#%&*_=+<>"
+_REMOVE = str.maketrans("", "", REMOVED_CHARS)
+
+# Varsayılan girdi/çıktı, parça boyutu ve süreç havuzuna geçilen satır sayısı
+DEFAULT_INPUT = "all_articles.parquet"
+DEFAULT_OUTPUT = "articles_clean.parquet"
+DEFAULT_CHUNK_ROWS = 20000
+PARALLEL_THRESHOLD_ROWS = 50000
+
+
+def clean_text(text: Any) -> str:
+    """
+    Metni küçük harfe çevirir, boşlukları birleştirir ve özel karakterleri kaldırır.
+
+    `lower()` + `re.sub(r"\\s+", " ")` + `re.sub(r"[#%&*_=+<>]", "")` +
+    `strip()` ile aynı sonucu regex kullanmadan üretir: `split()` aynı
+    boşluk karakterlerinde böler, özel karakterler önceden derlenmiş
+    çeviri tablosuyla tek geçişte silinir.
+
+    Args:
+        text: Temizlenecek metin (metin değilse, ör. NaN, boş metin döner)
+
+    Returns:
+        Temizlenmiş metin
+    """
+    if not isinstance(text, str):
+        return ""
+    return " ".join(text.lower().split()).translate(_REMOVE).strip()
+
+
+def clean_values(values: Iterable[Any]) -> List[str]:
+    """Değer listesini temizler (bkz. clean_text)"""
+    return [clean_text(value) for value in values]
+
+
+def _clean_chunk(columns: Dict[str, List[Any]]) -> Dict[str, List[str]]:
+    """
+    Sütun parçalarını temizler (süreç havuzunda çalışabilmesi için modül seviyesinde).
+
+    Args:
+        columns: Kaynak sütun adı -> değer listesi
+
+    Returns:
+        Temizlenmiş sütun adı -> temizlenmiş değer listesi
+    """
+    return {CLEAN_COLUMNS[col]: clean_values(values) for col, values in columns.items()}
+
+
+def preprocess_frame(df: pd.DataFrame, workers: int = 1,
+                     chunksize: int = DEFAULT_CHUNK_ROWS) -> pd.DataFrame:
+    """
+    Temizlenmiş sütunları ve `combined_text`'i ekler.
+
+    Args:
+        df: CLEAN_COLUMNS sütunlarını içeren DataFrame
+        workers: >1 ise ve satır sayısı PARALLEL_THRESHOLD_ROWS'u aşıyorsa
+            parçalar bu kadar süreçte temizlenir
+        chunksize: Süreç havuzuna gönderilen parça başına satır sayısı
+
+    Returns:
+        Yeni DataFrame (girdi değiştirilmez)
+    """
+    sources = {col: df[col].tolist() for col in CLEAN_COLUMNS}
+    if workers > 1 and len(df) > PARALLEL_THRESHOLD_ROWS:
+        chunks = [{col: values[start:start + chunksize] for col, values in sources.items()}
+                  for start in range(0, len(df), chunksize)]
+        cleaned: Dict[str, List[str]] = {name: [] for name in CLEAN_COLUMNS.values()}
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            for result in executor.map(_clean_chunk, chunks):
+                for name, values in result.items():
+                    cleaned[name].extend(values)
+    else:
+        cleaned = _clean_chunk(sources)
+
+    out = df.copy()
+    for name, values in cleaned.items():
+        out[name] = pd.Series(values, index=df.index, dtype="str")
+
+    # Başlık, özet ve anahtar kelimeler projenin anlamsal bağlamını bütüncül
+    # temsil eden tek bir metinde birleştirilir
+    out["combined_text"] = (
+        out["title_tr_clean"] + " " +
+        out["abstract_tr_clean"] + " " +
+        out["keywords_tr_clean"]
+    )
+    return out
+
+
+def preprocess_file(input_path: str = DEFAULT_INPUT, output_path: str = DEFAULT_OUTPUT,
+                    workers: int = 1, chunksize: int = DEFAULT_CHUNK_ROWS) -> Dict[str, Any]:
+    """
+    Birleşik veri setini okur (yalnızca INPUT_COLUMNS), ön işler ve yazar.
+
+    Args:
+        input_path: Birleşik veri seti (CSV, Parquet veya Feather)
+        output_path: Çıktı dosyası (format uzantıdan belirlenir)
+        workers: Temizlik için süreç sayısı
+        chunksize: Parça başına satır sayısı
+
+    Returns:
+        {"rows", "empty", "seconds"} özeti ("empty": boş değer içeren kaynak sütun sayıları)
+    """
+    if not os.path.exists(input_path):
+        raise FileNotFoundError(f"❌ Girdi bulunamadı: {input_path}")
+
+    started = time.perf_counter()
+    df = read_articles(input_path, INPUT_COLUMNS)
+    empty = {col: int(count) for col, count in df[list(CLEAN_COLUMNS)].isnull().sum().items()
+             if count}
+    out = preprocess_frame(df, workers=workers, chunksize=chunksize)
+    write_frame(out, output_path)
+
+    seconds = round(time.perf_counter() - started, 2)
+    for col, count in empty.items():
+        print(f"⚠️  {col}: {count} boş değer boş metin olarak temizlendi")
+    print(f"✨ {len(out)} kayıt ön işlendi: {output_path} ({seconds} sn)")
+    return {"rows": len(out), "empty": empty, "seconds": seconds}
+
+
+# ====================================================================
+# MAIN EXECUTION
+# ====================================================================
+
+def main(argv: Optional[List[str]] = None):
+    """Ana çalıştırma fonksiyonu"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="LIFT UP Dataset Preprocessing Tool")
+    parser.add_argument("input", nargs="?", default=DEFAULT_INPUT,
+                        help="Birleşik veri seti (CSV, Parquet veya Feather)")
+    parser.add_argument("--out", default=DEFAULT_OUTPUT,
+                        help="Çıktı dosyası (.parquet, .feather veya .csv)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help=f">1 ise {PARALLEL_THRESHOLD_ROWS} satırdan büyük girdiler paralel temizlenir")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS,
+                        help="Süreç havuzuna gönderilen parça başına satır sayısı")
+    args = parser.parse_args(argv)
+
+    try:
+        preprocess_file(args.input, args.out, workers=args.workers, chunksize=args.chunk_rows)
+    except Exception as e:
+        print(f"\n❌ HATA: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
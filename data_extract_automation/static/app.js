@@ -19,6 +19,7 @@ const uploadForm = document.getElementById('uploadForm');
 const submitBtn = document.getElementById('submitBtn');
 const progressSection = document.getElementById('progressSection');
 const progressText = document.getElementById('progressText');
+const progressBar = document.getElementById('progressBar');
 const resultSection = document.getElementById('resultSection');
 const resultMessage = document.getElementById('resultMessage');
 const downloadBtn = document.getElementById('downloadBtn');
@@ -156,15 +157,23 @@ uploadForm.addEventListener('submit', async (e) => {
 
         const data = await response.json();
 
-        if (data.success) {
+        if (!data.success) {
+            showError(data.error || 'Bir hata oluştu!');
+            return;
+        }
+
+        // İş kuyruğa alındı; bitene kadar ilerlemesini izle
+        const result = await waitForJob(data.job_id);
+
+        if (result.success) {
             // Store for download
-            currentTempId = data.temp_id;
-            currentFilename = data.csv_filename;
+            currentTempId = result.temp_id;
+            currentFilename = result.csv_filename;
 
             // Show success
-            showSuccess(data.article_count, data.csv_filename);
+            showSuccess(result.article_count, result.csv_filename);
         } else {
-            showError(data.error || 'Bir hata oluştu!');
+            showError(result.error || 'Bir hata oluştu!');
         }
 
     } catch (error) {
@@ -173,6 +182,89 @@ uploadForm.addEventListener('submit', async (e) => {
     }
 });
 
+const JOB_POLL_INTERVAL = 1000;
+
+const STAGE_LABELS = {
+    opening: 'PDF açılıyor',
+    hashing: 'Sayfalar karşılaştırılıyor',
+    extracting: 'Makaleler çıkarılıyor',
+    writing: 'CSV dosyası oluşturuluyor',
+    done: 'Tamamlandı'
+};
+
+async function waitForJob(jobId) {
+    // İlerleme /events (SSE) akışından izlenir; desteklenmiyorsa veya bağlantı
+    // koparsa /status yoklamasına dönülür. Sonuç /result'tan alınır.
+    if (window.EventSource) {
+        await watchJobEvents(jobId);
+    }
+    await pollJobStatus(jobId);
+
+    const resultResponse = await fetch(`/result/${jobId}`);
+    return await resultResponse.json();
+}
+
+function watchJobEvents(jobId) {
+    // İş bitince veya akış hata verince çözülür
+    return new Promise(resolve => {
+        const source = new EventSource(`/events/${jobId}`);
+        source.onmessage = event => {
+            const status = JSON.parse(event.data);
+            updateProgress(status);
+            if (status.status === 'done' || status.status === 'failed') {
+                source.close();
+                resolve();
+            }
+        };
+        source.onerror = () => {
+            source.close();
+            resolve();
+        };
+    });
+}
+
+async function pollJobStatus(jobId) {
+    // İş bitene kadar /status uç noktasını yoklar
+    while (true) {
+        const response = await fetch(`/status/${jobId}`);
+        const status = await response.json();
+
+        if (!status.success) {
+            return;
+        }
+        updateProgress(status);
+        if (status.status === 'done' || status.status === 'failed') {
+            return;
+        }
+
+        await new Promise(resolve => setTimeout(resolve, JOB_POLL_INTERVAL));
+    }
+}
+
+function updateProgress(status) {
+    const progress = status.progress || {};
+
+    if (status.status === 'queued') {
+        progressText.textContent = 'İş sırada bekliyor...';
+        return;
+    }
+    if (!progress.stage) {
+        return;
+    }
+
+    const parts = [STAGE_LABELS[progress.stage] || progress.stage];
+    if (progress.page_count) {
+        parts.push(`${progress.pages_scanned} / ${progress.page_count} sayfa`);
+        const percent = Math.min(100, Math.round(progress.pages_scanned / progress.page_count * 100));
+        progressBar.style.width = `${Math.max(percent, 5)}%`;
+    }
+    parts.push(`${progress.articles} makale`);
+    if (progress.pages_per_sec) {
+        parts.push(`${progress.pages_per_sec.toFixed(1)} sayfa/sn`);
+    }
+    progressText.textContent = parts.join(' • ');
+}
+
 // ============================================
 // DOWNLOAD HANDLER
 // ============================================
@@ -204,13 +296,10 @@ async function downloadCSV() {
         document.body.removeChild(link);
 
         // Show success notification
+        // (Dosyalar sunucuda aynı PDF'in sonraki yüklemeleri için saklanır;
+        // süre ve boyut sınırıyla sunucu tarafından temizlenir)
         showNotification('CSV dosyası indiriliyor...', 'success');
 
-        // Cleanup after download
-        setTimeout(() => {
-            cleanupTempFiles();
-        }, 2000);
-
     } catch (error) {
         console.error('Download error:', error);
         showError('İndirme sırasında bir hata oluştu!');
@@ -327,22 +416,6 @@ function truncateText(text, maxLength) {
     return text.substring(0, maxLength) + '...';
 }
 
-// ============================================
-// CLEANUP
-// ============================================
-
-async function cleanupTempFiles() {
-    if (!currentTempId) return;
-
-    try {
-        await fetch(`/cleanup/${currentTempId}`, {
-            method: 'POST'
-        });
-    } catch (error) {
-        console.error('Cleanup error:', error);
-    }
-}
-
 // ============================================
 // RESET HANDLERS
 // ============================================
@@ -368,34 +441,14 @@ function showProgress() {
     submitBtn.classList.add('d-none');
     progressSection.classList.remove('d-none');
 
-    // Update progress text
-    const messages = [
-        'PDF dosyanız yükleniyor...',
-        'Makaleler taranıyor...',
-        'Başlıklar çıkarılıyor...',
-        'Özetler işleniyor...',
-        'Anahtar kelimeler belirleniyor...',
-        'CSV dosyası oluşturuluyor...'
-    ];
-
-    let index = 0;
-    const interval = setInterval(() => {
-        progressText.textContent = messages[index];
-        index = (index + 1) % messages.length;
-    }, 2000);
-
-    // Store interval ID to clear it later
-    progressSection.dataset.intervalId = interval;
+    // Gerçek ilerleme waitForJob ile gelene kadar yükleme durumu gösterilir
+    progressBar.style.width = '100%';
+    progressText.textContent = 'PDF dosyanız yükleniyor...';
 }
 
 function showSuccess(articleCount, filename) {
     hideAllSections();
 
-    // Clear progress interval
-    if (progressSection.dataset.intervalId) {
-        clearInterval(parseInt(progressSection.dataset.intervalId));
-    }
-
     resultMessage.innerHTML = `
         <strong>${articleCount}</strong> makale başarıyla işlendi! 
         <br><small class="text-muted mt-1">${filename}</small>
@@ -409,11 +462,6 @@ function showSuccess(articleCount, filename) {
 function showError(message) {
     hideAllSections();
 
-    // Clear progress interval
-    if (progressSection.dataset.intervalId) {
-        clearInterval(parseInt(progressSection.dataset.intervalId));
-    }
-
     submitBtn.classList.remove('d-none');
     errorMessage.textContent = message;
     errorSection.classList.remove('d-none');
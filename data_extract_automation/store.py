@@ -0,0 +1,328 @@
+"""
+Result Store Module for LIFT UP Web Interface
+=============================================
+Web arayüzünün çıktı dizinlerini (`lift_up_<anahtar>`) PDF içerik hash'i ve
+yıl ile anahtarlar. Aynı PDF tekrar yüklendiğinde mevcut CSV ve sonuç
+bilgisi yeniden kullanılır.
+
+Depo toplam boyut ve ömür ile sınırlıdır: süresi dolan dizinler ve boyut
+sınırı aşılınca en eski erişilen dizinler (LRU) silinir. Sonucu henüz
+yazılmamış (işlenmekte olan) dizinler yalnızca süreleri dolunca silinir.
+Sınırlar her kayıt yazımında ve `StoreJanitor` ile arka planda düzenli
+olarak uygulanır (yarım kalmış veya terk edilmiş dizinler de temizlenir).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from uploads import UPLOAD_PREFIX
+
+
+# Varsayılan boyut sınırı ve dizin ömrü
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024  # 1GB
+DEFAULT_TTL = 24 * 60 * 60  # 24 saat
+
+# Dizin adı öneki ve sonuç dosyası
+PREFIX = "lift_up_"
+RESULT_FILE = "result.json"
+
+# Anahtarlar hex karakterlerden oluşur; öneki paylaşan diğer dizinler
+# (ör. benchmark verileri) depoya dahil edilmez
+_KEY_CHARS = frozenset("0123456789abcdef")
+
+
+def dir_size(path: str) -> int:
+    """Dizindeki dosyaların toplam boyutu (byte)"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except FileNotFoundError:
+                pass
+    return total
+
+
+class ResultStore:
+    """
+    İçerik hash'i + yıl ile anahtarlanan, boyutu ve ömrü sınırlı çıktı dizinleri.
+
+    Her kayıt `root` altında bir `lift_up_<anahtar>` dizinidir; son erişim
+    zamanı dizinin mtime'ı ile tutulur. Dizin içindeki `result.json` işin
+    tamamlandığını gösterir.
+    """
+
+    def __init__(self, root: str, max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttl: float = DEFAULT_TTL, fingerprint: str = ""):
+        """
+        Args:
+            root: Dizinlerin oluşturulacağı kök dizin
+            max_bytes: Deponun toplam maksimum boyutu (byte)
+            ttl: Son erişimden sonra dizinin saklanacağı süre (saniye)
+            fingerprint: Çıkarıcı sürüm/konfigürasyon parmak izi
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.fingerprint = fingerprint
+
+    def key(self, content_hash: str, year: str) -> str:
+        """İçerik hash'i, yıl ve parmak izinden kayıt anahtarı üretir"""
+        raw = "|".join((content_hash, year, self.fingerprint))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+    def path(self, key: str) -> str:
+        """Kaydın dizin yolu"""
+        return os.path.join(self.root, PREFIX + key)
+
+    def create(self, key: str) -> str:
+        """
+        Kaydın dizinini oluşturur (varsa yeniden kullanır).
+
+        Returns:
+            Dizin yolu
+        """
+        path = self.path(key)
+        os.makedirs(path, exist_ok=True)
+        self.touch(key)
+        return path
+
+    def touch(self, key: str):
+        """Kaydın son erişim zamanını günceller"""
+        try:
+            os.utime(self.path(key), None)
+        except FileNotFoundError:
+            pass
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Tamamlanmış kaydın sonuç bilgisini okur ve son erişim zamanını günceller.
+
+        Args:
+            key: Kayıt anahtarı
+
+        Returns:
+            Sonuç bilgisi veya kayıt yoksa/süresi dolduysa/eksikse None
+        """
+        path = self.path(key)
+        try:
+            if time.time() - os.stat(path).st_mtime > self.ttl:
+                self.remove(key)
+                return None
+            with open(os.path.join(path, RESULT_FILE), "r", encoding="utf-8") as f:
+                result = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        # Kayıt dizini silinmiş dosyaları (ör. CSV) gösteriyorsa geçersizdir
+        if not os.path.exists(os.path.join(path, result.get("csv_filename", ""))):
+            return None
+        self.touch(key)
+        return result
+
+    def put(self, key: str, result: Dict[str, Any]):
+        """
+        Sonuç bilgisini atomik olarak yazar (kaydı tamamlanmış yapar) ve
+        gerekirse eski kayıtları siler.
+
+        Args:
+            key: Kayıt anahtarı
+            result: JSON'a çevrilebilir sonuç bilgisi
+        """
+        self._write_json(key, RESULT_FILE, result)
+        self.evict(keep=(key,))
+
+    def _write_json(self, key: str, name: str, payload: Dict[str, Any]):
+        """Kayıt dizinine JSON dosyasını atomik olarak yazar"""
+        path = self.create(key)
+        fd, tmp_path = tempfile.mkstemp(dir=path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, os.path.join(path, name))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def remove(self, key: str):
+        """Kaydın dizinini siler"""
+        shutil.rmtree(self.path(key), ignore_errors=True)
+
+    def _entries(self) -> List[Tuple[float, int, bool, str]]:
+        """(son erişim, boyut, tamamlandı mı, anahtar) listesini döndürür"""
+        entries = []
+        if not os.path.isdir(self.root):
+            return entries
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            key = name[len(PREFIX):]
+            if not name.startswith(PREFIX) or not key or not _KEY_CHARS.issuperset(key) \
+                    or not os.path.isdir(path):
+                continue
+            try:
+                mtime = os.stat(path).st_mtime
+            except FileNotFoundError:
+                continue
+            complete = os.path.exists(os.path.join(path, RESULT_FILE))
+            entries.append((mtime, dir_size(path), complete, key))
+        return entries
+
+    def evict(self, keep: Iterable[str] = ()) -> Dict[str, int]:
+        """
+        Süresi dolan kayıtları, ardından boyut sınırı aşıldıysa en eski erişilen
+        tamamlanmış kayıtları siler.
+
+        Args:
+            keep: Silinmeyecek kayıt anahtarları
+
+        Returns:
+            {"evicted", "evicted_bytes", "dirs_held", "bytes_held"} sayıları
+        """
+        keep = frozenset(keep)
+        now = time.time()
+        evicted = evicted_bytes = 0
+        live = []
+        for entry in self._entries():
+            mtime, size, _, key = entry
+            if key not in keep and now - mtime > self.ttl:
+                self.remove(key)
+                evicted += 1
+                evicted_bytes += size
+            else:
+                live.append(entry)
+
+        total = sum(size for _, size, _, _ in live)
+        held = len(live)
+        for _, size, complete, key in sorted(live):
+            if total <= self.max_bytes:
+                break
+            if not complete or key in keep:
+                continue
+            self.remove(key)
+            evicted += 1
+            evicted_bytes += size
+            held -= 1
+            total -= size
+        return {"evicted": evicted, "evicted_bytes": evicted_bytes,
+                "dirs_held": held, "bytes_held": total}
+
+    def size_bytes(self) -> int:
+        """Deponun toplam boyutu"""
+        return sum(size for _, size, _, _ in self._entries())
+
+
+class StoreJanitor:
+    """
+    Depo sınırlarını arka planda düzenli olarak uygulayan temizlik thread'i.
+
+    Kayıt yazılmadan terk edilen dizinler (tarayıcı kapatıldı, iş hata verdi,
+    süreç çöktü) ve diske taşmış yarım yüklemeler de böylece süreleri dolunca
+    silinir. Toplam ve son tarama sayıları `metrics` ile okunur.
+    """
+
+    def __init__(self, store: ResultStore, interval: float = 300,
+                 keep: Optional[Callable[[], Iterable[str]]] = None):
+        """
+        Args:
+            store: Temizlenecek depo
+            interval: Taramalar arası süre (saniye)
+            keep: Silinmemesi gereken (ör. işlenmekte olan) anahtarları döndüren fonksiyon
+        """
+        self.store = store
+        self.interval = interval
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._metrics: Dict[str, Any] = {
+            "sweeps": 0,
+            "dirs_evicted": 0,
+            "bytes_evicted": 0,
+            "uploads_removed": 0,
+            "dirs_held": 0,
+            "bytes_held": 0,
+            "last_sweep": None,
+            "last_error": None,
+        }
+
+    def start(self):
+        """Arka plan thread'ini başlatır (ilk tarama hemen yapılır)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="store-janitor", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Arka plan thread'ini durdurur"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    def sweep(self) -> Dict[str, int]:
+        """
+        Depoyu bir kez tarar: süresi dolan ve boyut sınırını aşan dizinleri,
+        süresi dolan yarım yüklemeleri siler.
+
+        Returns:
+            Bu taramanın sonucu (bkz. ResultStore.evict)
+        """
+        keep = tuple(self.keep()) if self.keep is not None else ()
+        with self._lock:
+            result = self.store.evict(keep)
+            uploads = self._remove_stale_uploads()
+            metrics = self._metrics
+            metrics["sweeps"] += 1
+            metrics["dirs_evicted"] += result["evicted"]
+            metrics["bytes_evicted"] += result["evicted_bytes"]
+            metrics["uploads_removed"] += uploads
+            metrics["dirs_held"] = result["dirs_held"]
+            metrics["bytes_held"] = result["bytes_held"]
+            metrics["last_sweep"] = time.time()
+        return result
+
+    def metrics(self) -> Dict[str, Any]:
+        """Toplam ve son tarama sayıları (JSON'a çevrilebilir)"""
+        with self._lock:
+            return dict(self._metrics, max_bytes=self.store.max_bytes, ttl=self.store.ttl,
+                        interval=self.interval)
+
+    def _remove_stale_uploads(self) -> int:
+        """Diske taşmış ama işe aktarılmamış, süresi dolmuş yükleme dosyalarını siler"""
+        removed = 0
+        now = time.time()
+        try:
+            names = os.listdir(self.store.root)
+        except FileNotFoundError:
+            return 0
+        for name in names:
+            if not name.startswith(UPLOAD_PREFIX):
+                continue
+            path = os.path.join(self.store.root, name)
+            try:
+                if os.path.isfile(path) and now - os.stat(path).st_mtime > self.store.ttl:
+                    os.remove(path)
+                    removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    def _run(self):
+        while True:
+            try:
+                self.sweep()
+            except Exception as e:
+                with self._lock:
+                    self._metrics["last_error"] = f"{type(e).__name__}: {e}"
+                print(f"⚠️  Temizlik hatası: {e}")
+            if self._stop.wait(self.interval):
+                return
@@ -0,0 +1,159 @@
+"""
+Streaming Upload Module for LIFT UP Web Interface
+=================================================
+Yüklenen PDF'i form ayrıştırılırken parça parça alır ve aynı anda SHA-256
+hash'ini hesaplar. Küçük dosyalar bellekte tutulur ve `fitz.open(stream=...)`
+ile açılır; sınırı aşan dosyalar bir kez diske yazılır ve yerinde taşınır.
+
+Böylece yükleme diske kaydedilip hash ve çıkarım için yeniden okunmaz;
+önbellekte sonucu olan dosyalar çıkarım kuyruğuna girmeden yanıtlanır.
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+from typing import Optional
+
+
+# Bellekte tutulacak maksimum yükleme boyutu (üstü diske taşınır)
+DEFAULT_SPOOL_BYTES = 8 * 1024 * 1024  # 8MB
+
+# Akıştan okuma parçası boyutu
+CHUNK_SIZE = 1024 * 1024
+
+# Diske taşan yüklemelerin geçici dosya öneki
+UPLOAD_PREFIX = "lift_up_upload_"
+
+
+class SpooledUpload:
+    """
+    Yazılırken hash'lenen, boyutu sınırı aşınca diske taşan dosya benzeri nesne.
+
+    Werkzeug'un multipart ayrıştırıcısı dosya içeriğini buraya yazar
+    (bkz. `Request._get_file_stream`); ayrıştırma bitince `sha256` ve `size`
+    hazırdır. Diske taşan içerik `persist` ile kopyalanmadan yerine taşınır;
+    taşınmayan geçici dosya `close` ile silinir.
+    """
+
+    def __init__(self, max_memory: int = DEFAULT_SPOOL_BYTES, dir: Optional[str] = None):
+        """
+        Args:
+            max_memory: Bellekte tutulacak maksimum boyut (byte)
+            dir: Diske taşan içeriğin yazılacağı dizin (None ise sistem geçici dizini)
+        """
+        self.max_memory = max_memory
+        self.dir = dir
+        self.size = 0
+        # Diske taşan içeriğin yolu ve hâlâ geçici dosya olup olmadığı
+        self.path: Optional[str] = None
+        self._temporary = False
+        self._digest = hashlib.sha256()
+        self._file = io.BytesIO()
+
+    @classmethod
+    def from_stream(cls, stream, max_memory: int = DEFAULT_SPOOL_BYTES,
+                    dir: Optional[str] = None) -> "SpooledUpload":
+        """
+        Okunabilir bir akışı parça parça kopyalayarak SpooledUpload oluşturur.
+
+        Args:
+            stream: Okunabilir ikili akış
+            max_memory: Bellekte tutulacak maksimum boyut (byte)
+            dir: Diske taşan içeriğin yazılacağı dizin
+        """
+        upload = cls(max_memory, dir)
+        for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+            upload.write(chunk)
+        upload.seek(0)
+        return upload
+
+    @property
+    def sha256(self) -> str:
+        """Şimdiye kadar yazılan içeriğin hex formatında SHA-256 hash'i"""
+        return self._digest.hexdigest()
+
+    @property
+    def in_memory(self) -> bool:
+        """İçerik hâlâ bellekte mi"""
+        return self.path is None
+
+    def write(self, data: bytes) -> int:
+        self._digest.update(data)
+        self.size += len(data)
+        if self.in_memory and self.size > self.max_memory:
+            self._rollover()
+        return self._file.write(data)
+
+    def _rollover(self):
+        """Bellekteki içeriği geçici bir dosyaya taşır"""
+        fd, path = tempfile.mkstemp(dir=self.dir, prefix=UPLOAD_PREFIX, suffix=".pdf")
+        target = os.fdopen(fd, "w+b")
+        target.write(self._file.getvalue())
+        self._file.close()
+        self._file = target
+        self.path = path
+        self._temporary = True
+
+    def getvalue(self) -> bytes:
+        """
+        Bellekteki içeriği döndürür.
+
+        Raises:
+            ValueError: İçerik diske taşındıysa
+        """
+        if not self.in_memory:
+            raise ValueError("Yükleme diske taşındı, içerik için `persist` kullanın")
+        return self._file.getvalue()
+
+    def persist(self, path: str) -> str:
+        """
+        İçeriği verilen yola yazar; diske taşmış içerik kopyalanmadan taşınır.
+
+        Args:
+            path: Hedef dosya yolu (aynı dosya sistemi önerilir)
+
+        Returns:
+            Hedef dosya yolu
+        """
+        if self.in_memory:
+            with open(path, "wb") as f:
+                f.write(self._file.getvalue())
+            return path
+        self._file.close()
+        try:
+            os.replace(self.path, path)
+        except OSError:
+            # Farklı dosya sistemleri arasında taşınamaz; kopyalanır
+            import shutil
+            shutil.move(self.path, path)
+        self._file = open(path, "rb")
+        self.path = path
+        self._temporary = False
+        return path
+
+    def close(self):
+        """Dosyayı kapatır; `persist` edilmemiş geçici dosyayı siler"""
+        self._file.close()
+        if self._temporary:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            self._temporary = False
+
+    # Werkzeug/FileStorage için dosya arayüzü
+    def read(self, size: int = -1) -> bytes:
+        return self._file.read(size)
+
+    def readline(self, size: int = -1) -> bytes:
+        return self._file.readline(size)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def __iter__(self):
+        return iter(self._file)
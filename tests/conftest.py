@@ -0,0 +1,44 @@
+"""
+Test ortamı: modüller proje kökünden değil, kendi klasörlerinden bare
+isimle içe aktarıldığı için (ör. `import patterns`) klasörler sys.path'e eklenir.
+Birden fazla test modülünün kullandığı örnek PDF ve tam çalıştırma burada tanımlanır.
+"""
+
+import os
+import sys
+
+import pytest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (os.path.join(ROOT, "data_extract_automation"), os.path.join(ROOT, "benchmarks")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+@pytest.fixture(scope="session")
+def sample_pdf(tmp_path_factory):
+    """Küçük sentetik bildiri kitabı (oturum boyunca bir kez üretilir)"""
+    from synthetic import generate
+
+    path = str(tmp_path_factory.mktemp("pdf") / "sample.pdf")
+    generate(path, 40, seed=3)
+    return path
+
+
+def read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@pytest.fixture
+def full_run(tmp_path):
+    """PDF'i varsayılan seri akış moduyla işleyip CSV içeriğini döndüren fonksiyon"""
+    from data_extract import PDFProcessor
+
+    def run(pdf_path, name="full.csv"):
+        output_csv = str(tmp_path / name)
+        PDFProcessor().process_pdf(pdf_path, "2024", output_csv)
+        return read_bytes(output_csv)
+
+    return run
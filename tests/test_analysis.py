@@ -0,0 +1,96 @@
+"""
+Analiz testleri: tek geçişte çıkarılan profilden türetilen rapor, önceki
+sütun sütun hesaplanan raporla aynıdır; parça parça analiz (eşit sayılı
+yıllar dahil) tam analizle aynı raporu verir.
+"""
+
+import os
+import random
+
+import pandas as pd
+import pytest
+
+from analysis import CSVAnalyzer, StreamingCSVAnalyzer
+from outputs import ARTICLE_COLUMNS, write_articles
+
+
+def _rows(count, years, seed):
+    rng = random.Random(seed)
+    words = ["üretim", "sistem", "line", "analiz, veri", "çok\nsatırlı", "robot", "İzmir"]
+    rows = []
+    for i in range(count):
+        row = {"PageNumber": 3 * i + 1, "Year": years[i % len(years)] if years else "2024"}
+        for col in ARTICLE_COLUMNS[2:]:
+            row[col] = "" if rng.random() < 0.2 else " ".join(rng.sample(words, rng.randint(1, 4)))
+        rows.append(row)
+    return rows
+
+
+def _baseline_analysis(csv_path):
+    """Sütun sütun hesaplanan önceki CSVAnalyzer raporu"""
+    df = pd.read_csv(csv_path, encoding="utf-8-sig")
+    missing = df.isnull().sum()
+    missing_percent = (missing / len(df) * 100).round(2)
+    filled = {col: int((~df[col].isnull()).sum()) for col in ARTICLE_COLUMNS[2:]}
+    lengths = {}
+    for col in ARTICLE_COLUMNS[2:]:
+        values = df[col].dropna().str.len()
+        if len(values) > 0:
+            lengths[col] = {"avg_length": round(values.mean(), 2),
+                            "min_length": int(values.min()),
+                            "max_length": int(values.max())}
+    total = len(df)
+    return {
+        "basic_stats": {"total_articles": total, "total_columns": len(df.columns),
+                        "columns": df.columns.tolist(), "file_size": os.path.getsize(csv_path)},
+        "missing_values": {
+            "has_missing": bool((missing > 0).any()),
+            "total_missing": int(missing.sum()),
+            "details": [{"column": col, "count": int(missing[col]),
+                         "percentage": float(missing_percent[col])}
+                        for col in df.columns if missing[col] > 0],
+        },
+        "first_rows": df.head(5).fillna("").to_dict("records"),
+        "year_distribution": {str(k): int(v) for k, v in df["Year"].value_counts().items()},
+        "language_stats": {
+            "tr_titles_filled": filled["Title_TR"], "en_titles_filled": filled["Title_EN"],
+            "tr_abstracts_filled": filled["Abstract_TR"], "en_abstracts_filled": filled["Abstract_EN"],
+            "tr_keywords_filled": filled["Keywords_TR"], "en_keywords_filled": filled["Keywords_EN"],
+            "tr_completeness": round((filled["Title_TR"] + filled["Abstract_TR"]
+                                      + filled["Keywords_TR"]) / (total * 3) * 100, 2),
+            "en_completeness": round((filled["Title_EN"] + filled["Abstract_EN"]
+                                      + filled["Keywords_EN"]) / (total * 3) * 100, 2),
+        },
+        "text_length_stats": lengths,
+    }
+
+
+@pytest.mark.parametrize("years", [
+    ["2020-2021"],
+    ["2021-2022", "2020-2021", "2021-2022", "2022-2023"],
+    ["2022-2023", "2020-2021", "2021-2022"],
+])
+def test_full_analysis_matches_baseline(tmp_path, years):
+    csv_path = str(tmp_path / "articles.csv")
+    write_articles(_rows(97, years, seed=len(years)), csv_path)
+
+    assert CSVAnalyzer(csv_path).get_full_analysis() == _baseline_analysis(csv_path)
+
+
+# Her yıl eşit sayıda; parçalardaki ilk görülme sırası dosyadakinden farklı
+TIED_YEARS = ["2021-2022"] + ["2020-2021"] * 3 + ["2022-2023"] * 3 + ["2021-2022"] * 2
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet", "feather"])
+@pytest.mark.parametrize("chunksize", [1, 2, 3, 50])
+def test_streaming_matches_full_analysis_with_tied_years(tmp_path, fmt, chunksize):
+    path = str(tmp_path / f"articles.{fmt}")
+    rows = _rows(len(TIED_YEARS) * 6, TIED_YEARS, seed=chunksize)
+    write_articles(rows, path, fmt)
+
+    full = CSVAnalyzer(path).get_full_analysis()
+    streaming = StreamingCSVAnalyzer(path, chunksize=chunksize).get_full_analysis()
+
+    assert list(full["year_distribution"]) == ["2021-2022", "2020-2021", "2022-2023"]
+    assert list(streaming["year_distribution"].items()) == list(full["year_distribution"].items())
+    assert streaming == full
@@ -0,0 +1,55 @@
+"""
+Batch çalıştırıcı testleri: her PDF kendi sürecinde işlenir; bir dosyanın
+hatası, çökmesi veya zaman aşımı diğer dosyaların sonuçlarını etkilemez.
+"""
+
+import os
+import shutil
+import time
+
+from batch import run_batch, summarize
+from conftest import read_bytes
+from data_extract import PDFProcessor
+
+
+def _job(kind):
+    if kind == "error":
+        raise ValueError("bozuk dosya")
+    if kind == "crash":
+        os._exit(3)
+    if kind == "hang":
+        time.sleep(60)
+    return {"pages": 2, "articles": 1}
+
+
+def test_run_batch_isolates_failures():
+    kinds = ["ok", "error", "crash", "hang", "ok"]
+    results = run_batch(_job, [(kind, (kind,)) for kind in kinds], max_workers=2,
+                        timeout=2.0, poll_interval=0.05)
+
+    assert [r.pdf_path for r in results] == kinds
+    assert [r.ok for r in results] == [True, False, False, False, True]
+    assert "ValueError" in results[1].error
+    assert "exit code 3" in results[2].error
+    assert "Zaman aşımı" in results[3].error
+    summary = summarize(results, 1.0)
+    assert (summary["succeeded"], summary["failed"], summary["pages"]) == (2, 3, 4)
+
+
+def test_process_path_batch_skips_broken_pdf(sample_pdf, tmp_path, full_run):
+    expected = full_run(sample_pdf)
+    in_dir = tmp_path / "pdfs"
+    in_dir.mkdir()
+    shutil.copy(sample_pdf, in_dir / "a.pdf")
+    (in_dir / "b.pdf").write_bytes(b"%PDF-1.4 bozuk")
+    shutil.copy(sample_pdf, in_dir / "c.pdf")
+    out_dir = tmp_path / "out"
+
+    results = PDFProcessor().process_path(str(in_dir), "2024", str(out_dir), jobs=2)
+
+    assert [os.path.basename(r.pdf_path) for r in results] == ["a.pdf", "b.pdf", "c.pdf"]
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[0].pages == results[2].pages == 40
+    assert not os.path.exists(out_dir / "b.csv")
+    assert read_bytes(str(out_dir / "a.csv")) == expected
+    assert read_bytes(str(out_dir / "c.csv")) == expected
@@ -0,0 +1,84 @@
+"""
+Sonuç önbelleği testleri: aynı içerik ve parmak iziyle işlenen PDF
+önbellekten döner, boyut sınırı aşılınca en eski erişilen kayıtlar silinir.
+"""
+
+import os
+
+import pytest
+
+import data_extract
+from cache import ResultCache
+from conftest import read_bytes
+from data_extract import PDFProcessor, default_cache
+
+
+def _payload(size):
+    return {"data": "x" * size}
+
+
+def test_get_returns_stored_payload(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"), fingerprint="v1")
+    key = cache.key("abc", "2024")
+    assert cache.get(key) is None
+    cache.put(key, {"articles": [1, 2]})
+    assert cache.get(key) == {"articles": [1, 2]}
+
+
+def test_key_depends_on_fingerprint_and_parts(tmp_path):
+    first = ResultCache(str(tmp_path), fingerprint="v1")
+    second = ResultCache(str(tmp_path), fingerprint="v2")
+    assert first.key("abc", "2024") != second.key("abc", "2024")
+    assert first.key("abc", "2024") != first.key("abc", "2025")
+    assert first.key("abc", "2024") == ResultCache(str(tmp_path), fingerprint="v1").key("abc", "2024")
+
+
+def test_constructor_does_not_touch_disk(tmp_path):
+    ResultCache(str(tmp_path / "cache"))
+    assert not os.path.exists(tmp_path / "cache")
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=2500)
+    cache.put("a", _payload(1000))
+    cache.put("b", _payload(1000))
+    # Erişim sırası mtime ile tutulur: önce a, sonra b yazılmış gibi ayarla
+    os.utime(cache._path("a"), (100, 100))
+    os.utime(cache._path("b"), (200, 200))
+
+    # a'ya erişmek onu en yeni kayıt yapar; sınır aşılınca b silinir
+    assert cache.get("a") is not None
+    cache.put("c", _payload(1000))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.size_bytes() <= cache.max_bytes
+
+
+def test_clear_removes_all_entries(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    for key in "abc":
+        cache.put(key, _payload(10))
+    assert cache.clear() == 3
+    assert cache.size_bytes() == 0
+
+
+def test_cache_hit_skips_pdf_and_writes_same_csv(sample_pdf, tmp_path, full_run, monkeypatch):
+    expected = full_run(sample_pdf)
+    cache = default_cache(str(tmp_path / "cache"))
+    first = PDFProcessor(cache=cache).process_pdf(sample_pdf, "2024", str(tmp_path / "first.csv"))
+
+    def no_open(*args, **kwargs):
+        raise AssertionError("önbellek isabetinde PDF açılmamalı")
+
+    monkeypatch.setattr(data_extract, "open_pdf", no_open)
+    output_csv = str(tmp_path / "cached.csv")
+    cached = PDFProcessor(cache=cache).process_pdf(sample_pdf, "2024", output_csv)
+
+    assert [a.to_dict() for a in cached] == [a.to_dict() for a in first]
+    assert read_bytes(output_csv) == expected
+
+    # Farklı yıl farklı anahtardır
+    with pytest.raises(AssertionError):
+        PDFProcessor(cache=cache).process_pdf(sample_pdf, "2025", str(tmp_path / "other.csv"))
@@ -0,0 +1,50 @@
+"""
+Artımlı çıkarım testleri: sayfa değiştikten sonra artımlı çalıştırma, yalnızca
+değişen makaleleri yeniden çıkararak tam çalıştırmayla aynı CSV'yi üretir.
+"""
+
+import os
+import shutil
+
+import fitz
+
+from conftest import read_bytes
+from data_extract import PageAnalyzer, PDFProcessor
+
+
+def _edit_article_start(pdf_path, tmp_path):
+    """İlk makale dışındaki bir makalenin ilk sayfasına metin ekler"""
+    doc = fitz.open(pdf_path)
+    edited = str(tmp_path / "edited.pdf")
+    target = next(i for i in range(1, len(doc))
+                  if PageAnalyzer.is_article_start_page(doc[i].get_text()))
+    doc[target].insert_text((72, 780), "Ek sayfa notu", fontsize=9)
+    doc.save(edited)
+    doc.close()
+    os.replace(edited, pdf_path)
+
+
+def test_unchanged_pdf_reuses_every_article(sample_pdf, tmp_path, full_run):
+    pdf_path = str(tmp_path / "book.pdf")
+    shutil.copy(sample_pdf, pdf_path)
+    incremental_csv = str(tmp_path / "incremental.csv")
+    first = PDFProcessor().process_pdf(pdf_path, "2024", incremental_csv, incremental=True)
+
+    processor = PDFProcessor()
+    processor.process_pdf(pdf_path, "2024", incremental_csv, incremental=True)
+    assert processor.stats.counters.get("articles_reused") == len(first)
+    assert read_bytes(incremental_csv) == full_run(pdf_path)
+
+
+def test_incremental_after_page_edit_matches_full_run(sample_pdf, tmp_path, full_run):
+    pdf_path = str(tmp_path / "book.pdf")
+    shutil.copy(sample_pdf, pdf_path)
+    incremental_csv = str(tmp_path / "incremental.csv")
+    first = PDFProcessor().process_pdf(pdf_path, "2024", incremental_csv, incremental=True)
+
+    _edit_article_start(pdf_path, tmp_path)
+    processor = PDFProcessor()
+    processor.process_pdf(pdf_path, "2024", incremental_csv, incremental=True)
+
+    assert 0 < processor.stats.counters.get("articles_reused", 0) < len(first)
+    assert read_bytes(incremental_csv) == full_run(pdf_path)
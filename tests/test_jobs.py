@@ -0,0 +1,62 @@
+"""
+JobQueue testleri: bir iş süreci öldüğünde bozulan havuz yeniden kurulur,
+iş sayacı ve kayıtlı işler tutarlı kalır.
+"""
+
+import os
+import time
+
+from jobs import DONE, FAILED, JobQueue
+
+
+def _crash():
+    os._exit(1)
+
+
+def _square(value):
+    return {"value": value * value}
+
+
+def _wait(job, timeout=30.0):
+    deadline = time.time() + timeout
+    while job.finished is None and time.time() < deadline:
+        time.sleep(0.02)
+    return job.status
+
+
+def test_pool_recovers_after_worker_dies():
+    queue = JobQueue(max_workers=1, max_queued=1)
+    try:
+        crashed = queue.submit(_crash, job_id="crash")
+        assert _wait(crashed) == FAILED
+        assert "BrokenProcessPool" in crashed.error
+
+        # Bozuk havuza gönderim başarısız olmamalı; havuz yeniden kurulur
+        for value in range(4):
+            job = queue.submit(_square, value, job_id=f"job{value}")
+            assert _wait(job) == DONE
+            assert job.result == {"value": value * value}
+
+        assert queue.stats()["active"] == 0
+        assert queue.active_ids() == []
+    finally:
+        queue.shutdown()
+
+
+def test_failed_pool_submit_does_not_register_job(monkeypatch):
+    queue = JobQueue(max_workers=1, max_queued=1)
+
+    def broken_submit(fn, args):
+        raise RuntimeError("havuz başlatılamadı")
+
+    monkeypatch.setattr(queue, "_submit_to_pool", broken_submit)
+    try:
+        for _ in range(3):
+            try:
+                queue.submit(_square, 2, job_id="same")
+            except RuntimeError:
+                pass
+        assert queue.get("same") is None
+        assert queue.stats()["active"] == 0
+    finally:
+        queue.shutdown()
@@ -0,0 +1,65 @@
+"""
+Birleştirme testleri: yıl bazlı Excel/CSV/Parquet girdileri bir kez
+ayrıştırılıp önbellekten birleştirilir, değişmeyen girdilerde birleştirme atlanır.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from merging import find_inputs, merge_outputs
+from outputs import ARTICLE_COLUMNS, read_articles, write_articles
+
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+def _rows(year, count):
+    return [{"PageNumber": 3 * i + 1, "Year": year, "Title_TR": f"Başlık {year} {i}",
+             "Title_EN": f"Title {i}", "Abstract_TR": "özet" if i % 2 else "",
+             "Abstract_EN": f"abstract {i}", "Keywords_TR": "a, b", "Keywords_EN": ""}
+            for i in range(count)]
+
+
+def _write_excel(rows, path):
+    pd.DataFrame(rows, columns=ARTICLE_COLUMNS).replace("", None).to_excel(path, index=False)
+
+
+def _values(df):
+    return df.astype(object).where(df.notnull(), None).values.tolist()
+
+
+def test_find_inputs_accepts_excel_and_prefers_columnar(tmp_path):
+    _write_excel(_rows("2020-2021", 3), tmp_path / "2020-2021.xlsx")
+    _write_excel(_rows("2021-2022", 3), tmp_path / "2021-2022.xlsx")
+    write_articles(_rows("2021-2022", 3), str(tmp_path / "2021-2022.parquet"), "parquet")
+    (tmp_path / "2022-2023.txt").write_text("x")
+
+    found = [os.path.basename(p) for p in find_inputs(str(tmp_path / "20*-20*.*"))]
+    assert found == ["2020-2021.xlsx", "2021-2022.parquet"]
+
+
+def test_merge_excel_inputs(tmp_path):
+    rows = {year: _rows(year, n) for year, n in (("2020-2021", 4), ("2021-2022", 6))}
+    for year, year_rows in rows.items():
+        _write_excel(year_rows, tmp_path / f"{year}.xlsx")
+    inputs = find_inputs(str(tmp_path / "20*-20*.*"))
+    outputs = [str(tmp_path / name) for name in
+               ("all_articles.parquet", "all_articles.xlsx", "all_articles.csv")]
+    cache_dir = str(tmp_path / "cache")
+
+    summary = merge_outputs(inputs, outputs, cache_dir=cache_dir)
+    assert (summary["parsed"], summary["rows"]) == (2, 10)
+    assert summary["years"] == {"2020-2021": 4, "2021-2022": 6}
+
+    expected = pd.concat([pd.read_excel(path) for path in inputs], ignore_index=True)
+    for path in outputs:
+        merged = read_articles(path)
+        assert merged.columns.tolist() == ARTICLE_COLUMNS
+        assert _values(merged.astype({"Year": str})) == _values(expected)
+
+    # Girdiler değişmediyse birleştirme atlanır; yeni çıktı istenirse önbellekten okunur
+    assert merge_outputs(inputs, outputs, cache_dir=cache_dir)["skipped"]
+    summary = merge_outputs(inputs, outputs[1:], cache_dir=cache_dir)
+    assert (summary["parsed"], summary["reused"], summary["skipped"]) == (0, 2, False)
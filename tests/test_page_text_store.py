@@ -0,0 +1,42 @@
+"""
+PageTextStore testleri: makale çıkarımı sırasında her sayfanın metni
+PyMuPDF'ten en fazla bir kez çıkarılır, tekrarlanan istekler depodan karşılanır.
+"""
+
+import fitz
+
+from data_extract import PageTextStore, PDFProcessor
+
+
+def test_each_page_extracted_once(sample_pdf, tmp_path, monkeypatch):
+    # PyMuPDF'e giden gerçek metin çıkarımlarını sayfa numarasıyla kaydet
+    extracted = []
+    get_text = fitz.Page.get_text
+
+    def counting_get_text(page, option="text", **kwargs):
+        if option == "text":
+            extracted.append(page.number)
+        return get_text(page, option, **kwargs)
+
+    monkeypatch.setattr(fitz.Page, "get_text", counting_get_text)
+    processor = PDFProcessor()
+    articles = processor.process_pdf(sample_pdf, "2024", str(tmp_path / "out.csv"))
+    stats = processor.last_page_stats
+
+    assert articles
+    assert len(extracted) == stats["unique_pages"] == len(set(extracted))
+    assert stats["unique_pages"] <= processor.last_page_count
+    # Tekrarlanan istekler depodan karşılanır
+    assert stats["saved_extractions"] == stats["text_calls"] - stats["unique_pages"] > 0
+
+
+def test_store_caches_repeated_requests(sample_pdf):
+    doc = fitz.open(sample_pdf)
+    try:
+        pages = PageTextStore(doc)
+        first = [pages.text(i) for i in range(3)]
+        second = [pages.text(i) for i in range(3)]
+        assert first == second == [doc[i].get_text("text") for i in range(3)]
+        assert pages.stats() == {"text_calls": 6, "unique_pages": 3, "saved_extractions": 3}
+    finally:
+        doc.close()
@@ -0,0 +1,31 @@
+"""
+Paralel çıkarım testleri: sayfa parçalarına bölünerek süreç havuzunda
+işlenen PDF, seri akış moduyla bayt bayt aynı CSV'yi üretir.
+"""
+
+import pytest
+
+from conftest import read_bytes
+from data_extract import PDFProcessor
+
+
+@pytest.mark.parametrize("workers,min_shard_size", [(2, 16), (3, 3), (4, 1)])
+def test_parallel_matches_serial(sample_pdf, tmp_path, full_run, monkeypatch,
+                                 workers, min_shard_size):
+    shards = PDFProcessor._page_shards
+    # Küçük parçalar makaleleri parça sınırlarında böler
+    monkeypatch.setattr(PDFProcessor, "_page_shards", staticmethod(
+        lambda page_count, workers: shards(page_count, workers, min_shard_size=min_shard_size)))
+    output_csv = str(tmp_path / "parallel.csv")
+    PDFProcessor().process_pdf(sample_pdf, "2024", output_csv, workers=workers)
+
+    assert read_bytes(output_csv) == full_run(sample_pdf)
+
+
+def test_parallel_from_memory_matches_serial(sample_pdf, tmp_path, full_run):
+    with open(sample_pdf, "rb") as f:
+        content = f.read()
+    output_csv = str(tmp_path / "parallel.csv")
+    PDFProcessor().process_pdf("upload.pdf", "2024", output_csv, workers=2, content=content)
+
+    assert read_bytes(output_csv) == full_run(sample_pdf)
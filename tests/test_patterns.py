@@ -0,0 +1,78 @@
+"""
+Kalıp kayıt defteri testleri: ofsetlerle sınırlandırılmış aramalar, asıl
+regex'in `re.search` sonucuyla aynı eşleşme ve grup sınırlarını verir.
+"""
+
+import random
+
+import pytest
+
+import patterns
+
+
+_FRAGMENTS = [
+    "Özetçe— ", "ÖZETÇE - ", "Abstract— ", "abstract – ", "Anahtar Kelimeler— ",
+    "Anahtar  Kelimeler: ", "Keywords— ", "Keywords; ", "I. ", "I ", "GİRİŞ",
+    "INTRODUCTION", "PROBLEM", "\n", "\n\n", "\n \n Deneme", "  ", "—", "metin ",
+    "sistem, ", "model ", "Veri", "\nI.", "x",
+]
+
+
+def _fuzz_texts(count, seed):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(_FRAGMENTS) for _ in range(rng.randint(0, 25)))
+            for _ in range(count)]
+
+
+def _assert_same(result, expected):
+    assert (result is None) == (expected is None)
+    if expected is not None:
+        assert result.span() == expected.span()
+        assert result.span(1) == expected.span(1)
+        assert result.group(1) == expected.group(1)
+
+
+@pytest.mark.parametrize("name", sorted(patterns.REGISTRY))
+def test_registry_matches_re_search(name):
+    entry = patterns.REGISTRY[name]
+    for text in _fuzz_texts(2000, seed=len(name)):
+        _assert_same(patterns.search(name, text), entry.pattern.search(text))
+
+
+@pytest.mark.parametrize("name", sorted(patterns.REGISTRY))
+def test_registry_fallback_without_terminator(name):
+    entry = patterns.REGISTRY[name]
+    # Önek var ama bitiş işaretçisi yok: asıl kalıba düşülen yol
+    texts = [text for text in _fuzz_texts(4000, seed=50 + len(name))
+             if entry.prefix.search(text) and (entry.terminator is None
+                                               or entry.terminator.search(text) is None)]
+    assert texts
+    for text in texts:
+        _assert_same(patterns.search(name, text), entry.pattern.search(text))
+
+
+@pytest.mark.parametrize("name", sorted(patterns.REGISTRY))
+def test_registry_matches_on_indexed_window(name):
+    entry = patterns.REGISTRY[name]
+    texts = _fuzz_texts(600, seed=100 + len(name))
+    for start in range(0, len(texts), 4):
+        index = patterns.MarkerIndex(texts[start:start + 4])
+        for stop_markers in (["Keywords"], ["Abstract", "Keywords"], ["GİRİŞ"]):
+            window = index.window(stop_markers, hard_limit=3)
+            _assert_same(patterns.search(name, window), entry.pattern.search(str(window)))
+
+
+def _assert_same_marker(result, expected):
+    assert (result is None) == (expected is None)
+    if expected is not None:
+        assert result.span() == expected.span()
+
+
+def test_marker_index_find_matches_search():
+    texts = _fuzz_texts(40, seed=9)
+    index = patterns.MarkerIndex(texts)
+    for marker in patterns.SECTION_MARKERS:
+        for pos in range(0, len(index.text), 7):
+            for endpos in (pos, pos + 30, len(index.text)):
+                _assert_same_marker(index.find(marker, pos, endpos),
+                                    marker.search(index.text, pos, endpos))
@@ -0,0 +1,51 @@
+"""
+Ön işleme testleri: `clean_text` notebook'taki regex tabanlı temizlikle aynı
+sonucu verir, paralel temizlik seri temizlikle aynı veri setini üretir.
+"""
+
+import random
+import re
+
+import pandas as pd
+
+import preprocessing
+from preprocessing import CLEAN_COLUMNS, REMOVED_CHARS, clean_text, preprocess_frame
+
+
+def _notebook_clean_text(text):
+    """notebooks/Data_Preprocessing.ipynb'deki regex tabanlı temizlik"""
+    text = text.lower()
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"[#%&*_=+<>]", "", text)
+    return text.strip()
+
+
+def _fuzz_strings(count, seed):
+    alphabet = ("aBcIıİiŞşĞğÜüÖöÇçΣσ " + REMOVED_CHARS
+                + "\t\n\r\x0b\x0c\x1c\x1d\x1e\x1f\x85\xa0 　")
+    rng = random.Random(seed)
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+            for _ in range(count)]
+
+
+def test_clean_text_matches_notebook():
+    for text in _fuzz_strings(5000, seed=7):
+        assert clean_text(text) == _notebook_clean_text(text)
+
+
+def test_clean_text_non_string():
+    assert clean_text(float("nan")) == ""
+    assert clean_text(None) == ""
+
+
+def test_parallel_preprocessing_matches_serial(monkeypatch):
+    texts = _fuzz_strings(300, seed=11)
+    df = pd.DataFrame({col: texts[i::3] for i, col in enumerate(CLEAN_COLUMNS)})
+    df.loc[5, "Abstract_TR"] = None
+    serial = preprocess_frame(df)
+
+    monkeypatch.setattr(preprocessing, "PARALLEL_THRESHOLD_ROWS", 0)
+    parallel = preprocess_frame(df, workers=2, chunksize=7)
+
+    pd.testing.assert_frame_equal(parallel, serial)
+    assert serial.loc[5, "abstract_tr_clean"] == ""
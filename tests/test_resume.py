@@ -0,0 +1,38 @@
+"""
+Akış modunda CSV yazımı testleri: yarım kalmış CSV'den devam eden
+çalıştırma, tam çalıştırmayla bayt bayt aynı dosyayı üretir.
+"""
+
+import pytest
+
+from conftest import read_bytes
+from data_extract import PDFProcessor
+
+
+@pytest.mark.parametrize("fraction", [0.2, 0.6, 0.95])
+def test_resume_matches_full_run(sample_pdf, tmp_path, full_run, fraction):
+    expected = full_run(sample_pdf)
+
+    partial = str(tmp_path / "partial.csv")
+    # Yarım kalmış yazımı taklit et: tam satırlar + kesilmiş bir satır
+    with open(partial, "wb") as f:
+        f.write(expected[:int(len(expected) * fraction)])
+    PDFProcessor().process_pdf(sample_pdf, "2024", partial, resume=True)
+
+    assert read_bytes(partial) == expected
+
+
+def test_resume_of_complete_csv_is_unchanged(sample_pdf, tmp_path, full_run):
+    expected = full_run(sample_pdf)
+    complete = str(tmp_path / "complete.csv")
+    with open(complete, "wb") as f:
+        f.write(expected)
+    PDFProcessor().process_pdf(sample_pdf, "2024", complete, resume=True)
+
+    assert read_bytes(complete) == expected
+
+
+def test_resume_requires_csv_output(sample_pdf, tmp_path):
+    processor = PDFProcessor(output_format="parquet")
+    with pytest.raises(ValueError):
+        processor.process_pdf(sample_pdf, "2024", str(tmp_path / "out.parquet"), resume=True)